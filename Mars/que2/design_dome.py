@@ -1,4 +1,10 @@
+import json
 import math
+import os
+import sqlite3
+import sys
+import time
+from collections import OrderedDict
 
 # 전역 변수로 저장을 요구함
 g_material = ''
@@ -7,39 +13,218 @@ g_thickness = 0.0
 g_area = 0.0
 g_weight = 0.0
 
-# 재질별 밀도 (g/cm³)
-MATERIAL_DENSITY = {
-    '유리': 2.4,
-    'glass': 2.4,
-    '알루미늄': 2.7,
-    'aluminum': 2.7,
-    '탄소강': 7.85,
-    'carbon_steel': 7.85
-}
+# 재질 데이터 파일 (새 재질은 코드 수정 없이 이 파일에 추가)
+MATERIAL_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'materials.json')
 
-def sphere_area(diameter, material, thickness=1.0):
-    """반구체 돔의 표면적과 무게 계산"""
-    global g_material, g_diameter, g_thickness, g_area, g_weight
-    
-    # 입력값 검증
-    if diameter <= 0:
-        raise ValueError('지름은 0보다 큰 값이어야 합니다.')
-    
-    if thickness <= 0:
-        raise ValueError('두께는 0보다 큰 값이어야 합니다.')
-    
-    # 재질 검증 (한글과 영어 모두 지원)
-    material_lower = material.lower()
-    material_key = None
-    
-    for key in MATERIAL_DENSITY.keys():
-        if key.lower() == material_lower or key == material:
-            material_key = key
-            break
-    
-    if material_key is None:
-        raise KeyError(f'지원하지 않는 재질입니다: {material}. 지원하는 재질: 유리(glass), 알루미늄(aluminum), 탄소강(carbon_steel)')
-    
+# 재질 파일이 없을 때 사용하는 기본 재질 (밀도 단위: g/cm³)
+DEFAULT_MATERIALS = [
+    {'code': '1', 'name': '유리', 'aliases': ['glass'], 'density': 2.4},
+    {'code': '2', 'name': '알루미늄', 'aliases': ['aluminum'], 'density': 2.7},
+    {'code': '3', 'name': '탄소강', 'aliases': ['carbon_steel'], 'density': 7.85}
+]
+
+
+def normalize_material_key(text):
+    """재질 별칭 정규화 (앞뒤 공백 제거, 소문자, 공백/하이픈은 밑줄로)"""
+    return str(text).strip().lower().replace(' ', '_').replace('-', '_')
+
+
+def build_material_registry(materials):
+    """재질 목록으로 레지스트리 생성 - 별칭을 한 번만 정규화해서 재질 id(인덱스)로 매핑"""
+    names = []
+    codes = []
+    densities = []  # 재질 id로 바로 접근하는 밀도 배열
+    aliases = {}
+
+    for material_id, item in enumerate(materials):
+        name = item['name']
+        code = str(item.get('code', material_id + 1))
+        density = float(item['density'])
+        if density <= 0:
+            raise ValueError(f'밀도는 0보다 큰 값이어야 합니다: {name}')
+
+        names.append(name)
+        codes.append(code)
+        densities.append(density)
+
+        for alias in [name, code] + list(item.get('aliases', [])):
+            key = normalize_material_key(alias)
+            if key in aliases and aliases[key] != material_id:
+                raise ValueError(f'재질 별칭이 중복되었습니다: {alias}')
+            aliases[key] = material_id
+
+    return {
+        'names': names,
+        'codes': codes,
+        'densities': densities,
+        'aliases': aliases,
+        'english': [(item.get('aliases') or [''])[0] for item in materials]  # 메뉴 표시용 영문명
+    }
+
+
+def load_material_registry(filename=MATERIAL_FILE):
+    """재질 데이터 파일(JSON)을 읽어 레지스트리 생성, 실패하면 기본 재질 사용"""
+    try:
+        with open(filename, 'r', encoding='utf-8') as f:
+            materials = json.load(f)
+        return build_material_registry(materials)
+    except FileNotFoundError:
+        return build_material_registry(DEFAULT_MATERIALS)
+    except Exception as e:
+        print(f'재질 파일 읽기 오류: {e}')
+        return build_material_registry(DEFAULT_MATERIALS)
+
+
+# 모듈 로드 시 한 번만 생성
+MATERIAL_REGISTRY = load_material_registry()
+
+# 재질별 밀도 (g/cm³) - 기존 코드 호환용, 레지스트리에서 생성
+MATERIAL_DENSITY = dict(zip(MATERIAL_REGISTRY['names'], MATERIAL_REGISTRY['densities']))
+
+
+def resolve_material(material, registry=None):
+    """재질 이름/영문명/메뉴 번호를 재질 id로 변환 (O(1) 조회)"""
+    if registry is None:
+        registry = MATERIAL_REGISTRY
+
+    material_id = registry['aliases'].get(normalize_material_key(material))
+    if material_id is None:
+        supported = ', '.join(
+            f'{name}({english})' if english else name
+            for name, english in zip(registry['names'], registry['english'])
+        )
+        raise KeyError(f'지원하지 않는 재질입니다: {material}. 지원하는 재질: {supported}')
+    return material_id
+
+
+# 계산식이 바뀌면 올려서 이전 캐시 결과를 무효화
+FORMULA_VERSION = 1
+
+# 디스크 캐시 최대 항목 수 (넘으면 가장 오래 안 쓴 항목부터 삭제)
+DOME_DISK_CACHE_MAXSIZE = int(os.environ.get('DOME_DISK_CACHE_MAXSIZE', 100000))
+
+
+class DomeResultCache:
+    """돔 계산 결과 캐시 - 프로세스 내 LRU + 선택적 디스크(sqlite) 캐시"""
+
+    def __init__(self, maxsize=1024, filename=None, disk_maxsize=DOME_DISK_CACHE_MAXSIZE):
+        self.maxsize = maxsize
+        self.disk_maxsize = disk_maxsize
+        self.disk_size = 0
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.disk_hits = 0
+        self.connection = None
+        if filename:
+            self.open_disk_cache(filename)
+
+    def open_disk_cache(self, filename):
+        """디스크 캐시 열기 (다른 계산식 버전의 결과는 삭제, 마지막 사용 시각 컬럼이 없는 예전 파일은 새로 만듦)"""
+        self.close()
+        self.connection = sqlite3.connect(filename)
+        columns = [row[1] for row in self.connection.execute('PRAGMA table_info(dome_cache)')]
+        if columns and 'last_used' not in columns:
+            self.connection.execute('DROP TABLE dome_cache')
+        self.connection.execute(
+            'CREATE TABLE IF NOT EXISTS dome_cache ('
+            'key TEXT PRIMARY KEY, formula_version INTEGER, area REAL, weight REAL, last_used REAL)'
+        )
+        self.connection.execute('CREATE INDEX IF NOT EXISTS dome_cache_last_used ON dome_cache (last_used)')
+        self.connection.execute('DELETE FROM dome_cache WHERE formula_version != ?', (FORMULA_VERSION,))
+        self.disk_size = self.connection.execute('SELECT COUNT(*) FROM dome_cache').fetchone()[0]
+        self._evict_disk()
+        self.connection.commit()
+
+    @staticmethod
+    def make_key(diameter, material_name, density, thickness):
+        """정규화된 입력값으로 캐시 키 생성 - 밀도가 키에 포함되어 밀도 변경 시 자동 무효화"""
+        return f'{FORMULA_VERSION}|{material_name}|{float(density)!r}|{float(diameter)!r}|{float(thickness)!r}'
+
+    def get(self, key):
+        """캐시에서 (면적, 무게) 조회, 없으면 None"""
+        result = self.entries.get(key)
+        if result is not None:
+            self.entries.move_to_end(key)
+            self.hits += 1
+            return result
+
+        if self.connection is not None:
+            row = self.connection.execute(
+                'SELECT area, weight FROM dome_cache WHERE key = ?', (key,)
+            ).fetchone()
+            if row is not None:
+                self.hits += 1
+                self.disk_hits += 1
+                self.connection.execute('UPDATE dome_cache SET last_used = ? WHERE key = ?', (time.time(), key))
+                self.connection.commit()
+                self._remember(key, row)
+                return row
+
+        self.misses += 1
+        return None
+
+    def put(self, key, result):
+        """계산 결과를 캐시에 저장"""
+        self._remember(key, result)
+        if self.connection is not None:
+            cursor = self.connection.execute(
+                'INSERT OR IGNORE INTO dome_cache VALUES (?, ?, ?, ?, ?)',
+                (key, FORMULA_VERSION, result[0], result[1], time.time())
+            )
+            self.disk_size += cursor.rowcount
+            self._evict_disk()
+            self.connection.commit()
+
+    def _evict_disk(self):
+        """디스크 캐시가 disk_maxsize를 넘으면 가장 오래 안 쓴 항목부터 삭제"""
+        excess = self.disk_size - self.disk_maxsize
+        if excess > 0:
+            self.connection.execute(
+                'DELETE FROM dome_cache WHERE key IN '
+                '(SELECT key FROM dome_cache ORDER BY last_used LIMIT ?)', (excess,)
+            )
+            self.disk_size -= excess
+
+    def _remember(self, key, result):
+        self.entries[key] = tuple(result)
+        self.entries.move_to_end(key)
+        if len(self.entries) > self.maxsize:
+            self.entries.popitem(last=False)  # 가장 오래 안 쓴 항목 제거
+
+    def clear(self):
+        """프로세스 내 캐시 비우기 (디스크 캐시는 유지)"""
+        self.entries.clear()
+
+    def info(self):
+        """캐시 적중률 정보"""
+        total = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'disk_hits': self.disk_hits,
+            'hit_rate': self.hits / total if total else 0.0,
+            'size': len(self.entries),
+            'maxsize': self.maxsize,
+            'disk_size': self.disk_size,
+            'disk_maxsize': self.disk_maxsize
+        }
+
+    def close(self):
+        if self.connection is not None:
+            self.connection.close()
+            self.connection = None
+
+
+# 디스크 캐시 파일 - 환경 변수 DOME_CACHE_FILE 또는 실행 인자로 지정 (없으면 프로세스 내 LRU만 사용)
+DOME_CACHE_FILE = os.environ.get('DOME_CACHE_FILE') or None
+
+# sphere_area 호출이 함께 쓰는 결과 캐시
+DOME_CACHE = DomeResultCache(filename=DOME_CACHE_FILE)
+
+
+def calculate_dome(diameter, density, thickness):
+    """반구체 돔의 표면적(m²)과 화성 무게(kg) 계산 (캐시 없이 순수 계산)"""
     # 반구체 표면적 계산 (반구 = 구의 절반 + 바닥면)
     # 구의 표면적: 4πr², 반구 표면적: 2πr² + πr² = 3πr²
     radius = diameter / 2.0
@@ -52,13 +237,38 @@ def sphere_area(diameter, material, thickness=1.0):
     
     # 부피를 cm³로 변환하여 밀도와 곱하기
     volume_cm3 = volume_m3 * 1000000  # m³를 cm³로 변환
-    density = MATERIAL_DENSITY[material_key]
     weight_g = volume_cm3 * density
     weight_kg = weight_g / 1000.0  # g를 kg로 변환
     
     # 화성 중력 적용
     mars_weight_kg = weight_kg * 0.38
     
+    return area, mars_weight_kg
+
+
+def sphere_area(diameter, material, thickness=1.0):
+    """반구체 돔의 표면적과 무게 계산"""
+    global g_material, g_diameter, g_thickness, g_area, g_weight
+    
+    # 입력값 검증
+    if diameter <= 0:
+        raise ValueError('지름은 0보다 큰 값이어야 합니다.')
+    
+    if thickness <= 0:
+        raise ValueError('두께는 0보다 큰 값이어야 합니다.')
+    
+    # 재질 검증 (한글, 영어, 메뉴 번호 모두 지원)
+    material_id = resolve_material(material)
+    density = MATERIAL_REGISTRY['densities'][material_id]
+    
+    # 같은 설계값이면 캐시된 결과 사용
+    cache_key = DOME_CACHE.make_key(diameter, MATERIAL_REGISTRY['names'][material_id], density, thickness)
+    result = DOME_CACHE.get(cache_key)
+    if result is None:
+        result = calculate_dome(diameter, density, thickness)
+        DOME_CACHE.put(cache_key, result)
+    area, mars_weight_kg = result
+    
     # 전역 변수에 저장
     g_material = material
     g_diameter = diameter
@@ -84,29 +294,17 @@ def get_user_input():
             
             # 재질 입력
             print('재질을 선택하세요:')
-            print('1. 유리 (glass)')
-            print('2. 알루미늄 (aluminum)')
-            print('3. 탄소강 (carbon_steel)')
+            for code, name, english in zip(MATERIAL_REGISTRY['codes'], MATERIAL_REGISTRY['names'], MATERIAL_REGISTRY['english']):
+                print(f'{code}. {name} ({english})' if english else f'{code}. {name}')
             material_input = input('재질을 입력하세요: ').strip()
             
             if material_input.lower() in ['quit', 'exit', 'q']:
                 return None, None, None
             
-            # 재질 매핑
-            material_map = {
-                '1': '유리',
-                '유리': '유리',
-                'glass': '유리',
-                '2': '알루미늄',
-                '알루미늄': '알루미늄',
-                'aluminum': '알루미늄',
-                '3': '탄소강',
-                '탄소강': '탄소강',
-                'carbon_steel': '탄소강'
-            } # 여러 방면으로 처리
-            
-            material = material_map.get(material_input.lower())
-            if material is None:
+            # 재질 매핑 (레지스트리에서 한 번에 처리)
+            try:
+                material = MATERIAL_REGISTRY['names'][resolve_material(material_input)]
+            except KeyError:
                 print('올바른 재질을 선택해주세요.')
                 continue
             
@@ -137,6 +335,10 @@ def display_result():
 
 
 def main():
+    # 실행 인자로 디스크 캐시 파일 지정 (python design_dome.py dome_cache.db)
+    if len(sys.argv) > 1:
+        DOME_CACHE.open_disk_cache(sys.argv[1])
+    
     print('=== Mars 돔 구조물 설계 프로그램 ===')
     print('종료하려면 "quit", "exit", 또는 "q"를 입력하세요.\n')
     
@@ -146,6 +348,9 @@ def main():
             diameter, material, thickness = get_user_input()
             
             if diameter is None:  # 종료 조건
+                cache_info = DOME_CACHE.info()
+                print(f'계산 캐시: 적중 {cache_info["hits"]}회, 미적중 {cache_info["misses"]}회 '
+                      f'(적중률 {cache_info["hit_rate"]:.1%})')
                 print('프로그램을 종료합니다.')
                 break
             
@@ -0,0 +1,395 @@
+import csv
+import itertools
+import json
+import math
+import os
+import sys
+import time
+
+import numpy as np
+
+from design_dome import MATERIAL_REGISTRY, normalize_material_key
+
+# 한 번에 처리할 행 수 (메모리 사용량과 처리 속도의 균형)
+CHUNK_SIZE = 200000
+
+# 두께 값이 없을 때(컬럼 없음, 빈 칸, JSONL 키 없음/null) 쓰는 기본 두께 (cm) - sphere_area와 같음
+DEFAULT_THICKNESS = 1.0
+
+# 결과 파일 컬럼
+OUTPUT_FIELDS = ['row', 'diameter', 'material', 'thickness', 'area', 'weight_kg', 'error']
+
+
+def read_csv_chunks(filename, chunk_size=CHUNK_SIZE):
+    """CSV 설계 파일을 chunk_size 행씩 (행 번호, 지름, 재질, 두께) 컬럼으로 읽기
+
+    따옴표가 없고 모든 행의 필드 수가 헤더와 같은 청크는 문자열 split으로 한 번에 나누고(빠른 경로),
+    아니면 그 청크만 csv 모듈로 읽는다. 따옴표가 한 번이라도 나오면 따옴표 안 줄바꿈이 청크 경계에
+    걸릴 수 있으므로 파일 끝까지 csv 모듈로 읽는다.
+    """
+    with open(filename, 'r', newline='', encoding='utf-8-sig') as file:
+        csv_reader = csv.reader(file)
+
+        # 헤더로 컬럼 위치 찾기 (thickness는 선택)
+        header = [normalize_material_key(name) for name in next(csv_reader, [])]
+        if 'diameter' not in header or 'material' not in header:
+            raise ValueError(f'헤더에 diameter, material 컬럼이 필요합니다: {header}')
+        columns = [header.index('diameter'), header.index('material')]
+        if 'thickness' in header:
+            columns.append(header.index('thickness'))
+        width = max(columns) + 1
+
+        row_number = 1  # 헤더가 1행
+        while True:
+            lines = list(itertools.islice(file, chunk_size))
+            if not lines:
+                return
+
+            text = ''.join(lines)
+            if '"' in text:
+                break
+            chunk = _split_plain_rows(text, len(lines), len(header), columns, row_number + 1)
+            if chunk is None:
+                chunk = _rows_to_columns(list(csv.reader(lines)), columns, width, row_number + 1)
+            yield chunk
+            row_number += len(lines)
+
+        # 느린 경로: 따옴표가 나온 청크부터 파일 끝까지 csv 모듈로 행 단위 읽기
+        csv_reader = csv.reader(itertools.chain(lines, file))
+        while True:
+            rows = list(itertools.islice(csv_reader, chunk_size))
+            if not rows:
+                return
+
+            yield _rows_to_columns(rows, columns, width, row_number + 1)
+            row_number += len(rows)
+
+
+def _split_plain_rows(text, line_count, field_count, columns, first_row_number):
+    """따옴표 없는 CSV 청크를 컬럼으로 나누기 - 필드 수가 다른 행이 하나라도 있으면 None (csv 모듈로 읽음)"""
+    lines = text.splitlines()
+    # 행마다 쉼표 수를 확인 (전체 필드 수만 보면 많은 행과 적은 행이 상쇄되어 값이 밀림)
+    if len(lines) != line_count or \
+            list(map(str.count, lines, itertools.repeat(','))).count(field_count - 1) != line_count:
+        return None
+
+    # 줄을 쉼표로 이어 한 번에 나누면 행 순서대로 필드가 놓이므로 컬럼은 간격 slicing으로 꺼냄
+    fields = ','.join(lines).split(',')
+    row_numbers = list(range(first_row_number, first_row_number + line_count))
+    diameters = fields[columns[0]::field_count]
+    materials = fields[columns[1]::field_count]
+    if len(columns) > 2:
+        thicknesses = fields[columns[2]::field_count]
+    else:
+        thicknesses = [DEFAULT_THICKNESS] * line_count
+    return row_numbers, diameters, materials, thicknesses
+
+
+def read_jsonl_chunks(filename, chunk_size=CHUNK_SIZE):
+    """JSONL 설계 파일을 chunk_size 행씩 컬럼으로 읽기"""
+    with open(filename, 'r', encoding='utf-8') as file:
+        row_number = 0
+        while True:
+            rows = []
+            for line in file:
+                row_number += 1
+                if not line.strip():
+                    continue
+                try:
+                    item = json.loads(line)
+                    rows.append((row_number, item.get('diameter', ''), item.get('material', ''),
+                                 item.get('thickness')))
+                except (ValueError, AttributeError):
+                    rows.append((row_number, '', '', ''))  # 형식 오류는 검증 단계에서 보고
+                if len(rows) >= chunk_size:
+                    break
+            if not rows:
+                return
+
+            row_numbers, diameters, materials, thicknesses = zip(*rows)
+            yield list(row_numbers), list(diameters), list(materials), list(thicknesses)
+
+
+def _rows_to_columns(rows, columns, width, first_row_number):
+    """CSV 행 목록을 컬럼 목록으로 변환 (필드가 모자란 행은 빈 값으로 채움)"""
+    if min(map(len, rows)) < width:
+        rows = [row + [''] * (width - len(row)) if len(row) < width else row for row in rows]
+
+    # 행 목록을 한 번에 전치 (zip은 C 수준에서 동작)
+    fields = list(zip(*rows))
+    row_numbers = list(range(first_row_number, first_row_number + len(rows)))
+    diameters = fields[columns[0]]
+    materials = fields[columns[1]]
+    if len(columns) > 2:
+        thicknesses = fields[columns[2]]
+    else:
+        thicknesses = [DEFAULT_THICKNESS] * len(rows)
+    return row_numbers, diameters, materials, thicknesses
+
+
+def parse_float_column(values, default=None):
+    """숫자 컬럼을 float64 배열로 변환, 변환 실패한 위치는 NaN과 오류 마스크로 표시
+
+    default를 주면 빈 값(빈 문자열, None)은 오류 대신 default로 채운다.
+    inf/nan처럼 유한하지 않은 값도 오류로 표시한다.
+    """
+    try:
+        # 빠른 경로: 전체가 숫자면 한 번에 변환 (None도 NaN으로 바뀌므로 기본값이 있으면 느린 경로에서 구분)
+        result = np.asarray(values, dtype=np.float64)
+        invalid = ~np.isfinite(result)
+        if default is None or not invalid.any():
+            return result, invalid
+    except (ValueError, TypeError):
+        pass
+
+    # 느린 경로: 잘못된 값이 섞인 청크만 값 단위로 변환
+    result = np.empty(len(values), dtype=np.float64)
+    invalid = np.zeros(len(values), dtype=bool)
+    for i, value in enumerate(values):
+        if default is not None and (value is None or (isinstance(value, str) and not value.strip())):
+            result[i] = default
+            continue
+        try:
+            result[i] = float(value)
+        except (ValueError, TypeError):
+            result[i] = np.nan
+            invalid[i] = True
+    return result, invalid | ~np.isfinite(result)
+
+
+def resolve_material_column(materials, registry=None):
+    """재질 컬럼을 재질 id 배열로 변환 (고유값만 조회, 모르는 재질은 -1)"""
+    if registry is None:
+        registry = MATERIAL_REGISTRY
+
+    aliases = registry['aliases']
+    try:
+        # 고유값을 딕셔너리로 모아 조회한 뒤 map으로 한 번에 변환 (문자열 정렬 없음)
+        ids = {material: aliases.get(normalize_material_key(material), -1) for material in dict.fromkeys(materials)}
+        return np.fromiter(map(ids.__getitem__, materials), dtype=np.int64, count=len(materials))
+    except TypeError:
+        pass  # JSONL의 리스트/객체처럼 해시할 수 없는 값 - 문자열로 바꿔서 조회
+
+    unique_materials, inverse = np.unique(np.asarray(list(map(str, materials)), dtype=str), return_inverse=True)
+    unique_ids = np.array(
+        [aliases.get(normalize_material_key(material), -1) for material in unique_materials],
+        dtype=np.int64
+    )
+    return unique_ids[inverse.ravel()]
+
+
+def sphere_area_batch(diameters, material_ids, thicknesses, densities=None):
+    """sphere_area의 벡터 버전 - 반구체 돔 표면적과 화성 무게(kg) 배열 반환"""
+    if densities is None:
+        densities = np.asarray(MATERIAL_REGISTRY['densities'], dtype=np.float64)
+
+    # 반구체 표면적: 3πr²
+    radius = diameters / 2.0
+    area = 3 * math.pi * (radius ** 2)
+
+    # 표면적 × 두께(cm→m) → m³ → cm³, 밀도(g/cm³) 적용 후 kg 변환
+    volume_cm3 = area * (thicknesses / 100.0) * 1000000
+    weight_kg = volume_cm3 * densities[material_ids] / 1000.0
+
+    # 화성 중력 적용
+    return area, weight_kg * 0.38
+
+
+def calculate_chunk(row_numbers, diameters, materials, thicknesses, registry=None):
+    """한 청크의 입력을 검증하고 계산해서 결과 컬럼 딕셔너리 반환"""
+    if registry is None:
+        registry = MATERIAL_REGISTRY
+
+    diameter_values, bad_diameter = parse_float_column(diameters)
+    thickness_values, bad_thickness = parse_float_column(thicknesses, DEFAULT_THICKNESS)
+    material_ids = resolve_material_column(materials, registry)
+
+    # 행별 검증 오류 (오류가 있는 행만 메시지 생성)
+    bad_diameter |= ~(diameter_values > 0)
+    bad_thickness |= ~(thickness_values > 0)
+    bad_material = material_ids < 0
+    invalid = bad_diameter | bad_thickness | bad_material
+
+    errors = [''] * len(row_numbers)
+    for i in np.flatnonzero(invalid):
+        messages = []
+        if bad_diameter[i]:
+            messages.append('지름은 0보다 큰 숫자여야 합니다.')
+        if bad_material[i]:
+            messages.append(f'지원하지 않는 재질입니다: {materials[i]}')
+        if bad_thickness[i]:
+            messages.append('두께는 0보다 큰 숫자여야 합니다.')
+        errors[i] = ' '.join(messages)
+
+    # 잘못된 행은 계산에서 제외되도록 안전한 값으로 대체
+    safe_ids = np.where(bad_material, 0, material_ids)
+    area, weight = sphere_area_batch(
+        np.where(invalid, 0.0, diameter_values),
+        safe_ids,
+        np.where(invalid, 0.0, thickness_values),
+        np.asarray(registry['densities'], dtype=np.float64)
+    )
+    area[invalid] = np.nan
+    weight[invalid] = np.nan
+
+    names = np.asarray(registry['names'], dtype=object)[safe_ids]
+    names[bad_material] = np.asarray(materials, dtype=object)[bad_material]
+
+    # 모든 행이 유효하면 입력 숫자 문자열을 그대로 출력에 씀 (다시 포맷하지 않아 원문 그대로, 더 빠름)
+    valid = not invalid.any()
+    return {
+        'row': np.asarray(row_numbers, dtype=np.int64),
+        'diameter': diameter_values,
+        'material': names,
+        'thickness': thickness_values,
+        'area': area,
+        'weight_kg': weight,
+        'error': errors,
+        'invalid_index': np.flatnonzero(invalid),
+        'diameter_text': _number_text(diameters) if valid else None,
+        'thickness_text': _number_text(thicknesses) if valid else None
+    }
+
+
+def _number_text(values):
+    """숫자 컬럼의 입력 문자열 목록 - 모두 비어 있지 않은 문자열일 때만 (기본값으로 채운 칸이나 JSON 숫자가 있으면 None)"""
+    if set(map(type, values)) != {str} or not all(values) or any(map(str.isspace, values)):
+        return None
+    return values
+
+
+class CsvResultWriter:
+    """계산 결과를 CSV 파일로 쓰기"""
+
+    def __init__(self, filename):
+        self.file = open(filename, 'w', newline='', encoding='utf-8')
+        self.writer = csv.writer(self.file)
+        self.writer.writerow(OUTPUT_FIELDS)
+
+    def write(self, result):
+        # 숫자는 미리 문자열로 포맷 (csv 모듈의 float 변환보다 훨씬 빠름) - 입력값은 원문 또는 repr로 손실 없이
+        diameters = result.get('diameter_text') or list(map(repr, result['diameter'].tolist()))
+        thicknesses = result.get('thickness_text') or list(map(repr, result['thickness'].tolist()))
+        areas = list(map('{:.3f}'.format, result['area'].tolist()))
+        weights = list(map('{:.3f}'.format, result['weight_kg'].tolist()))
+
+        # 오류 행의 NaN은 빈 칸으로 출력
+        for i in result['invalid_index']:
+            for column in (diameters, thicknesses, areas, weights):
+                if column[i] == 'nan':
+                    column[i] = ''
+
+        columns = [list(map(str, result['row'].tolist())), diameters, result['material'].tolist(),
+                   thicknesses, areas, weights, result['error']]
+        if _needs_quoting(columns):
+            self.writer.writerows(zip(*columns))
+        else:
+            # 따옴표가 필요 없으면 csv 모듈을 거치지 않고 줄을 이어 한 번에 씀 (csv.writer와 같은 줄 끝)
+            self.file.write('\r\n'.join(map(','.join, zip(*columns))))
+            self.file.write('\r\n')
+
+    def close(self):
+        self.file.close()
+
+
+def _needs_quoting(columns):
+    """문자열 컬럼에 CSV 따옴표 처리가 필요한 문자(쉼표, 따옴표, 줄바꿈)가 있는지"""
+    for column in columns:
+        try:
+            text = '\0'.join(column)
+        except TypeError:
+            return True  # 문자열이 아닌 값(JSONL의 숫자 재질 등)은 csv 모듈이 변환
+        if ',' in text or '"' in text or '\n' in text or '\r' in text:
+            return True
+    return False
+
+
+class ParquetResultWriter:
+    """계산 결과를 Parquet 파일로 쓰기 (pyarrow 필요)"""
+
+    def __init__(self, filename):
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        self.pa = pa
+        self.schema = pa.schema([
+            ('row', pa.int64()),
+            ('diameter', pa.float64()),
+            ('material', pa.string()),
+            ('thickness', pa.float64()),
+            ('area', pa.float64()),
+            ('weight_kg', pa.float64()),
+            ('error', pa.string())
+        ])
+        self.writer = pq.ParquetWriter(filename, self.schema)
+
+    def write(self, result):
+        arrays = [self.pa.array(result[field], type=self.schema.field(field).type, from_pandas=True)
+                  for field in OUTPUT_FIELDS]
+        self.writer.write_table(self.pa.Table.from_arrays(arrays, schema=self.schema))
+
+    def close(self):
+        self.writer.close()
+
+
+def run_batch(input_filename, output_filename, chunk_size=CHUNK_SIZE):
+    """설계 파일(CSV/JSONL)을 스트리밍으로 계산해서 결과 파일(CSV/Parquet)로 저장"""
+    if input_filename.endswith('.json'):
+        raise ValueError('JSON 배열 파일은 지원하지 않습니다. 한 줄에 설계 하나인 JSONL(.jsonl)을 사용하세요.')
+    if input_filename.endswith('.jsonl'):
+        chunks = read_jsonl_chunks(input_filename, chunk_size)
+    else:
+        chunks = read_csv_chunks(input_filename, chunk_size)
+
+    if output_filename.endswith('.parquet'):
+        writer = ParquetResultWriter(output_filename)
+    else:
+        writer = CsvResultWriter(output_filename)
+
+    total_rows = 0
+    invalid_rows = 0
+    start_time = time.perf_counter()
+    try:
+        for row_numbers, diameters, materials, thicknesses in chunks:
+            result = calculate_chunk(row_numbers, diameters, materials, thicknesses)
+            writer.write(result)
+            total_rows += len(row_numbers)
+            invalid_rows += len(result['invalid_index'])
+    finally:
+        writer.close()
+
+    elapsed = time.perf_counter() - start_time
+    return {
+        'rows': total_rows,
+        'invalid_rows': invalid_rows,
+        'elapsed_sec': elapsed,
+        'rows_per_sec': total_rows / elapsed if elapsed > 0 else 0.0
+    }
+
+
+def main():
+    if len(sys.argv) != 3:
+        print('사용법: python dome_batch.py <입력.csv|입력.jsonl> <출력.csv|출력.parquet>')
+        return
+
+    input_filename, output_filename = sys.argv[1], sys.argv[2]
+    if not os.path.exists(input_filename):
+        print(f'파일 {input_filename}을 찾을 수 없습니다.')
+        return
+
+    try:
+        stats = run_batch(input_filename, output_filename)
+    except ImportError as e:
+        print(f'Parquet 출력에 필요한 모듈이 설치되지 않음 ({e})')
+        return
+    except Exception as e:
+        print(f'배치 계산 중 오류 발생: {e}')
+        return
+
+    print(f'{output_filename} 파일에 저장 완료')
+    print(f'전체 {stats["rows"]}행, 오류 {stats["invalid_rows"]}행, '
+          f'{stats["elapsed_sec"]:.3f}초 ({stats["rows_per_sec"]:,.0f} 행/초)')
+
+
+if __name__ == '__main__':
+    main()
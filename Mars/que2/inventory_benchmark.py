@@ -0,0 +1,100 @@
+import os
+import pickle
+import sys
+import tempfile
+import time
+import tracemalloc
+
+import prob1
+
+# 원본 인벤토리를 반복해서 만드는 벤치마크용 파일 행 수
+DEFAULT_ROWS = 1000000
+
+
+def make_large_inventory(source_filename, target_filename, total_rows):
+    """원본 인벤토리 행을 반복해서 total_rows 행짜리 CSV 생성"""
+    with open(source_filename, 'r', encoding='utf-8') as file:
+        header = file.readline()
+        body = [line if line.endswith('\n') else line + '\n' for line in file if line.strip()]
+
+    with open(target_filename, 'w', encoding='utf-8') as file:
+        file.write(header)
+        written = 0
+        while written < total_rows:
+            block = body[:total_rows - written]
+            file.writelines(block)
+            written += len(block)
+
+
+def measure(label, func, *args):
+    """실행 시간과 최대 메모리 사용량 측정 (시간과 메모리는 따로 실행해서 측정)"""
+    start_time = time.perf_counter()
+    result = func(*args)
+    elapsed = time.perf_counter() - start_time
+    del result
+
+    tracemalloc.start()
+    result = func(*args)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+
+    print(f'{label:<28} {elapsed:8.3f}초  최대 메모리 {peak / (1024 ** 2):8.1f} MB')
+    return elapsed, peak
+
+
+def main():
+    total_rows = int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_ROWS
+    source_filename = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                   'mars_base', 'Mars_Base_Inventory_List.csv')
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        csv_filename = os.path.join(temp_dir, 'inventory_large.csv')
+        make_large_inventory(source_filename, csv_filename, total_rows)
+        print(f'=== 인벤토리 {total_rows}행 벤치마크 ===')
+
+        # CSV 읽기: 기존 딕셔너리 리스트 vs 타입 컬럼 스트리밍
+        measure('read_csv_to_list', prob1.read_csv_to_list, csv_filename)
+        measure('read_inventory_columns', prob1.read_inventory_columns, csv_filename)
+
+        # 위험 물질 조회: 전체 정렬 + 선형 필터 vs 인덱스 이진 탐색
+        inventory_list = prob1.read_csv_to_list(csv_filename)
+        inventory = prob1.read_inventory_columns(csv_filename)
+        query = prob1.InventoryQuery(inventory)
+        measure('sort + filter (0.7)',
+                lambda: prob1.filter_high_flammability(prob1.sort_by_flammability(inventory_list), 0.7))
+        measure('InventoryQuery 생성', prob1.InventoryQuery, inventory)
+        measure('at_least(0.7) x 100', lambda: [query.count_at_least(0.7) for _ in range(100)])
+        measure('top_k_by(weight, 10)', query.top_k_by, 'weight', 10)
+
+        # 이진 파일 읽기: 기존 pickle(딕셔너리 리스트) vs 컬럼 이진 형식(mmap)
+        pickle_filename = os.path.join(temp_dir, 'inventory.pickle')
+        binary_filename = os.path.join(temp_dir, 'inventory.bin')
+        with open(pickle_filename, 'wb') as file:
+            pickle.dump(inventory_list, file)
+        prob1.save_to_binary(inventory, binary_filename)
+        print(f'파일 크기: pickle {os.path.getsize(pickle_filename) / (1024 ** 2):.1f} MB, '
+              f'컬럼 이진 {os.path.getsize(binary_filename) / (1024 ** 2):.1f} MB')
+
+        def load_pickle():
+            with open(pickle_filename, 'rb') as file:
+                return pickle.load(file)
+
+        measure('pickle.load', load_pickle)
+        measure('load_from_binary (전체)', prob1.load_from_binary, binary_filename)
+        measure('load_from_binary (숫자 컬럼)', prob1.load_from_binary, binary_filename,
+                prob1.BINARY_NUMERIC_COLUMNS)
+
+        # CSV 내보내기: DictWriter 행 단위 vs 청크 포맷 (병렬/압축)
+        export_filename = os.path.join(temp_dir, 'export.csv')
+        workers = os.cpu_count() or 1
+        measure('save_to_csv', prob1.save_to_csv, inventory_list, export_filename)
+        measure('save_columns_to_csv', prob1.save_columns_to_csv, inventory, export_filename)
+        measure(f'save_columns_to_csv x{workers}', prob1.save_columns_to_csv, inventory, export_filename,
+                prob1.EXPORT_CHUNK_SIZE, workers)
+        measure(f'save_columns_to_csv gzip x{workers}', prob1.save_columns_to_csv, inventory,
+                export_filename + '.gz', prob1.EXPORT_CHUNK_SIZE, workers, 'gzip')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,112 @@
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+import numpy as np
+
+import prob3
+
+# 벤치마크용 기본 크기 (행 수, 고유 부품 수)
+DEFAULT_ROWS = 1000000
+DEFAULT_PARTS = 500
+
+
+def masked_loop_averages(parts_names, parts_strength):
+    """이전 방식: 부품마다 전체 배열에 마스크를 만들어 평균 (비교용)"""
+    averages = {}
+    for part in np.unique(parts_names):
+        averages[part] = np.mean(parts_strength[parts_names == part])
+    return averages
+
+
+def make_parts(total_rows, total_parts, seed=0):
+    """임의의 부품명/강도 배열 생성"""
+    rng = np.random.default_rng(seed)
+    names = np.array([f'Part-{i:05d}' for i in range(total_parts)])
+    parts_names = names[rng.integers(0, total_parts, total_rows)]
+    parts_strength = rng.integers(0, 101, total_rows).astype(np.float64)
+    return parts_names, parts_strength
+
+
+def write_parts_csv(filename, parts_names, parts_strength):
+    """부품 배열을 원본과 같은 형식(BOM + 헤더)의 CSV로 저장"""
+    with open(filename, 'w', encoding='utf-8-sig') as file:
+        file.write('parts,strength\n')
+        file.writelines(f'{name},{int(strength)}\n' for name, strength in zip(parts_names.tolist(),
+                                                                              parts_strength.tolist()))
+
+
+def measure(label, func, *args):
+    """실행 시간 측정"""
+    start_time = time.perf_counter()
+    result = func(*args)
+    elapsed = time.perf_counter() - start_time
+    print(f'{label:<32} {elapsed:8.3f}초')
+    return result
+
+
+def main():
+    total_rows = int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_ROWS
+    total_parts = int(sys.argv[2]) if len(sys.argv) > 2 else DEFAULT_PARTS
+    print(f'=== 부품 {total_rows}행, 고유 부품 {total_parts}개 벤치마크 ===')
+
+    parts_names, parts_strength = make_parts(total_rows, total_parts)
+
+    # 그룹별 집계: 부품별 마스크 반복 vs 한 번에 그룹 집계
+    expected = measure('masked_loop_averages', masked_loop_averages, parts_names, parts_strength)
+    statistics = measure('calculate_item_statistics', prob3.calculate_item_statistics,
+                         parts_names, parts_strength)
+    matches = np.allclose([expected[part] for part in statistics['parts']], statistics['mean'])
+    print(f'평균값 일치: {matches}')
+
+    # CSV 읽기: loadtxt(dtype=str) vs 정수 코드 구조화 배열
+    with tempfile.TemporaryDirectory() as temp_dir:
+        csv_filename = os.path.join(temp_dir, 'parts.csv')
+        write_parts_csv(csv_filename, parts_names, parts_strength)
+        measure('read_csv_with_numpy (loadtxt)', prob3.read_csv_with_numpy, csv_filename)
+        parts, categories = measure('read_parts_array', prob3.read_parts_array, csv_filename)
+        measure('calculate_item_statistics (코드)', prob3.calculate_item_statistics,
+                parts['part'], parts['strength'], categories)
+
+        # 조각 파일 읽기: 순차 vs 프로세스 풀 (조각별 통계 + 병합)
+        shard_count = 16
+        shard_filenames = []
+        for i, (names, strengths) in enumerate(zip(np.array_split(parts_names, shard_count),
+                                                   np.array_split(parts_strength, shard_count))):
+            shard_filenames.append(os.path.join(temp_dir, f'parts-{i:03d}.csv'))
+            write_parts_csv(shard_filenames[-1], names, strengths)
+        workers = os.cpu_count() or 1
+        measure(f'ingest_parts_shards x1 ({shard_count}개)', prob3.ingest_parts_shards, shard_filenames, 1)
+        shards = measure(f'ingest_parts_shards x{workers} ({shard_count}개)', prob3.ingest_parts_shards,
+                         shard_filenames, workers)
+        merged = measure('merge_item_statistics', prob3.merge_item_statistics,
+                         [shard_statistics for _, _, _, shard_statistics in shards])
+        print(f'조각 병합 평균 일치: {np.allclose(merged["mean"], statistics["mean"])}')
+
+        # 최대 메모리: 전체 읽기 후 집계 vs 청크 스트리밍 집계
+        def load_all():
+            loaded = [prob3.read_parts_array(filename) for filename in shard_filenames]
+            merged_parts, merged_categories = prob3.merge_part_arrays(loaded)
+            return prob3.calculate_item_statistics(merged_parts['part'], merged_parts['strength'],
+                                                   merged_categories)
+
+        for label, func in [('전체 읽기 후 집계', load_all),
+                            ('stream_parts_statistics', lambda: prob3.stream_parts_statistics(shard_filenames, 10000))]:
+            tracemalloc.start()
+            measure(label, func)
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            print(f'{"":<32} 최대 메모리 {peak / (1024 ** 2):8.1f} MB')
+
+        # 반복 실행: CSV 다시 파싱 vs 컬럼 캐시 메모리 매핑
+        cache_dir = os.path.join(temp_dir, 'cache')
+        prob3.save_columns_cache('parts', [csv_filename],
+                                 {'parts': parts, 'categories': np.array(categories)}, cache_dir)
+        measure('read_parts_array (다시 파싱)', prob3.read_parts_array, csv_filename)
+        measure('load_columns_cache (mmap)', prob3.load_columns_cache, 'parts', [csv_filename], cache_dir)
+
+
+if __name__ == '__main__':
+    main()
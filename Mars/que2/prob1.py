@@ -1,14 +1,60 @@
+import bisect
 import csv
-import pickle
+import gzip
+import heapq
+import io
+import itertools
+import math
+import mmap
+import struct
+from array import array
+from multiprocessing import Pool
 
+import numpy as np
 
-def print_csv_content(filename):
-    """CSV 파일 내용을 그냥 읽어서 화면에 출력"""
+# 인벤토리 CSV 헤더 (컬럼 순서 고정)
+INVENTORY_HEADER = ['Substance', 'Weight (g/cm³)', 'Specific Gravity', 'Strength', 'Flammability']
+
+# 문자로 적힌 강도를 숫자 등급으로 변환 (숫자로 적힌 강도는 그대로 사용)
+STRENGTH_LEVELS = {
+    'very weak': 1.0,
+    'very low': 1.0,
+    'weak': 2.0,
+    'low': 2.0,
+    'medium': 3.0,
+    'high': 4.0,
+    'very high': 5.0
+}
+
+# 값이 정해지지 않은 항목 표시 (NaN으로 저장)
+UNSPECIFIED_VALUE = 'Various'
+
+# 인벤토리 이진 파일 형식 (리틀 엔디언)
+# 헤더: 매직, 버전, 예약, 행 수, 컬럼 항목 수
+# 컬럼 항목: 이름, NumPy dtype 문자열, 파일 내 오프셋, 값 개수
+BINARY_MAGIC = b'MARSINV\0'
+BINARY_VERSION = 1
+BINARY_HEADER = struct.Struct('<8sHHQI')
+BINARY_ENTRY = struct.Struct('<24s4sQQ')
+BINARY_ALIGNMENT = 64  # 컬럼 시작 위치 정렬 (mmap 후 바로 NumPy 배열로 사용)
+BINARY_NUMERIC_COLUMNS = ['weight', 'specific_gravity', 'strength', 'flammability']
+BINARY_STRING_COLUMNS = ['substance', 'strength_label']
+
+# CSV 내보내기 청크 크기 (청크 단위로 포맷/압축 후 한 번에 쓰기)
+EXPORT_CHUNK_SIZE = 50000
+
+# 스트리밍 읽기 청크 크기 (작을수록 CPU 캐시와 GC에 유리, 너무 작으면 호출 오버헤드 증가)
+INVENTORY_CHUNK_SIZE = 1024
+
+
+def print_csv_content(filename, max_lines=None):
+    """CSV 파일 내용을 한 줄씩 읽어서 화면에 출력 (max_lines로 출력 줄 수 제한)"""
     try:
         with open(filename, 'r', encoding='utf-8') as file:
             print(f'\n=== {filename} 파일 내용 ===')
-            content = file.read()
-            print(content)
+            for line in itertools.islice(file, max_lines):
+                print(line, end='')
+            print()
             print('=' * 50)
     except FileNotFoundError:
         print(f'파일 {filename}을 찾을 수 없습니다.')
@@ -23,11 +69,12 @@ def read_csv_to_list(filename):
     try:
         with open(filename, 'r', encoding='utf-8') as file:
             csv_reader = csv.reader(file)
+            next(csv_reader, None)  # 헤더 건너뛰기
             
             for row in csv_reader:
                   try:
                       # 인화성 지수를 float으로 변환
-                      flammability = float(row[4])
+                      flammability = parse_flammability(row[4])
                       inventory_item = {
                           'substance': row[0],
                           'weight': row[1],
@@ -36,8 +83,8 @@ def read_csv_to_list(filename):
                           'flammability': flammability
                       }
                       inventory_list.append(inventory_item)
-                  except ValueError:
-                    continue # 숫자가 아닌 경우 건너뛰기
+                  except (ValueError, IndexError):
+                    continue # 숫자가 아니거나 필드가 모자란 경우 건너뛰기
     except FileNotFoundError:
         print(f'파일 {filename}을 찾을 수 없습니다.')
         return []
@@ -48,6 +95,260 @@ def read_csv_to_list(filename):
     return inventory_list
 
 
+def parse_measure(text):
+    """무게/비중 값을 float으로 변환 ('Various'는 NaN)"""
+    if text == UNSPECIFIED_VALUE:
+        return math.nan
+    return float(text)
+
+
+def parse_flammability(text):
+    """인화성 지수를 float으로 변환 - 정렬/이진 탐색 키이므로 nan, inf는 허용하지 않음"""
+    value = float(text)
+    if not math.isfinite(value):
+        raise ValueError(f'인화성 지수는 유한한 숫자여야 합니다: {text}')
+    return value
+
+
+def parse_strength(text):
+    """강도 값을 float으로 변환 (숫자 또는 등급 문자, 'Various'는 NaN)"""
+    if text == UNSPECIFIED_VALUE:
+        return math.nan
+    level = STRENGTH_LEVELS.get(text.strip().lower())
+    if level is not None:
+        return level
+    return float(text)
+
+
+def new_inventory_columns():
+    """빈 인벤토리 컬럼 생성 (숫자 컬럼은 array('d')로 연속 메모리에 저장)"""
+    return {
+        'substance': [],
+        'weight': array('d'),
+        'specific_gravity': array('d'),
+        'strength': array('d'),
+        'weight_label': [],  # 원래 무게 표기 (출력용 - 숫자를 다시 포맷하면 '1.000'이 '1.0'이 됨)
+        'specific_gravity_label': [],  # 원래 비중 표기 (출력용)
+        'strength_label': [],  # 원래 강도 표기 (출력용)
+        'flammability': array('d')
+    }
+
+
+def check_inventory_header(header):
+    """헤더 행 검증 - 예상한 컬럼 순서와 다르면 ValueError"""
+    names = [name.strip().lstrip('\ufeff') for name in header]
+    if names != INVENTORY_HEADER:
+        raise ValueError(f'헤더 형식 오류: {names} (예상: {INVENTORY_HEADER})')
+
+
+def convert_unique_values(values, parser):
+    """컬럼의 고유값만 변환 - (변환 결과 딕셔너리, 변환 실패 값별 오류 메시지) 반환"""
+    converted = {}
+    failures = {}
+    for text in set(values):
+        try:
+            converted[text] = parser(text)
+        except ValueError as e:
+            failures[text] = str(e)
+    return converted, failures
+
+
+def rows_to_inventory_columns(rows, first_line_number, error_sink=None):
+    """CSV 행 묶음을 타입 컬럼으로 변환 (잘못된 행은 라인 번호와 함께 라인 순서대로 error_sink로)"""
+    line_numbers = range(first_line_number, first_line_number + len(rows))
+    errors = []  # 필드 개수 오류와 값 오류를 따로 찾으므로 모았다가 라인 순서로 정렬해서 넘김
+    
+    # 필드 개수가 틀린 행 먼저 제외
+    if min(map(len, rows), default=5) != 5 or max(map(len, rows), default=5) != 5:
+        kept = []
+        for line_number, row in zip(line_numbers, rows):
+            if len(row) == 5:
+                kept.append((line_number, row))
+            else:
+                errors.append((line_number, row, f'필드 개수 오류 - {len(row)}개 (예상: 5개)'))
+        line_numbers = [line_number for line_number, _ in kept]
+        rows = [row for _, row in kept]
+    
+    columns = new_inventory_columns()
+    if not rows:
+        _report_errors(errors, error_sink)
+        return columns
+    
+    # 행 목록을 컬럼으로 전치한 뒤 고유값 단위로 변환 (행마다 파싱하지 않음)
+    fields = list(zip(*rows))
+    parsers = [(1, parse_measure), (2, parse_measure), (3, parse_strength), (4, parse_flammability)]
+    conversions = [(index, *convert_unique_values(fields[index], parser)) for index, parser in parsers]
+    
+    if any(failures for _, _, failures in conversions):
+        kept = []
+        for line_number, row in zip(line_numbers, rows):
+            reasons = [failures[row[index]] for index, _, failures in conversions if row[index] in failures]
+            if not reasons:
+                kept.append(row)
+            else:
+                errors.append((line_number, row, reasons[0]))
+        fields = list(zip(*kept))
+    
+    _report_errors(errors, error_sink)
+    if not fields:
+        return columns
+    
+    # 같은 문자열은 객체 하나를 공유 (반복되는 물질명이 많을수록 메모리 절약)
+    for key, index in [('substance', 0), ('weight_label', 1), ('specific_gravity_label', 2), ('strength_label', 3)]:
+        shared = {text: text for text in set(fields[index])}
+        columns[key] = list(map(shared.__getitem__, fields[index]))
+    for key, (index, converted, _) in zip(['weight', 'specific_gravity', 'strength', 'flammability'], conversions):
+        columns[key] = array('d', map(converted.__getitem__, fields[index]))
+    return columns
+
+
+def _report_errors(errors, error_sink):
+    """모은 행 오류를 라인 번호 순서로 error_sink에 추가"""
+    if error_sink is not None and errors:
+        error_sink.extend(sorted(errors, key=lambda error: error[0]))
+
+
+def iter_inventory_chunks(filename, chunk_size=INVENTORY_CHUNK_SIZE, error_sink=None):
+    """인벤토리 CSV를 chunk_size 행씩 타입이 정해진 컬럼으로 읽기 (잘못된 행은 error_sink로)"""
+    with open(filename, 'r', newline='', encoding='utf-8') as file:
+        csv_reader = csv.reader(file)
+        
+        header = next(csv_reader, None)
+        if header is None:
+            return
+        check_inventory_header(header)
+        
+        line_number = 2  # 헤더 다음 줄부터
+        while True:
+            rows = list(itertools.islice(csv_reader, chunk_size))
+            if not rows:
+                return
+            
+            yield rows_to_inventory_columns(rows, line_number, error_sink)
+            line_number += len(rows)
+
+
+def read_inventory_columns(filename, error_sink=None):
+    """인벤토리 CSV 전체를 스트리밍으로 읽어서 컬럼 하나로 합치기"""
+    inventory = new_inventory_columns()
+    
+    try:
+        for chunk in iter_inventory_chunks(filename, error_sink=error_sink):
+            for key, column in chunk.items():
+                inventory[key].extend(column)
+    except FileNotFoundError:
+        print(f'파일 {filename}을 찾을 수 없습니다.')
+        return new_inventory_columns()
+    except Exception as e:
+        print(f'파일 읽기 중 오류 발생: {e}')
+        return new_inventory_columns()
+    
+    return inventory
+
+
+def format_measure(value):
+    """NaN은 다시 'Various'로 표시"""
+    return UNSPECIFIED_VALUE if math.isnan(value) else repr(value)
+
+
+def measure_labels(inventory, key):
+    """무게/비중 컬럼의 출력용 표기 - 읽을 때 보관한 원래 문자열, 없으면(이진 파일 등) 값을 repr로 포맷"""
+    labels = inventory.get(f'{key}_label')
+    if labels is not None and len(labels) == len(inventory[key]):
+        return labels
+    return list(map(format_measure, inventory[key].tolist()))
+
+
+def columns_to_list(inventory):
+    """컬럼 형태의 인벤토리를 기존 딕셔너리 리스트 형태로 변환"""
+    # NumPy 배열과 array('d') 모두 tolist()로 파이썬 float 리스트가 됨
+    return [
+        {
+            'substance': substance,
+            'weight': weight,
+            'specific_gravity': specific_gravity,
+            'strength': strength_label,
+            'flammability': flammability
+        }
+        for substance, weight, specific_gravity, strength_label, flammability in zip(
+            inventory['substance'], measure_labels(inventory, 'weight'),
+            measure_labels(inventory, 'specific_gravity'), inventory['strength_label'],
+            inventory['flammability'].tolist()
+        )
+    ]
+
+
+def select_rows(inventory, indices):
+    """인덱스 목록에 해당하는 행만 뽑아서 새 컬럼 생성"""
+    selected = new_inventory_columns()
+    for key, column in inventory.items():
+        if isinstance(column, array):
+            selected[key] = array('d', map(column.__getitem__, indices))
+        else:
+            selected[key] = list(map(column.__getitem__, indices))
+    return selected
+
+
+def _rank_value(value, descending):
+    """정렬 키 값 - NaN('Various')은 방향과 관계없이 항상 맨 뒤로"""
+    if value != value:
+        return -math.inf
+    return value if descending else -value
+
+
+class InventoryQuery:
+    """인벤토리 컬럼 조회 엔진 - 인화성 정렬 인덱스를 한 번만 만들고 반복 조회에 재사용"""
+    
+    def __init__(self, inventory):
+        self.inventory = inventory
+        flammability = inventory['flammability']
+        
+        # 인화성 내림차순 행 번호 (같은 값은 원래 순서 유지)
+        self.order = sorted(range(len(flammability)), key=flammability.__getitem__, reverse=True)
+        # 이진 탐색용 오름차순 키 (인화성에 -를 붙여서 내림차순 순서와 맞춤)
+        self.sorted_keys = array('d', (-flammability[i] for i in self.order))
+    
+    def __len__(self):
+        return len(self.order)
+    
+    def sorted_indices(self):
+        """인화성 내림차순 전체 행 번호 (O(1), 미리 만든 인덱스 반환)"""
+        return self.order
+    
+    def at_least(self, threshold):
+        """인화성이 threshold 이상인 행 번호 (O(log n) 탐색 + 결과 개수만큼 복사)"""
+        position = bisect.bisect_right(self.sorted_keys, -threshold)
+        return self.order[:position]
+    
+    def count_at_least(self, threshold):
+        """인화성이 threshold 이상인 행 개수 (O(log n))"""
+        return bisect.bisect_right(self.sorted_keys, -threshold)
+    
+    def top_k(self, k):
+        """인화성이 가장 높은 k개 행 번호 (O(k))"""
+        return self.order[:k]
+    
+    def top_k_by(self, column, k, descending=True):
+        """임의의 숫자 컬럼 기준 상위 k개 행 번호 - 힙 사용 (O(n log k))"""
+        values = self.inventory[column]
+        return heapq.nlargest(k, range(len(values)), key=lambda i: _rank_value(values[i], descending))
+    
+    def rank(self, criteria, k=None):
+        """여러 기준으로 순위 매기기 - criteria는 [(컬럼, 내림차순 여부), ...], k가 있으면 힙으로 상위 k개만"""
+        columns = [(self.inventory[column], descending) for column, descending in criteria]
+        
+        def rank_key(i):
+            return tuple(_rank_value(values[i], descending) for values, descending in columns)
+        
+        if k is None:
+            return sorted(range(len(self.order)), key=rank_key, reverse=True)
+        return heapq.nlargest(k, range(len(self.order)), key=rank_key)
+    
+    def rows(self, indices):
+        """행 번호 목록을 기존 딕셔너리 리스트 형태로 변환"""
+        return columns_to_list(select_rows(self.inventory, indices))
+
+
 def sort_by_flammability(inventory_list):
     """인화성 지수를 기준으로 내림차순 정렬"""
     return sorted(inventory_list, key=lambda x: x['flammability'], reverse=True)
@@ -81,29 +382,168 @@ def save_to_csv(data, filename):
         print(f'\nCSV 저장 중 오류 발생: {e}')
 
 
-def save_to_binary(data, filename):
-    """리스트를 이진 파일로 저장 (보너스 과제)"""
+def compress_chunk(data, compression):
+    """바이트 청크 압축 - gzip/zstd 모두 청크별 프레임을 이어 붙여도 유효한 파일이 됨"""
+    if compression is None:
+        return data
+    if compression == 'gzip':
+        return gzip.compress(data, compresslevel=6)
+    if compression == 'zstd':
+        import zstandard
+        return zstandard.ZstdCompressor().compress(data)
+    raise ValueError(f'지원하지 않는 압축 형식입니다: {compression}')
+
+
+def format_csv_chunk(args):
+    """인벤토리 청크를 CSV 바이트로 포맷 (워커 프로세스에서도 실행되는 최상위 함수)"""
+    columns, compression = args
+    substances, weights, specific_gravities, strength_labels, flammabilities = columns
+    
+    buffer = io.StringIO()
+    csv.writer(buffer).writerows(zip(substances, weights, specific_gravities, strength_labels, flammabilities))
+    return compress_chunk(buffer.getvalue().encode('utf-8'), compression)
+
+
+def iter_export_chunks(inventory, chunk_size, compression):
+    """인벤토리 컬럼을 chunk_size 행씩 잘라서 포맷 작업 단위로 반환 (무게/비중은 원래 표기)"""
+    weights = measure_labels(inventory, 'weight')
+    specific_gravities = measure_labels(inventory, 'specific_gravity')
+    flammabilities = inventory['flammability'].tolist()
+    for start in range(0, len(inventory['substance']), chunk_size):
+        end = start + chunk_size
+        yield (inventory['substance'][start:end], weights[start:end], specific_gravities[start:end],
+               inventory['strength_label'][start:end], flammabilities[start:end]), compression
+
+
+def save_columns_to_csv(inventory, filename, chunk_size=EXPORT_CHUNK_SIZE, workers=1, compression=None):
+    """인벤토리 컬럼을 CSV로 저장 - 청크 단위 포맷, workers > 1이면 프로세스 병렬, gzip/zstd 압축 선택"""
+    try:
+        with open(filename, 'wb') as file:
+            if len(inventory['substance']):
+                buffer = io.StringIO()
+                csv.writer(buffer).writerow(INVENTORY_HEADER)
+                file.write(compress_chunk(buffer.getvalue().encode('utf-8'), compression))
+                
+                chunks = iter_export_chunks(inventory, chunk_size, compression)
+                if workers > 1:
+                    # imap은 청크 순서를 유지하므로 결과를 받는 대로 이어서 쓰면 됨
+                    with Pool(workers) as pool:
+                        for data in pool.imap(format_csv_chunk, chunks):
+                            file.write(data)
+                else:
+                    for data in map(format_csv_chunk, chunks):
+                        file.write(data)
+        print(f'\n{filename} 파일에 저장 완료')
+        return True
+    except Exception as e:
+        print(f'\nCSV 저장 중 오류 발생: {e}')
+        return False
+
+
+def encode_string_column(values):
+    """문자열 컬럼을 (코드 배열, 오프셋 배열, UTF-8 바이트) 문자열 테이블로 변환"""
+    table = {}
+    codes = np.fromiter((table.setdefault(value, len(table)) for value in values), dtype='<u4', count=len(values))
+    
+    encoded = [value.encode('utf-8') for value in table]
+    offsets = np.zeros(len(encoded) + 1, dtype='<u4')
+    np.cumsum([len(data) for data in encoded], out=offsets[1:])
+    return codes, offsets, np.frombuffer(b''.join(encoded), dtype='u1')
+
+
+def decode_string_table(offsets, data):
+    """문자열 테이블을 파이썬 문자열 리스트로 변환"""
+    blob = data.tobytes()
+    bounds = offsets.tolist()
+    return [blob[start:end].decode('utf-8') for start, end in zip(bounds, bounds[1:])]
+
+
+def save_to_binary(inventory, filename):
+    """인벤토리 컬럼을 버전이 있는 컬럼 이진 파일로 저장 (보너스 과제)"""
     try:
+        row_count = len(inventory['substance'])
+        arrays = []
+        for key in BINARY_NUMERIC_COLUMNS:
+            arrays.append((key, np.asarray(inventory[key], dtype='<f8')))
+        for key in BINARY_STRING_COLUMNS:
+            codes, offsets, data = encode_string_column(inventory[key])
+            arrays += [(f'{key}.codes', codes), (f'{key}.offsets', offsets), (f'{key}.data', data)]
+        
+        # 헤더와 컬럼 목록 다음부터 컬럼 데이터를 정렬된 위치에 배치
+        position = BINARY_HEADER.size + BINARY_ENTRY.size * len(arrays)
+        entries = []
+        for name, values in arrays:
+            position += -position % BINARY_ALIGNMENT
+            entries.append((name, values, position))
+            position += values.nbytes
+        
         with open(filename, 'wb') as file:
-            pickle.dump(data, file)
+            file.write(BINARY_HEADER.pack(BINARY_MAGIC, BINARY_VERSION, 0, row_count, len(entries)))
+            for name, values, offset in entries:
+                file.write(BINARY_ENTRY.pack(name.encode('ascii'), values.dtype.str.encode('ascii'),
+                                             offset, len(values)))
+            for name, values, offset in entries:
+                file.write(b'\0' * (offset - file.tell()))
+                file.write(values.tobytes())
         print(f'\n{filename} 이진 파일에 저장 완료')
     except Exception as e:
         print(f'\n이진 파일 저장 중 오류 발생: {e}')
 
 
-def load_from_binary(filename):
-    """이진 파일에서 데이터 읽기 (보너스 과제)"""
+def read_binary_directory(buffer):
+    """이진 파일 헤더와 컬럼 목록 읽기 - {컬럼 이름: (dtype, 오프셋, 개수)}"""
+    magic, version, _, row_count, entry_count = BINARY_HEADER.unpack_from(buffer, 0)
+    if magic != BINARY_MAGIC:
+        raise ValueError('인벤토리 이진 파일 형식이 아닙니다.')
+    if version != BINARY_VERSION:
+        raise ValueError(f'지원하지 않는 이진 파일 버전입니다: {version}')
+    
+    directory = {}
+    for i in range(entry_count):
+        name, dtype, offset, count = BINARY_ENTRY.unpack_from(buffer, BINARY_HEADER.size + BINARY_ENTRY.size * i)
+        dtype = np.dtype(dtype.rstrip(b'\0').decode('ascii'))
+        if offset + dtype.itemsize * count > len(buffer):
+            raise ValueError('이진 파일이 손상되었습니다 (컬럼 범위 초과).')
+        directory[name.rstrip(b'\0').decode('ascii')] = (dtype, offset, count)
+    return row_count, directory
+
+
+def load_from_binary(filename, columns=None):
+    """컬럼 이진 파일을 메모리 매핑으로 읽기 (보너스 과제)
+    
+    숫자 컬럼은 파일을 복사하지 않는 NumPy 배열로 반환하고, columns를 주면 해당 컬럼만 읽는다.
+    pickle과 달리 읽는 과정에서 코드가 실행되지 않는다.
+    """
+    if columns is None:
+        columns = BINARY_NUMERIC_COLUMNS + BINARY_STRING_COLUMNS
+    
     try:
         with open(filename, 'rb') as file:
-            data = pickle.load(file)
-        print(f'\n{filename} 이진 파일에서 읽기 완료')
-        return data
+            buffer = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        row_count, directory = read_binary_directory(buffer)
+        
+        def view(name):
+            dtype, offset, count = directory[name]
+            return np.frombuffer(buffer, dtype=dtype, count=count, offset=offset)
+        
+        inventory = {}
+        for key in columns:
+            if key in BINARY_NUMERIC_COLUMNS:
+                inventory[key] = view(key)
+            elif key in BINARY_STRING_COLUMNS:
+                table = decode_string_table(view(f'{key}.offsets'), view(f'{key}.data'))
+                inventory[key] = list(map(table.__getitem__, view(f'{key}.codes').tolist()))
+            else:
+                raise KeyError(f'없는 컬럼입니다: {key}')
+        
+        print(f'\n{filename} 이진 파일에서 읽기 완료 ({row_count}행)')
+        return inventory
     except FileNotFoundError:
         print(f'\n파일 {filename}을 찾을 수 없습니다.')
-        return []
+        return {}
     except Exception as e:
         print(f'이진 파일 읽기 중 오류 발생: {e}')
-        return []
+        return {}
 
 
 def main():
@@ -111,38 +551,45 @@ def main():
     csv_filename = 'mars_base/Mars_Base_Inventory_List.csv'
     print_csv_content(csv_filename)
     
-    # CSV 파일 읽기
-    inventory_data = read_csv_to_list(csv_filename)
+    # CSV 파일 읽기 (타입 변환된 컬럼으로 스트리밍, 잘못된 행은 따로 모음)
+    parse_errors = []
+    inventory = read_inventory_columns(csv_filename, error_sink=parse_errors)
+    for line_number, row, reason in parse_errors:
+        print(f'라인 {line_number} 건너뜀: {reason} {row}')
     
-    if not inventory_data:
+    if not inventory['substance']:
         print('데이터를 읽을 수 없습니다.')
         return
 
+    # 인화성 지수 인덱스를 한 번 만들고 정렬/필터링에 재사용
+    query = InventoryQuery(inventory)
+    
     # 인화성 지수로 내림차순 정렬
-    sorted_data = sort_by_flammability(inventory_data)
+    sorted_data = query.rows(query.sorted_indices())
     print('\n=== 인화성 지수 기준 내림차순 정렬 결과 ===')
     for item in sorted_data:
         print(f'{item["substance"]}: {item["flammability"]}')
     
     # 인화성 지수 0.7 이상 필터링
-    dangerous_items = filter_high_flammability(sorted_data, 0.7)
+    dangerous_items = query.rows(query.at_least(0.7))
     print(f'\n=== 위험 물질 (인화성 지수 0.7 이상): {len(dangerous_items)}개 ===')
     for item in dangerous_items:
         print(f'{item["substance"]}: {item["flammability"]}')
     
     # 위험 물질을 CSV로 저장
     danger_csv_filename = 'Mars_Base_Inventory_danger.csv'
-    save_to_csv(dangerous_items, danger_csv_filename)
+    save_columns_to_csv(select_rows(inventory, query.at_least(0.7)), danger_csv_filename)
     
     # 보너스 과제: 이진 파일 저장
     binary_filename = 'Mars_Base_Inventory_List.bin'
-    save_to_binary(sorted_data, binary_filename)
+    save_to_binary(select_rows(inventory, query.sorted_indices()), binary_filename)
     
-    # 보너스 과제: 이진 파일 읽기
-    loaded_data = load_from_binary(binary_filename)
+    # 보너스 과제: 이진 파일 읽기 (출력에 필요한 컬럼만)
+    loaded_data = load_from_binary(binary_filename, columns=['substance', 'flammability'])
     print(f'\n=== 이진 파일에서 읽은 데이터 ===')
-    for item in loaded_data:
-        print(f'{item["substance"]}: {item["flammability"]}')
+    if loaded_data:
+        for substance, flammability in zip(loaded_data['substance'], loaded_data['flammability'].tolist()):
+            print(f'{substance}: {flammability}')
 
 if __name__ == '__main__':
     main()
@@ -1,5 +1,25 @@
 import numpy as np
 import csv
+import glob
+import hashlib
+import itertools
+import json
+import os
+import sys
+from multiprocessing import Pool, cpu_count
+
+# 부품 배열 형식: 부품명은 정수 코드(부품명 목록의 인덱스), 강도는 float64
+PARTS_DTYPE = np.dtype([('part', np.int32), ('strength', np.float64)])
+
+# 부품 CSV 조각(shard) 파일 패턴
+PARTS_PATTERN = 'mars_base/mars_base_main_parts-*.csv'
+
+# 컬럼 캐시 디렉터리 (원본 CSV를 다시 파싱하지 않도록 .npy로 저장 후 메모리 매핑)
+PARTS_CACHE_DIR = 'parts_cache'
+CACHE_VERSION = 1
+
+# 스트리밍 집계에서 한 번에 읽는 행 수 (메모리 사용량 상한을 정함)
+STREAM_CHUNK_ROWS = 100000
 
 
 def read_csv_with_numpy(filename):
@@ -22,31 +42,147 @@ def read_csv_with_numpy(filename):
         return None, None
 
 
-def merge_arrays(arr1, arr2, arr3):
-    """세 배열(arr1,2,3)을 병합"""
+def parse_parts_text(text):
+    """헤더를 뺀 CSV 본문을 (부품명 리스트, 강도 배열)로 변환 - 따옴표가 없는 단순 CSV용 빠른 경로"""
+    lines = text.splitlines()
+    if lines and not lines[-1]:
+        lines.pop()
+    
+    # 줄마다 쉼표가 정확히 1개여야 함 - 전체 필드 수만 보면 3필드 행과 1필드 행이 서로 상쇄되어 밀림
+    if any(line.count(',') != 1 for line in lines):
+        raise ValueError('필드 개수가 맞지 않는 행이 있습니다.')
+    
+    # 줄을 쉼표로 이어 한 번에 나누면 [부품명, 강도, 부품명, 강도, ...]
+    fields = ','.join(lines).split(',')
+    return fields[0::2], np.array(fields[1::2], dtype=np.float64)
+
+
+def parse_parts_rows(text, filename, first_line_number=2):
+    """csv 모듈로 한 행씩 읽기 - 따옴표나 잘못된 행이 있을 때 쓰는 느린 경로 (잘못된 행은 건너뜀)
+    
+    first_line_number는 text 첫 줄의 파일 내 라인 번호 (청크로 나눠 읽을 때 오류 위치 표시용)
+    """
+    names = []
+    strengths = []
+    for line_number, row in enumerate(csv.reader(text.splitlines()), first_line_number):
+        if not row:
+            continue
+        try:
+            if len(row) != 2:
+                raise ValueError(f'필드 개수 {len(row)}개')
+            strengths.append(float(row[1]))
+            names.append(row[0])
+        except ValueError as e:
+            print(f'{filename} 라인 {line_number} 건너뜀: {e}')
+    return names, np.array(strengths, dtype=np.float64)
+
+
+def encode_categories(names):
+    """부품명 리스트를 (정수 코드 배열, 처음 나온 순서의 부품명 목록)으로 변환"""
+    index = {}
+    codes = np.fromiter((index.setdefault(name, len(index)) for name in names), dtype=np.int32, count=len(names))
+    return codes, list(index)
+
+
+def read_parts_array(filename):
+    """부품 CSV를 구조화 배열(PARTS_DTYPE)과 부품명 목록으로 읽기 (loadtxt/문자열 배열 없이)"""
     try:
-        # 세 배열을 세로로 쌓기 (vstack)
-        parts = np.vstack((arr1, arr2, arr3))
+        with open(filename, 'r', encoding='utf-8-sig') as file:
+            header = file.readline()
+            if not header.strip():
+                raise ValueError('헤더가 없습니다.')
+            text = file.read()
+        
+        try:
+            if '"' in text:
+                raise ValueError('따옴표가 있는 CSV')
+            names, strengths = parse_parts_text(text)
+        except ValueError:
+            names, strengths = parse_parts_rows(text, filename)
+        
+        codes, categories = encode_categories(names)
+        parts = np.empty(len(codes), dtype=PARTS_DTYPE)
+        parts['part'] = codes
+        parts['strength'] = strengths
+        return parts, categories
+    
+    except FileNotFoundError:
+        print(f'파일 {filename}을 찾을 수 없습니다.')
+        return None, None
+    except Exception as e:
+        print(f'파일 {filename} 읽기 중 오류 발생: {e}')
+        return None, None
+
+
+def merge_part_arrays(shards):
+    """[(부품 배열, 부품명 목록), ...]을 공통 부품명 목록(이름순) 기준으로 다시 코드를 매겨 하나로 병합"""
+    try:
+        categories = sorted(set().union(*(shard_categories for _, shard_categories in shards)))
+        global_index = {name: code for code, name in enumerate(categories)}
+        
+        # 결과 배열을 한 번만 만들고 각 조각을 제자리에 복사
+        parts = np.empty(sum(len(shard) for shard, _ in shards), dtype=PARTS_DTYPE)
+        position = 0
+        for shard, shard_categories in shards:
+            remap = np.array([global_index[name] for name in shard_categories], dtype=np.int32)
+            end = position + len(shard)
+            parts['part'][position:end] = remap[shard['part']]
+            parts['strength'][position:end] = shard['strength']
+            position = end
+        
         print(f'배열 병합 완료: {parts.shape}')
-        return parts
+        return parts, categories
     except Exception as e:
         print(f'배열 병합 중 오류 발생: {e}')
-        return None
+        return None, None
 
 
-def calculate_item_averages(parts_names, parts_strength):
+def calculate_item_statistics(parts_names, parts_strength, categories=None):
+    """부품별 개수/평균/최소/최대/표준편차를 한 번에 계산 (부품 수와 무관하게 배열을 몇 번만 훑음)
+    
+    categories를 주면 parts_names는 그 목록의 정수 코드로 보고 문자열 정렬을 하지 않는다.
+    """
+    if categories is None:
+        # 부품명을 정수 그룹 번호로 변환
+        unique_parts, group = np.unique(parts_names, return_inverse=True)
+        group = group.ravel()
+    else:
+        unique_parts = np.asarray(categories)
+        group = parts_names
+    # 구조화 배열의 필드(띄엄띄엄 놓인 뷰)도 연속 배열로 한 번만 변환
+    group = np.ascontiguousarray(group, dtype=np.intp)
+    strength = np.ascontiguousarray(parts_strength, dtype=np.float64)
+    
+    count = np.bincount(group, minlength=len(unique_parts))
+    total = np.bincount(group, weights=strength, minlength=len(unique_parts))
+    mean = total / count
+    
+    # 표준편차는 평균과의 편차 제곱으로 계산 (제곱합 - 평균² 방식보다 수치적으로 안정)
+    deviation = strength - mean[group]
+    std = np.sqrt(np.bincount(group, weights=deviation * deviation, minlength=len(unique_parts)) / count)
+    
+    # 그룹별 최소/최대 (ufunc.at은 정렬 없이 그룹 번호 위치에 바로 누적)
+    minimum = np.full(len(unique_parts), np.inf)
+    maximum = np.full(len(unique_parts), -np.inf)
+    np.minimum.at(minimum, group, strength)
+    np.maximum.at(maximum, group, strength)
+    
+    return {
+        'parts': unique_parts,
+        'count': count,
+        'sum': total,
+        'mean': mean,
+        'min': minimum,
+        'max': maximum,
+        'std': std
+    }
+
+
+def calculate_item_averages(parts_names, parts_strength, categories=None):
     """항목별 평균값 계산"""
     try:
-        # 고유한 부품명 찾기
-        unique_parts = np.unique(parts_names)
-        
-        averages = {}
-        for part in unique_parts:
-            # 해당 부품의 모든 강도값 찾기
-            mask = parts_names == part
-            part_strengths = parts_strength[mask]
-            avg_strength = np.mean(part_strengths)
-            averages[part] = avg_strength
+        statistics = calculate_item_statistics(parts_names, parts_strength, categories)
+        averages = dict(zip(statistics['parts'].tolist(), statistics['mean'].tolist()))
         
         print(f'{len(averages)}개의 고유 부품에 대한 평균 계산 완료')
         return averages
@@ -55,6 +191,247 @@ def calculate_item_averages(parts_names, parts_strength):
         return {}
 
 
+class PartsStatisticsAccumulator:
+    """부품별 개수/합계/편차 제곱합/최소/최대를 누적하는 집계기 - 메모리는 고유 부품 수에만 비례"""
+    
+    def __init__(self):
+        self.index = {}
+        self.names = []
+        self.count = np.zeros(0, dtype=np.int64)
+        self.total = np.zeros(0)
+        self.m2 = np.zeros(0)  # 편차 제곱합 (Welford/Chan 병합용)
+        self.minimum = np.zeros(0)
+        self.maximum = np.zeros(0)
+    
+    def _targets(self, names):
+        """부품명 목록의 누적 배열 위치 - 처음 보는 부품은 새 자리를 만들어 줌"""
+        for name in names:
+            if name not in self.index:
+                self.index[name] = len(self.names)
+                self.names.append(name)
+        
+        if len(self.names) > len(self.count):
+            # 용량을 두 배씩 늘려 재할당 횟수를 줄임
+            capacity = max(len(self.names), 2 * len(self.count))
+            grow = capacity - len(self.count)
+            self.count = np.concatenate((self.count, np.zeros(grow, dtype=np.int64)))
+            self.total = np.concatenate((self.total, np.zeros(grow)))
+            self.m2 = np.concatenate((self.m2, np.zeros(grow)))
+            self.minimum = np.concatenate((self.minimum, np.full(grow, np.inf)))
+            self.maximum = np.concatenate((self.maximum, np.full(grow, -np.inf)))
+        
+        return np.array([self.index[name] for name in names], dtype=np.intp)
+    
+    def add_statistics(self, statistics):
+        """calculate_item_statistics 결과 하나를 누적 (순서/묶는 방법과 관계없이 같은 결과)"""
+        target = self._targets(statistics['parts'].tolist())
+        count_a = self.count[target]
+        count_b = statistics['count']
+        # 다른 집계기의 원시 편차 제곱합이 있으면 그대로 사용 (표준편차에서 되돌리면 정밀도 손실)
+        m2_b = statistics['m2'] if 'm2' in statistics else np.where(count_b > 0, statistics['std'] ** 2 * count_b, 0.0)
+        merged_count = count_a + count_b
+        
+        # 두 그룹의 편차 제곱합 병합 (Chan et al.) - 평균 차이로 보정
+        mean_a = np.divide(self.total[target], count_a, out=np.zeros(len(target)), where=count_a > 0)
+        delta = statistics['mean'] - mean_a
+        correction = np.divide(delta * delta * count_a * count_b, merged_count,
+                               out=np.zeros(len(target)), where=merged_count > 0)
+        self.m2[target] += m2_b + correction
+        
+        # 합계는 그대로 더해서 평균은 전체를 한 번에 계산한 것과 같은 값이 되도록 함
+        self.total[target] += statistics['sum']
+        self.count[target] = merged_count
+        self.minimum[target] = np.minimum(self.minimum[target], statistics['min'])
+        self.maximum[target] = np.maximum(self.maximum[target], statistics['max'])
+    
+    def merge(self, other):
+        """다른 집계기의 누적 결과를 병합"""
+        if not other.names:
+            return
+        size = len(other.names)
+        count = other.count[:size]
+        self.add_statistics({
+            'parts': np.array(other.names),
+            'count': count,
+            'sum': other.total[:size],
+            'mean': other.total[:size] / count,
+            'min': other.minimum[:size],
+            'max': other.maximum[:size],
+            'm2': other.m2[:size]
+        })
+    
+    def add_chunk(self, parts_names, parts_strength):
+        """부품명/강도 청크 하나를 누적"""
+        if not len(parts_names):
+            return
+        codes, categories = encode_categories(parts_names)
+        self.add_statistics(calculate_item_statistics(codes, parts_strength, categories))
+    
+    def result(self):
+        """누적 결과를 calculate_item_statistics와 같은 형태(부품명 순)로 반환"""
+        order = np.array(sorted(range(len(self.names)), key=self.names.__getitem__), dtype=np.intp)
+        count = self.count[order]
+        return {
+            'parts': np.array(self.names)[order] if self.names else np.array([], dtype=str),
+            'count': count,
+            'sum': self.total[order],
+            'mean': self.total[order] / count,
+            'min': self.minimum[order],
+            'max': self.maximum[order],
+            'std': np.sqrt(self.m2[order] / count)
+        }
+
+
+def merge_item_statistics(statistics_list):
+    """조각별 부품 통계를 하나로 병합 (순서/묶는 방법과 관계없이 같은 결과가 나오는 결합 연산)"""
+    accumulator = PartsStatisticsAccumulator()
+    for statistics in statistics_list:
+        accumulator.add_statistics(statistics)
+    return accumulator.result()
+
+
+def iter_parts_chunks(filename, chunk_rows=STREAM_CHUNK_ROWS):
+    """부품 CSV를 chunk_rows 행씩 (부품명 리스트, 강도 배열)로 읽기 - 파일 전체를 메모리에 올리지 않음"""
+    with open(filename, 'r', encoding='utf-8-sig') as file:
+        file.readline()  # 헤더 건너뛰기
+        line_number = 2  # 청크 첫 줄의 파일 내 라인 번호 (헤더가 1행)
+        while True:
+            lines = list(itertools.islice(file, chunk_rows))
+            if not lines:
+                return
+            text = ''.join(lines)
+            try:
+                if '"' in text:
+                    raise ValueError('따옴표가 있는 CSV')
+                yield parse_parts_text(text)
+            except ValueError:
+                yield parse_parts_rows(text, filename, line_number)
+            line_number += len(lines)
+
+
+def stream_parts_statistics(filenames, chunk_rows=STREAM_CHUNK_ROWS):
+    """여러 부품 CSV를 청크 단위로 흘려 읽으며 부품별 통계 누적 (메모리 사용량은 청크 크기 + 고유 부품 수)
+    
+    파일마다 따로 누적한 뒤 끝까지 읽은 파일만 전체에 병합 - 중간에 실패한 파일은 결과에서 통째로 빠짐
+    """
+    accumulator = PartsStatisticsAccumulator()
+    for filename in filenames:
+        try:
+            file_accumulator = PartsStatisticsAccumulator()
+            for parts_names, parts_strength in iter_parts_chunks(filename, chunk_rows):
+                file_accumulator.add_chunk(parts_names, parts_strength)
+            accumulator.merge(file_accumulator)
+        except FileNotFoundError:
+            print(f'파일 {filename}을 찾을 수 없습니다.')
+        except Exception as e:
+            print(f'파일 {filename} 읽기 중 오류 발생 (이 파일은 결과에서 제외): {e}')
+    return accumulator.result()
+
+
+def load_parts_shard(filename):
+    """부품 CSV 조각 하나를 읽고 조각 통계까지 계산 (워커 프로세스에서 실행)"""
+    parts, categories = read_parts_array(filename)
+    if parts is None:
+        return None
+    statistics = calculate_item_statistics(parts['part'], parts['strength'], categories)
+    return parts, categories, statistics
+
+
+def ingest_parts_shards(filenames, workers=None):
+    """여러 부품 CSV 조각을 프로세스 풀로 병렬 읽기 - [(파일명, 배열, 부품명 목록, 통계), ...] (읽기 실패한 파일 제외)"""
+    if workers is None:
+        workers = min(cpu_count(), len(filenames))
+    
+    if workers > 1:
+        # map은 파일 순서를 유지
+        with Pool(workers) as pool:
+            results = pool.map(load_parts_shard, filenames)
+    else:
+        results = [load_parts_shard(filename) for filename in filenames]
+    
+    return [(filename, *result) for filename, result in zip(filenames, results) if result is not None]
+
+
+def file_fingerprint(filename):
+    """원본 파일 식별 정보 (크기, 수정 시각, 내용 해시)"""
+    sha256 = hashlib.sha256()
+    with open(filename, 'rb') as file:
+        for block in iter(lambda: file.read(1024 * 1024), b''):
+            sha256.update(block)
+    stat = os.stat(filename)
+    return {'path': filename, 'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns, 'sha256': sha256.hexdigest()}
+
+
+def source_matches(fingerprint, filename):
+    """원본 파일이 캐시를 만들 때와 같은지 확인 - 크기/수정 시각이 같으면 통과, 시각만 다르면 해시로 확인"""
+    try:
+        stat = os.stat(filename)
+    except OSError:
+        return False
+    if fingerprint['path'] != filename or fingerprint['size'] != stat.st_size:
+        return False
+    if fingerprint['mtime_ns'] == stat.st_mtime_ns:
+        return True
+    return file_fingerprint(filename)['sha256'] == fingerprint['sha256']
+
+
+def save_columns_cache(name, sources, columns, cache_dir=PARTS_CACHE_DIR):
+    """컬럼 배열들을 .npy로 저장하고, 원본 파일 정보를 담은 manifest를 마지막에 기록
+    
+    기존 manifest를 먼저 지우므로 저장이 중간에 끊기면 캐시가 없는 상태가 되어 다음 실행에서 원본을 다시 읽는다.
+    컬럼 파일은 임시 파일에 쓴 뒤 교체해서, 이전 캐시를 메모리 매핑 중인 배열도 깨지지 않는다.
+    """
+    try:
+        target_dir = os.path.join(cache_dir, name)
+        os.makedirs(target_dir, exist_ok=True)
+        manifest_filename = os.path.join(target_dir, 'manifest.json')
+        if os.path.exists(manifest_filename):
+            os.remove(manifest_filename)
+        
+        for key, values in columns.items():
+            column_filename = os.path.join(target_dir, f'{key}.npy')
+            with open(column_filename + '.tmp', 'wb') as f:
+                np.save(f, np.asarray(values), allow_pickle=False)
+            os.replace(column_filename + '.tmp', column_filename)
+        
+        manifest = {
+            'version': CACHE_VERSION,
+            'columns': list(columns),
+            'sources': [file_fingerprint(filename) for filename in sources]
+        }
+        # manifest도 임시 파일에 쓴 뒤 교체 (반쯤 쓴 manifest가 남지 않도록)
+        with open(manifest_filename + '.tmp', 'w', encoding='utf-8') as f:
+            json.dump(manifest, f, indent=2, ensure_ascii=False)
+        os.replace(manifest_filename + '.tmp', manifest_filename)
+        return True
+    except Exception as e:
+        print(f'캐시 저장 중 오류 발생: {e}')
+        return False
+
+
+def load_columns_cache(name, sources, cache_dir=PARTS_CACHE_DIR):
+    """원본 파일이 그대로면 캐시된 컬럼을 메모리 매핑으로 반환, 아니면 None"""
+    target_dir = os.path.join(cache_dir, name)
+    try:
+        with open(os.path.join(target_dir, 'manifest.json'), 'r', encoding='utf-8') as f:
+            manifest = json.load(f)
+        
+        if manifest.get('version') != CACHE_VERSION or len(manifest['sources']) != len(sources):
+            return None
+        if not all(source_matches(fingerprint, filename) for fingerprint, filename in zip(manifest['sources'], sources)):
+            return None
+        
+        return {
+            key: np.load(os.path.join(target_dir, f'{key}.npy'), mmap_mode='r', allow_pickle=False)
+            for key in manifest['columns']
+        }
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        print(f'캐시 읽기 중 오류 발생 (원본에서 다시 읽음): {e}')
+        return None
+
+
 def filter_low_strength(averages, threshold=50):
     """평균값이 threshold보다 작은 항목만 필터링하는 함수"""
     try:
@@ -126,50 +503,50 @@ def display_array_info(array, name):
 
 def main():
     
-    # 1. 세 개의 CSV 파일을 NumPy로 읽기
-    files = [
-        'mars_base/mars_base_main_parts-001.csv',
-        'mars_base/mars_base_main_parts-002.csv',
-        'mars_base/mars_base_main_parts-003.csv'
-    ]
-    
-    all_parts_names = []
-    all_parts_strength = []
-    arrays = []
-    
-    for i, filename in enumerate(files, 1):
-        parts_names, parts_strength = read_csv_with_numpy(filename)
-        if parts_names is not None and parts_strength is not None:
-            all_parts_names.extend(parts_names)
-            all_parts_strength.extend(parts_strength)
-            
-            # 개별 배열 생성 (arr1, arr2, arr3)
-            arr = np.column_stack((parts_names, parts_strength))
-            arrays.append(arr)
-            
-            print(f'arr{i} 생성: {arr.shape}')
-    
-    if len(arrays) != 3: # 무조건 3개 읽어야 진행할 수 있게 처리함 (에러방지)
-        print('읽은 file length가 3이 아닙니다. 프로그램을 종료합니다.')
+    # 1. 부품 CSV 조각 파일을 모두 찾아서 병렬로 읽기 (조각별 통계도 함께 계산)
+    files = sorted(glob.glob(PARTS_PATTERN))
+    if not files:
+        print(f'{PARTS_PATTERN}에 해당하는 파일이 없습니다. 프로그램을 종료합니다.')
         return
     
-    arr1, arr2, arr3 = arrays
-    
-    # 2. 세 배열을 병합하여 parts ndarray 생성
-    parts = merge_arrays(arr1, arr2, arr3)
-    if parts is None:
-        print('배열 병합에 실패했습니다.') # 배열 병합 에러시 예외 처리
-        return
-    
-    display_array_info(parts, 'parts (병합된 배열)')
-    
-    # NumPy 배열에서 부품명과 강도 분리
-    parts_names_all = parts[:, 0]
-    parts_strength_all = parts[:, 1].astype(float) # astype로 csv 불러온 문자열 한꺼번에 float로 변환해버림
+    cache = load_columns_cache('parts', files)
+    if cache is not None:
+        # 원본이 그대로면 이전 실행에서 저장한 캐시를 메모리 매핑으로 바로 사용
+        parts, categories = cache['parts'], cache['categories'].tolist()
+        print(f'캐시에서 parts 배열 로드: {parts.shape} ({PARTS_CACHE_DIR})')
+        display_array_info(parts, 'parts (병합된 배열)')
+        
+        print('\n=== 항목별 평균값 계산 ===')
+        statistics = calculate_item_statistics(parts['part'], parts['strength'], categories)
+    else:
+        shards = ingest_parts_shards(files)
+        for i, (filename, arr, _, _) in enumerate(shards, 1):
+            print(f'arr{i} 생성: {arr.shape} ({filename})')
+        
+        if len(shards) != len(files):
+            print(f'{len(files) - len(shards)}개 파일을 읽지 못했습니다. 읽은 파일로만 계속합니다.')
+        if not shards:
+            print('읽은 파일이 없습니다. 프로그램을 종료합니다.')
+            return
+        
+        # 2. 조각 배열을 병합하여 parts ndarray 생성
+        parts, categories = merge_part_arrays([(arr, shard_categories) for _, arr, shard_categories, _ in shards])
+        if parts is None:
+            print('배열 병합에 실패했습니다.') # 배열 병합 에러시 예외 처리
+            return
+        
+        display_array_info(parts, 'parts (병합된 배열)')
+        
+        # 다음 실행을 위해 병합 결과를 캐시로 저장
+        save_columns_cache('parts', [filename for filename, _, _, _ in shards],
+                           {'parts': parts, 'categories': np.array(categories)})
+        
+        # 3. 항목별 평균값 계산 (조각별 통계를 병합, 전체 배열을 다시 훑지 않음)
+        print('\n=== 항목별 평균값 계산 ===')
+        statistics = merge_item_statistics([shard_statistics for _, _, _, shard_statistics in shards])
     
-    # 3. 항목별 평균값 계산
-    print('\n=== 항목별 평균값 계산 ===')
-    averages = calculate_item_averages(parts_names_all, parts_strength_all)
+    averages = dict(zip(statistics['parts'].tolist(), statistics['mean'].tolist()))
+    print(f'{len(averages)}개의 고유 부품에 대한 평균 계산 완료')
     
     # 평균값 출력 (처음 10개만)
     sorted_averages = sorted(averages.items(), key=lambda x: x[1])
@@ -213,5 +590,25 @@ def main():
             print(parts3[1][:10] if len(parts3[1]) > 10 else parts3[1])
 
 
+def main_streaming():
+    """메모리보다 큰 부품 데이터용 - 청크 단위 집계 후 parts_to_work_on.csv만 저장"""
+    files = sorted(glob.glob(PARTS_PATTERN))
+    if not files:
+        print(f'{PARTS_PATTERN}에 해당하는 파일이 없습니다. 프로그램을 종료합니다.')
+        return
+    
+    print(f'=== 스트리밍 집계: {len(files)}개 파일, {STREAM_CHUNK_ROWS}행 단위 ===')
+    statistics = stream_parts_statistics(files)
+    print(f'{len(statistics["parts"])}개의 고유 부품, 전체 {int(statistics["count"].sum())}행 집계 완료')
+    
+    averages = dict(zip(statistics['parts'].tolist(), statistics['mean'].tolist()))
+    filtered_items = filter_low_strength(averages, 50)
+    save_filtered_data(filtered_items, 'parts_to_work_on.csv')
+
+
 if __name__ == '__main__':
-    main()
+    # python prob3.py --stream 으로 실행하면 스트리밍 집계만 수행
+    if '--stream' in sys.argv[1:]:
+        main_streaming()
+    else:
+        main()
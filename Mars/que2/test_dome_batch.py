@@ -0,0 +1,45 @@
+import csv
+
+from dome_batch import read_csv_chunks, run_batch
+
+
+def read_output(path):
+    with open(path, newline='', encoding='utf-8') as file:
+        return list(csv.DictReader(file))
+
+
+def test_fast_path_keeps_input_number_text(tmp_path):
+    source = tmp_path / 'designs.csv'
+    source.write_text('diameter,material,thickness\n1.000,glass,2.50\n10,aluminum,1\n', encoding='utf-8')
+    output = tmp_path / 'out.csv'
+
+    stats = run_batch(str(source), str(output))
+    rows = read_output(output)
+    assert (stats['rows'], stats['invalid_rows']) == (2, 0)
+    assert [(row['diameter'], row['thickness']) for row in rows] == [('1.000', '2.50'), ('10', '1')]
+    assert rows[0]['area'] == '2.356'
+
+
+def test_misaligned_rows_use_csv_module(tmp_path):
+    source = tmp_path / 'designs.csv'
+    source.write_text('diameter,material,thickness\n3,glass,1,9\n4\n5,glass,1\n', encoding='utf-8')
+
+    row_numbers, diameters, materials, thicknesses = next(read_csv_chunks(str(source)))
+    assert row_numbers == [2, 3, 4]
+    assert list(diameters) == ['3', '4', '5']
+    assert list(materials) == ['glass', '', 'glass']
+    assert list(thicknesses) == ['1', '', '1']
+
+
+def test_quoted_fields_across_chunks(tmp_path):
+    source = tmp_path / 'designs.csv'
+    source.write_text('diameter,material,thickness\n3,glass,1\n4,"carbon\nsteel",2\n5,"glass",\n',
+                      encoding='utf-8')
+    output = tmp_path / 'out.csv'
+
+    stats = run_batch(str(source), str(output), chunk_size=2)
+    rows = read_output(output)
+    assert stats['rows'] == 3
+    assert [row['row'] for row in rows] == ['2', '3', '4']
+    assert rows[1]['material'] == 'carbon\nsteel' and rows[1]['error']
+    assert rows[2]['thickness'] == '1.0' and not rows[2]['error']
@@ -0,0 +1,72 @@
+import pytest
+
+import prob1
+
+INVENTORY_TEXT = (
+    'Substance,Weight (g/cm³),Specific Gravity,Strength,Flammability\n'
+    'A,1.000,2.50,High,0.70\n'
+    'B,bad,1,Low,0.1\n'
+    'C,1,2\n'
+    'D,Various,0.9000,Medium,0.95\n'
+)
+
+
+def write_inventory(tmp_path, text=INVENTORY_TEXT):
+    path = tmp_path / 'inventory.csv'
+    path.write_text(text, encoding='utf-8')
+    return str(path)
+
+
+def test_errors_are_reported_in_line_order(tmp_path):
+    errors = []
+    inventory = prob1.read_inventory_columns(write_inventory(tmp_path), error_sink=errors)
+    assert [line_number for line_number, _, _ in errors] == [3, 4]
+    assert '필드 개수 오류' in errors[1][2]
+    assert inventory['substance'] == ['A', 'D']
+
+
+def test_csv_export_keeps_original_number_text(tmp_path):
+    inventory = prob1.read_inventory_columns(write_inventory(tmp_path))
+    output = tmp_path / 'out.csv'
+    prob1.save_columns_to_csv(inventory, str(output))
+
+    # 무게/비중은 원래 표기 그대로, 인화성은 save_to_csv처럼 float 값으로
+    lines = output.read_text(encoding='utf-8').splitlines()
+    assert lines[1:] == ['A,1.000,2.50,High,0.7', 'D,Various,0.9000,Medium,0.95']
+
+    rows = prob1.columns_to_list(inventory)
+    legacy = tmp_path / 'legacy.csv'
+    prob1.save_to_csv(rows, str(legacy))
+    assert legacy.read_bytes() == output.read_bytes()
+
+
+def test_binary_round_trip(tmp_path):
+    inventory = prob1.read_inventory_columns(write_inventory(tmp_path))
+    filename = str(tmp_path / 'inventory.bin')
+    prob1.save_to_binary(inventory, filename)
+
+    loaded = prob1.load_from_binary(filename)
+    assert loaded['substance'] == ['A', 'D']
+    assert loaded['strength_label'] == ['High', 'Medium']
+    assert loaded['weight'][0] == 1.0 and loaded['weight'][1] != loaded['weight'][1]  # Various는 NaN
+    for key in ('specific_gravity', 'strength', 'flammability'):
+        assert loaded[key].tolist() == list(inventory[key])
+    # 라벨을 저장하지 않으므로 숫자를 다시 포맷해서 출력
+    row = prob1.columns_to_list(loaded)[1]
+    assert (row['weight'], row['specific_gravity']) == ('Various', '0.9')
+
+    assert list(prob1.load_from_binary(filename, columns=['flammability'])) == ['flammability']
+
+
+def test_binary_rejects_corrupt_files(tmp_path):
+    inventory = prob1.read_inventory_columns(write_inventory(tmp_path))
+    filename = tmp_path / 'inventory.bin'
+    prob1.save_to_binary(inventory, str(filename))
+    data = filename.read_bytes()
+
+    with pytest.raises(ValueError):
+        prob1.read_binary_directory(b'NOTMARS\0' + data[8:])
+    with pytest.raises(ValueError):
+        prob1.read_binary_directory(data[:len(data) // 2])  # 컬럼 범위가 파일 끝을 넘음
+    filename.write_bytes(data[:len(data) // 2])
+    assert prob1.load_from_binary(str(filename)) == {}
@@ -0,0 +1,123 @@
+import os
+
+import numpy as np
+import pytest
+
+from prob3 import (PartsStatisticsAccumulator, calculate_item_statistics, iter_parts_chunks, load_columns_cache,
+                   merge_item_statistics, parse_parts_text, read_parts_array, save_columns_cache)
+
+
+def random_parts(seed, rows=2000):
+    rng = np.random.default_rng(seed)
+    names = rng.choice(['Bolt', 'Gear', 'Hinge', 'Panel', 'Valve'], size=rows).tolist()
+    # 평균이 표준편차보다 훨씬 큰 값 - 제곱합 방식이면 자릿수 상쇄로 정밀도를 잃음
+    strengths = 1e6 + rng.normal(0, 0.5, size=rows)
+    return names, strengths
+
+
+def brute_force_statistics(names, strengths):
+    result = {}
+    for name in sorted(set(names)):
+        values = strengths[np.array(names) == name]
+        result[name] = (len(values), values.mean(), values.min(), values.max(), values.std())
+    return result
+
+
+def assert_statistics_equal(statistics, expected):
+    assert statistics['parts'].tolist() == list(expected)
+    for index, (count, mean, minimum, maximum, std) in enumerate(expected.values()):
+        assert statistics['count'][index] == count
+        assert statistics['min'][index] == minimum and statistics['max'][index] == maximum
+        assert statistics['mean'][index] == pytest.approx(mean, rel=1e-12)
+        assert statistics['std'][index] == pytest.approx(std, rel=1e-9)
+
+
+def test_parse_parts_text_rejects_misaligned_rows():
+    # 3필드 행 뒤의 1필드 행 - 전체 필드 수는 맞지만 행이 밀림
+    with pytest.raises(ValueError):
+        parse_parts_text('PartA,1,2\n3\n')
+
+
+def test_parse_parts_text_simple():
+    names, strengths = parse_parts_text('A,1.5\nB,2\n')
+    assert names == ['A', 'B']
+    assert strengths.tolist() == [1.5, 2.0]
+
+
+def test_malformed_row_falls_back_to_row_parser(tmp_path, capsys):
+    path = tmp_path / 'parts.csv'
+    path.write_text('part,strength\nPartA,1,2\n3\nPartB,4\n', encoding='utf-8')
+
+    parts, categories = read_parts_array(str(path))
+    assert [categories[code] for code in parts['part']] == ['PartB']
+    assert parts['strength'].tolist() == [4.0]
+    output = capsys.readouterr().out
+    assert '라인 2' in output and '라인 3' in output
+
+
+def test_chunked_reader_reports_file_line_numbers(tmp_path, capsys):
+    path = tmp_path / 'parts.csv'
+    path.write_text('part,strength\nA,1\nB,2\nC,x\nD,4\n', encoding='utf-8')
+
+    chunks = list(iter_parts_chunks(str(path), chunk_rows=2))
+    names = [name for chunk_names, _ in chunks for name in chunk_names]
+    strengths = np.concatenate([chunk_strengths for _, chunk_strengths in chunks])
+    assert names == ['A', 'B', 'D']
+    assert strengths.tolist() == [1.0, 2.0, 4.0]
+    assert '라인 4' in capsys.readouterr().out
+
+
+def test_accumulator_matches_brute_force():
+    names, strengths = random_parts(1)
+    accumulator = PartsStatisticsAccumulator()
+    bounds = [0, 1, 7, 500, 501, 1300, len(names)]  # 한 행짜리, 일부 부품만 있는 청크 포함
+    for start, end in zip(bounds, bounds[1:]):
+        accumulator.add_chunk(names[start:end], strengths[start:end])
+
+    assert_statistics_equal(accumulator.result(), brute_force_statistics(names, strengths))
+
+
+def test_merge_is_independent_of_order_and_grouping():
+    names, strengths = random_parts(2)
+    pieces = [(names[start:start + 300], strengths[start:start + 300]) for start in range(0, len(names), 300)]
+    statistics = [calculate_item_statistics(*piece) for piece in pieces]
+    expected = brute_force_statistics(names, strengths)
+
+    assert_statistics_equal(merge_item_statistics(statistics), expected)
+    assert_statistics_equal(merge_item_statistics(statistics[::-1]), expected)
+
+    # 집계기 둘을 따로 채운 뒤 병합 - 어느 쪽으로 병합해도 같은 결과
+    left, right = PartsStatisticsAccumulator(), PartsStatisticsAccumulator()
+    for index, piece in enumerate(pieces):
+        (left if index % 2 else right).add_chunk(*piece)
+    merged = PartsStatisticsAccumulator()
+    merged.merge(left)
+    merged.merge(right)
+    assert_statistics_equal(merged.result(), expected)
+    right.merge(left)
+    assert_statistics_equal(right.result(), expected)
+
+
+def test_columns_cache_round_trip_and_invalidation(tmp_path):
+    source = tmp_path / 'parts.csv'
+    source.write_text('part,strength\nA,1\n', encoding='utf-8')
+    cache_dir = str(tmp_path / 'cache')
+    columns = {'strength': np.array([1.0, 2.5]), 'part': np.array([0, 1], dtype=np.int32)}
+    assert save_columns_cache('parts', [str(source)], columns, cache_dir=cache_dir)
+
+    cached = load_columns_cache('parts', [str(source)], cache_dir=cache_dir)
+    assert {key: values.tolist() for key, values in cached.items()} == {'strength': [1.0, 2.5], 'part': [0, 1]}
+    del cached
+
+    # 수정 시각만 바뀌고 내용이 같으면 해시로 확인해서 그대로 사용
+    stat = os.stat(source)
+    os.utime(source, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10 ** 9))
+    assert load_columns_cache('parts', [str(source)], cache_dir=cache_dir) is not None
+
+    # 크기가 같아도 내용이 바뀌면 무효
+    source.write_text('part,strength\nB,1\n', encoding='utf-8')
+    os.utime(source, ns=(stat.st_atime_ns, stat.st_mtime_ns + 2 * 10 ** 9))
+    assert load_columns_cache('parts', [str(source)], cache_dir=cache_dir) is None
+    # 원본 개수가 다르거나 캐시가 없으면 무효
+    assert load_columns_cache('parts', [], cache_dir=cache_dir) is None
+    assert load_columns_cache('other', [str(source)], cache_dir=cache_dir) is None
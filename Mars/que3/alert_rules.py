@@ -0,0 +1,303 @@
+import bisect
+import collections
+import json
+import math
+import os
+
+# 설정 파일이 없을 때 쓰는 기본 규칙
+DEFAULT_RULES = {
+    'defaults': {'severity': 'warning', 'cooldown': 60, 'max_alerts_per_minute': 20},
+    'rules': [
+        {'name': 'oxygen_low', 'channel': 'mars_base_internal_oxygen', 'type': 'threshold',
+         'op': '<', 'value': 4.2, 'severity': 'critical'},
+        {'name': 'co2_high', 'channel': 'mars_base_internal_co2', 'type': 'hysteresis',
+         'direction': 'above', 'high': 0.095, 'low': 0.085},
+        {'name': 'internal_temperature_jump', 'channel': 'mars_base_internal_temperature', 'type': 'rate',
+         'window': 60, 'op': '>=', 'value': 8.0},
+        {'name': 'humidity_high_sustained', 'channel': 'mars_base_internal_humidity', 'type': 'sustained',
+         'op': '>', 'value': 59.0, 'duration': 30}
+    ]
+}
+
+RULE_TYPES = ('threshold', 'hysteresis', 'rate', 'sustained')
+
+_COMPARE = {
+    '>': lambda value, limit: value > limit,
+    '>=': lambda value, limit: value >= limit,
+    '<': lambda value, limit: value < limit,
+    '<=': lambda value, limit: value <= limit
+}
+
+
+class AlertRule:
+    """규칙 하나의 설정과 발생 상태"""
+
+    def __init__(self, config, defaults):
+        self.name = config['name']
+        self.channel = config['channel']
+        self.type = config['type']
+        self.severity = config.get('severity', defaults.get('severity', 'warning'))
+        self.cooldown = config.get('cooldown', defaults.get('cooldown', 0))
+        self.config = config
+        self.active = False
+        self.notified = False  # 발생 알림을 실제로 보냈는지 (보냈을 때만 해제 알림)
+        self.last_fired = None
+
+    def describe(self, value):
+        config = self.config
+        if self.type == 'threshold':
+            return f'{self.channel} {value} {config["op"]} {config["value"]}'
+        if self.type == 'hysteresis':
+            limit = config['high'] if config.get('direction', 'above') == 'above' else config['low']
+            return f'{self.channel} {value} (기준 {limit}, 해제 {config["low"]}~{config["high"]})'
+        if self.type == 'rate':
+            return f'{self.channel} {config["window"]}초 변화량 {value} {config["op"]} {config["value"]}'
+        return f'{self.channel} {value} {config["op"]} {config["value"]} {config["duration"]}초 이상 지속'
+
+
+class _ThresholdGroup:
+    """같은 채널/비교 연산자의 임계값 규칙 묶음 - 정렬된 임계값을 이진 탐색해서 바뀐 규칙만 찾음"""
+
+    def __init__(self, op, rules):
+        self.op = op
+        self.rules = sorted(rules, key=lambda rule: rule.config['value'])
+        self.limits = [rule.config['value'] for rule in self.rules]
+        # '>' 계열은 앞쪽(임계값이 작은 쪽) [:boundary]가, '<' 계열은 뒤쪽 [boundary:]가 발생 상태
+        self.above = op in ('>', '>=')
+        self.boundary = 0 if self.above else len(self.rules)
+
+    def update(self, value):
+        """새 값에서 상태가 바뀐 (규칙, 발생 여부) 목록"""
+        if self.op == '>':
+            boundary = bisect.bisect_left(self.limits, value)    # limit < value
+        elif self.op == '>=':
+            boundary = bisect.bisect_right(self.limits, value)   # limit <= value
+        elif self.op == '<':
+            boundary = bisect.bisect_right(self.limits, value)   # limit > value
+        else:
+            boundary = bisect.bisect_left(self.limits, value)    # limit >= value
+
+        previous = self.boundary
+        if boundary == previous:
+            return ()
+        self.boundary = boundary
+        low, high = min(previous, boundary), max(previous, boundary)
+        active = (boundary > previous) == self.above
+        return [(rule, active) for rule in self.rules[low:high]]
+
+
+class _HysteresisRule:
+    """high를 넘으면 발생, low 아래로 내려와야 해제 (below는 반대) - 기준 근처에서 깜박이지 않음"""
+
+    def __init__(self, rule):
+        self.rule = rule
+        self.high = rule.config['high']
+        self.low = rule.config['low']
+        if self.low > self.high:
+            raise ValueError(f'규칙 {rule.name}: low는 high보다 클 수 없습니다.')
+        self.above = rule.config.get('direction', 'above') == 'above'
+
+    def evaluate(self, timestamp, value):
+        if self.above:
+            return value > self.high if not self.rule.active else value >= self.low
+        return value < self.low if not self.rule.active else value <= self.high
+
+
+class _SustainedRule:
+    """조건이 duration초 이상 계속 참일 때 발생"""
+
+    def __init__(self, rule):
+        self.rule = rule
+        self.compare = _COMPARE[rule.config['op']]
+        self.limit = rule.config['value']
+        self.duration = rule.config['duration']
+        self.since = None
+
+    def evaluate(self, timestamp, value):
+        if not self.compare(value, self.limit):
+            self.since = None
+            return False
+        if self.since is None:
+            self.since = timestamp
+        return timestamp - self.since >= self.duration
+
+
+class _RateRule:
+    """window초 동안의 변화량(현재 값 - 구간 첫 값)을 임계값과 비교 - 채널/구간별 이력은 공유"""
+
+    def __init__(self, rule, history):
+        self.rule = rule
+        self.compare = _COMPARE[rule.config['op']]
+        self.limit = rule.config['value']
+        self.history = history
+
+    def evaluate(self, timestamp, value):
+        if len(self.history) < 2:
+            return False
+        return self.compare(value - self.history[0][1], self.limit)
+
+
+class AlertEngine:
+    """센서 샘플마다 규칙을 증분 평가해서 상태가 바뀐 규칙만 알림으로 내보내는 엔진
+
+    규칙은 생성할 때 한 번 채널별 평가 객체로 컴파일한다. 임계값 규칙은 채널/연산자별로 정렬해
+    이진 탐색하므로 규칙 수가 많아도 샘플당 비용이 거의 늘지 않는다. 발생/해제 전환 때만 알림을 만들고
+    (중복 제거), 규칙별 cooldown과 전체 분당 최대 알림 수로 알림 폭주를 막는다. 제한에 걸린 발생은
+    버리지 않고 대기시켰다가, 조건이 계속되는 동안 이후 샘플에서 제한이 풀리면 그때 알린다.
+    """
+
+    def __init__(self, config, channels):
+        defaults = config.get('defaults', {})
+        self.channels = list(channels)
+        self.max_alerts_per_minute = defaults.get('max_alerts_per_minute')
+        self.sent_times = collections.deque()
+        self.rules = []
+        self.evaluated = 0
+        self.fired = 0
+        self.suppressed = 0
+        self.pending = {}  # 발생했지만 제한에 걸려 아직 알리지 못한 규칙 -> 발생 시점 값 (먼저 걸린 순서)
+
+        names = set()
+        threshold_rules = collections.defaultdict(list)
+        self.channel_rules = [[] for _ in self.channels]  # 채널 번호 -> 임계값 외 평가 객체 목록
+        self.rate_histories = [{} for _ in self.channels]  # 채널 번호 -> {구간(초): deque((시각, 값))}
+        for rule_config in config.get('rules', []):
+            try:
+                self._compile(rule_config, defaults, names, threshold_rules)
+            except KeyError as e:
+                raise ValueError(f'규칙 {rule_config.get("name", "?")}: 필요한 항목이 없습니다: {e}') from None
+
+        self.threshold_groups = [[] for _ in self.channels]
+        for (channel, op), rules in threshold_rules.items():
+            self.threshold_groups[channel].append(_ThresholdGroup(op, rules))
+
+    def _compile(self, rule_config, defaults, names, threshold_rules):
+        """규칙 설정 하나를 검증하고 채널별 평가 객체로 변환"""
+        rule = AlertRule(rule_config, defaults)
+        if rule.name in names:
+            raise ValueError(f'규칙 이름이 중복됩니다: {rule.name}')
+        if rule.channel not in self.channels:
+            raise ValueError(f'규칙 {rule.name}: 알 수 없는 채널입니다: {rule.channel}')
+        if rule.type not in RULE_TYPES:
+            raise ValueError(f'규칙 {rule.name}: 지원하지 않는 종류입니다: {rule.type} (지원: {", ".join(RULE_TYPES)})')
+        if rule.type != 'hysteresis' and rule_config.get('op') not in _COMPARE:
+            raise ValueError(f'규칙 {rule.name}: 비교 연산자는 {", ".join(_COMPARE)} 중 하나여야 합니다.')
+        names.add(rule.name)
+        self.rules.append(rule)
+
+        channel = self.channels.index(rule.channel)
+        if rule.type == 'threshold':
+            threshold_rules[(channel, rule_config['op'])].append(rule)
+        elif rule.type == 'hysteresis':
+            self.channel_rules[channel].append(_HysteresisRule(rule))
+        elif rule.type == 'sustained':
+            self.channel_rules[channel].append(_SustainedRule(rule))
+        else:
+            history = self.rate_histories[channel].setdefault(rule_config['window'], collections.deque())
+            self.channel_rules[channel].append(_RateRule(rule, history))
+
+    def process(self, timestamp, values):
+        """샘플 하나 평가 - values는 채널 순서의 시퀀스 또는 채널 딕셔너리, 새 알림 목록 반환"""
+        if isinstance(values, dict):
+            values = [values.get(channel, math.nan) for channel in self.channels]
+        self.evaluated += 1
+
+        alerts = []
+        # 대기 중인 발생부터 다시 시도 (새 발생보다 먼저 걸린 쪽이 제한을 먼저 씀)
+        for rule, value in list(self.pending.items()):
+            if self._notify(rule, timestamp, value, alerts):
+                del self.pending[rule]
+        for channel, value in enumerate(values):
+            if value != value:  # NaN은 평가하지 않음
+                continue
+            for window, history in self.rate_histories[channel].items():
+                history.append((timestamp, value))
+                while history[0][0] < timestamp - window:
+                    history.popleft()
+            for group in self.threshold_groups[channel]:
+                for rule, active in group.update(value):
+                    self._transition(rule, active, timestamp, value, alerts)
+            for evaluator in self.channel_rules[channel]:
+                rule = evaluator.rule
+                active = evaluator.evaluate(timestamp, value)
+                if active != rule.active:
+                    if rule.type == 'rate':
+                        value_shown = round(value - evaluator.history[0][1], 4)
+                    else:
+                        value_shown = value
+                    self._transition(rule, active, timestamp, value_shown, alerts)
+        return alerts
+
+    def _transition(self, rule, active, timestamp, value, alerts):
+        """규칙 상태 전환 - 발생은 cooldown/전체 제한을 통과하면 알리고, 걸리면 대기 목록에 올림"""
+        rule.active = active
+        if not active:
+            self.pending.pop(rule, None)  # 알리기 전에 해제되면 발생/해제 모두 알리지 않음
+            if rule.notified:
+                rule.notified = False
+                alerts.append(self._alert(rule, 'resolved', timestamp, value))
+            return
+
+        if not self._notify(rule, timestamp, value, alerts):
+            self.suppressed += 1
+            self.pending[rule] = value
+
+    def _notify(self, rule, timestamp, value, alerts):
+        """cooldown과 분당 최대 알림 수를 확인하고 통과하면 발생 알림 추가 - 알렸으면 True"""
+        if rule.last_fired is not None and timestamp - rule.last_fired < rule.cooldown:
+            return False
+        if self.max_alerts_per_minute is not None:
+            while self.sent_times and self.sent_times[0] <= timestamp - 60:
+                self.sent_times.popleft()
+            if len(self.sent_times) >= self.max_alerts_per_minute:
+                return False
+            self.sent_times.append(timestamp)
+
+        rule.last_fired = timestamp
+        rule.notified = True
+        self.fired += 1
+        alerts.append(self._alert(rule, 'firing', timestamp, value))
+        return True
+
+    def _alert(self, rule, state, timestamp, value):
+        return {
+            'time': timestamp,
+            'rule': rule.name,
+            'channel': rule.channel,
+            'severity': rule.severity,
+            'state': state,
+            'value': value,
+            'message': rule.describe(value)
+        }
+
+    def active_rules(self):
+        return [rule.name for rule in self.rules if rule.active]
+
+    def stats(self):
+        return {
+            'rules': len(self.rules),
+            'evaluated': self.evaluated,
+            'fired': self.fired,
+            'suppressed': self.suppressed,
+            'active': len(self.active_rules()),
+            'pending': len(self.pending)
+        }
+
+
+def load_alert_config(filename):
+    """규칙 파일(JSON) 읽기 - 파일이 없거나 읽을 수 없으면 기본 규칙"""
+    if filename and os.path.exists(filename):
+        try:
+            with open(filename, 'r', encoding='utf-8') as f:
+                config = json.load(f)
+            if not isinstance(config, dict):
+                raise ValueError('최상위 값은 객체여야 합니다.')
+            return config
+        except (OSError, ValueError) as e:
+            print(f'알림 규칙 파일 읽기 오류 (기본 규칙 사용): {e}')
+    return DEFAULT_RULES
+
+
+def load_alert_engine(filename, channels):
+    """규칙 파일(JSON)로 알림 엔진 생성 - 파일이 없으면 기본 규칙 사용"""
+    return AlertEngine(load_alert_config(filename), channels)
@@ -0,0 +1,329 @@
+import asyncio
+import multiprocessing
+import queue
+import signal
+import threading
+import time
+
+import numpy as np
+
+from mission_settings import SETTINGS_POLL_INTERVAL
+from scheduler import ScheduledCollector
+from telemetry_bus import KIND_LOAD, KIND_SENSOR, TelemetryBus
+
+# 실행기 종류: single(스레드 하나에 스케줄러 하나), thread(수집기마다 스레드), process(수집기마다 프로세스
+# + 공유 메모리 버스 소비자), asyncio(이벤트 루프에서 수집기마다 태스크, 수집 함수는 스레드 풀에서 실행)
+EXECUTORS = ('single', 'thread', 'process', 'asyncio')
+
+# 정지 후 작업자가 남은 데이터를 비우고 끝날 때까지 기다리는 최대 시간 (초)
+SHUTDOWN_TIMEOUT = 10.0
+
+
+class CollectorRunner:
+    """MissionComputer 수집기(collectors())를 선택한 실행기로 실행하는 공통 실행 엔진
+
+    모든 실행기는 공유 정지 이벤트 하나로 멈춘다. 정지되면 작업자는 진행 중인 수집을 마치고
+    로그/출력/이력 저장소를 비운 뒤 스스로 끝나며, run()은 수집기별 실행 통계를 돌려준다.
+    """
+
+    def __init__(self, computer_factory, executor='single', collectors=None,
+                 shutdown_timeout=SHUTDOWN_TIMEOUT):
+        if executor not in EXECUTORS:
+            raise ValueError(f'지원하지 않는 실행기입니다: {executor} (지원: {", ".join(EXECUTORS)})')
+        self.computer_factory = computer_factory
+        self.executor = executor
+        self.collector_names = collectors
+        self.shutdown_timeout = shutdown_timeout
+        self.stop_event = multiprocessing.Event() if executor == 'process' else threading.Event()
+        # 작업자(스레드/프로세스)를 모두 띄운 뒤 설정 - 다른 스레드가 표준 입력을 읽는 중에 fork하면
+        # 자식 프로세스가 표준 입력 락에 걸려 멈추므로, 입력은 이 이벤트 이후에 읽음
+        self.started = threading.Event()
+        self.computer = None
+
+    def stop(self):
+        """정지 요청 - 어느 스레드(또는 시그널 핸들러)에서 불러도 됨"""
+        self.stop_event.set()
+        if self.computer is not None:
+            for scheduler in list(self.computer.schedulers):
+                scheduler.stop()
+
+    def run(self):
+        """정지될 때까지 현재 스레드에서 실행하고 {'executor', 'elapsed', 'collectors'} 통계 반환"""
+        start_time = time.monotonic()
+        if self.executor != 'process':
+            self.started.set()
+        try:
+            collectors = getattr(self, f'_run_{self.executor}')()
+        finally:
+            self.started.set()
+        return {
+            'executor': self.executor,
+            'elapsed': round(time.monotonic() - start_time, 3),
+            'collectors': collectors
+        }
+
+    def _select(self, collectors):
+        if self.collector_names is None:
+            return collectors
+        return {name: collectors[name] for name in self.collector_names}
+
+    def _run_single(self):
+        self.computer = self.computer_factory()
+        try:
+            return self.computer.run_collectors(self._select(self.computer.collectors()), self.stop_event)
+        finally:
+            self.computer.stop_system()
+
+    def _run_thread(self):
+        self.computer = self.computer_factory()
+        collectors = self._select(self.computer.collectors())
+        results = {}
+
+        def worker(name, spec, watch_settings):
+            try:
+                results.update(self.computer.run_collectors({name: spec}, self.stop_event, watch_settings,
+                                                            retime=False))
+            except Exception as e:
+                print(f'수집기 {name} 스레드 오류: {e}')
+
+        def retime(previous, current, changed):
+            # 설정을 확인한 스레드에서 한 번만 불림 - 실행 중인 스케줄러 전부에 반영 (set_interval은 락으로 보호)
+            self.computer.retime_schedulers(list(self.computer.schedulers), collectors, current, changed)
+
+        # 설정 파일 확인은 첫 번째 스레드의 스케줄러에서만, 주기 변경 구독은 실행기에서 한 번만
+        self.computer.settings_manager.subscribe(retime)
+        threads = [threading.Thread(target=worker, args=(name, spec, index == 0), name=f'collector-{name}')
+                   for index, (name, spec) in enumerate(collectors.items())]
+        for thread in threads:
+            thread.start()
+        try:
+            self.stop_event.wait()
+        finally:
+            self.stop()
+            for thread in threads:
+                thread.join()
+            self.computer.settings_manager.unsubscribe(retime)
+            self.computer.stop_system()
+        return results
+
+    def _run_asyncio(self):
+        self.computer = self.computer_factory()
+        collectors = dict(self._select(self.computer.collectors()))
+        collectors['settings'] = (self.computer.settings_manager.check, 'settings_poll_interval',
+                                  SETTINGS_POLL_INTERVAL)
+        try:
+            return asyncio.run(self._run_async(collectors))
+        finally:
+            self.computer.stop_system()
+
+    async def _run_async(self, collectors):
+        loop = asyncio.get_running_loop()
+        states = {name: ScheduledCollector(name, func, self.computer.settings.get(key, default), loop.time())
+                  for name, (func, key, default) in collectors.items()}
+        tasks = [asyncio.create_task(self._run_async_collector(states[name], key, default))
+                 for name, (_, key, default) in collectors.items()]
+        await asyncio.gather(*tasks)
+        return {name: state.stats() for name, state in states.items()}
+
+    async def _run_async_collector(self, collector, interval_key, default_interval):
+        """수집기 하나를 고정 주기로 실행 (CollectorScheduler와 같은 주기/건너뜀 규칙, 주기는 매번 설정에서 읽음)"""
+        loop = asyncio.get_running_loop()
+        while not self.stop_event.is_set():
+            now = loop.time()
+            if collector.next_run > now:
+                # 최대 0.5초 단위로 깨어나 정지 이벤트 확인
+                await asyncio.sleep(min(collector.next_run - now, 0.5))
+                continue
+
+            due = collector.next_run
+            collector.interval = self.computer.settings.get(interval_key, default_interval)
+            next_run = due + collector.interval
+            if next_run <= now:
+                skipped = int((now - due) // collector.interval)
+                collector.missed += skipped
+                next_run = due + (skipped + 1) * collector.interval
+            collector.next_run = next_run
+
+            collector.max_lag = max(collector.max_lag, now - due)
+            start_time = loop.time()
+            try:
+                # 수집 함수는 블로킹이므로 기본 스레드 풀에서 실행
+                await loop.run_in_executor(None, collector.func)
+            except Exception as e:
+                collector.errors += 1
+                print(f'수집기 {collector.name} 실행 오류: {e}')
+            collector.last_duration = loop.time() - start_time
+            collector.total_duration += collector.last_duration
+            collector.runs += 1
+
+    def _run_process(self):
+        # 부모 프로세스에서는 MissionComputer를 만들지 않고 클래스에 정의된 수집기 이름을 사용
+        names = list(self.collector_names or self.computer_factory.COLLECTORS)
+        bus = TelemetryBus(producers=len(names))
+        results = multiprocessing.Queue()
+        consumer_stop = multiprocessing.Event()  # 수집 프로세스가 모두 끝난 뒤에 설정 - 버스를 끝까지 비움
+
+        # 수집기마다 프로세스 하나 (생산자 번호도 하나씩), 소비자 프로세스 하나가 집계/저장
+        consumer = multiprocessing.Process(target=run_telemetry_consumer,
+                                           args=(self.computer_factory, bus.name, consumer_stop, results),
+                                           name='telemetry-consumer')
+        processes = [multiprocessing.Process(target=run_collector_process,
+                                             args=(self.computer_factory, bus.name, producer, name,
+                                                   self.stop_event, results),
+                                             name=f'collector-{name}')
+                     for producer, name in enumerate(names)]
+        stats = {}
+        try:
+            consumer.start()
+            for process in processes:
+                process.start()
+            self.started.set()
+            self.stop_event.wait()
+        finally:
+            self.stop_event.set()
+            deadline = time.monotonic() + self.shutdown_timeout
+            self._finish_processes(processes, results, stats, deadline)
+            consumer_stop.set()
+            self._finish_processes([consumer], results, stats, deadline)
+            bus.close()
+            bus.unlink()
+
+        # 통계를 보내지 못한 프로세스(오류로 죽었거나 제한 시간 초과)는 표에 따로 표시
+        missing = [name for name in names + ['telemetry_consumer'] if name not in stats]
+        if missing:
+            print(f'통계를 받지 못한 수집기: {", ".join(missing)}')
+            for name in missing:
+                stats[name] = {'error': '통계 없음'}
+        return stats
+
+    def _finish_processes(self, processes, results, stats, deadline):
+        """정지한 프로세스의 통계를 받고 종료를 기다림 - 제한 시간을 넘긴 경우에만 강제 종료"""
+        started = [process for process in processes if process.pid is not None]
+        # 결과를 먼저 받아야 큐에 쓰는 프로세스가 끝날 수 있음 - 제한 시간까지 프로세스 수만큼 받음
+        # (프로세스가 모두 끝난 뒤에 큐가 비면 더 올 결과가 없으므로 기다리지 않음)
+        pending = len(started)
+        while pending and time.monotonic() < deadline:
+            finished = not any(process.is_alive() for process in started)
+            try:
+                stats.update(results.get(timeout=0.1 if finished else
+                                         min(max(deadline - time.monotonic(), 0.0), 0.5)))
+                pending -= 1
+            except queue.Empty:
+                if finished:
+                    break
+        for process in started:
+            process.join(max(deadline - time.monotonic(), 0.1))
+            if process.is_alive():
+                print(f'{process.name} 프로세스가 {self.shutdown_timeout}초 안에 끝나지 않아 강제 종료합니다.')
+                process.terminate()
+                process.join()
+
+
+def run_collector_process(computer_factory, bus_name, producer, name, stop_event, results):
+    """수집 프로세스 - 텔레메트리 버스에 연결한 MissionComputer의 수집기 하나를 정지될 때까지 실행"""
+    signal.signal(signal.SIGINT, signal.SIG_IGN)  # Ctrl+C는 부모가 받아서 정지 이벤트로 전달
+    bus = TelemetryBus.attach(bus_name)
+    computer = computer_factory(telemetry=bus.writer(producer))
+    stats = {}
+    try:
+        collectors = computer.collectors()
+        stats = computer.run_collectors({name: collectors[name]}, stop_event)
+    finally:
+        computer.stop_system(announce=False)
+        # 프로세스마다 설정 파일을 따로 확인하므로 설정 확인 통계는 수집기 이름을 붙여 구분
+        if 'settings' in stats:
+            stats[f'settings ({name})'] = stats.pop('settings')
+        results.put(stats)
+        computer.telemetry = None  # 공유 메모리 뷰를 버려야 닫을 수 있음
+        bus.close()
+
+
+def run_telemetry_consumer(computer_factory, bus_name, stop_event, results=None, poll_interval=0.2):
+    """소비자 프로세스 - 버스의 센서 레코드를 모아 이동 통계/이력 저장소에 반영 (stop_event 후 남은 레코드까지)"""
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    bus = TelemetryBus.attach(bus_name)
+    reader = bus.reader()
+    computer = computer_factory()
+    received = {KIND_SENSOR: 0, KIND_LOAD: 0}
+    channel_count = len(computer.env_values)
+    start_time = time.monotonic()
+
+    def drain():
+        for records in reader.poll():
+            sensor_records = records[records['kind'] == KIND_SENSOR]
+            for sample_time, values in zip(sensor_records['time'].tolist(),
+                                           sensor_records['values'][:, :channel_count].tolist()):
+                computer.record_sensor_sample(sample_time, values)
+            received[KIND_SENSOR] += len(sensor_records)
+            received[KIND_LOAD] += int(np.count_nonzero(records['kind'] == KIND_LOAD))
+
+    try:
+        while not stop_event.is_set():
+            drain()
+            stop_event.wait(poll_interval)
+        drain()  # 정지 직전까지 쌓인 레코드 처리 (수집 프로세스는 이미 모두 끝남)
+    finally:
+        computer.stop_system(announce=False)
+        reader_stats = reader.stats()
+        print(f'텔레메트리 수신: 센서 {received[KIND_SENSOR]}건, 부하 {received[KIND_LOAD]}건, '
+              f'유실 {reader_stats["dropped"]}건')
+        if results is not None:
+            results.put({'telemetry_consumer': {
+                'sensor_records': received[KIND_SENSOR],
+                'load_records': received[KIND_LOAD],
+                'dropped': reader_stats['dropped'],
+                'elapsed': round(time.monotonic() - start_time, 3)
+            }})
+        reader = None
+        bus.close()
+
+
+def run_until_stopped(computer_factory, executor):
+    """실행기를 골라 실행 - 'q' 입력 또는 Ctrl+C로 정지하고 수집기별 통계 출력
+
+    실행 엔진은 작업 스레드에서 돌리고 메인 스레드는 입력만 받는다. Ctrl+C는 메인 스레드의
+    KeyboardInterrupt로 받아서 정지 이벤트로 바꾸므로, 작업자는 남은 데이터를 비우고 끝난다.
+    """
+    runner = CollectorRunner(computer_factory, executor)
+    result = {}
+
+    def engine():
+        try:
+            result.update(runner.run())
+        except Exception as e:
+            print(f'실행 오류: {e}')
+            runner.stop()
+
+    worker = threading.Thread(target=engine, name=f'runner-{executor}')
+    previous_handler = signal.signal(signal.SIGINT, signal.default_int_handler)
+    try:
+        worker.start()
+        runner.started.wait()
+        while not runner.stop_event.is_set():
+            user_input = input('시스템을 중지하려면 "q" 입력: ')
+            if user_input.lower() == 'q':
+                break
+    except KeyboardInterrupt:
+        print('\nCtrl+C로 수집을 정지합니다.')
+    except EOFError:
+        pass
+    finally:
+        runner.stop()
+        worker.join()
+        signal.signal(signal.SIGINT, previous_handler)
+
+    if result:
+        print_runner_stats(result)
+    return result
+
+
+def print_runner_stats(stats):
+    """수집기별 실행 통계 표 출력"""
+    print(f'=== 수집기 실행 통계 ({stats["executor"]}, {stats["elapsed"]}초) ===')
+    for name, collector in stats['collectors'].items():
+        if 'runs' in collector:
+            print(f'{name:<22} 실행 {collector["runs"]:>6}회  오류 {collector["errors"]:>4}  '
+                  f'건너뜀 {collector["missed"]:>4}  평균 {collector["avg_duration_ms"]:>9.3f}ms  '
+                  f'최대 지연 {collector["max_lag_ms"]:>9.3f}ms')
+        else:
+            print(f'{name:<22} ' + ', '.join(f'{key}={value}' for key, value in collector.items()))
@@ -0,0 +1,91 @@
+import datetime
+import os
+import platform
+import socket
+import threading
+import time
+
+import psutil
+
+# 하드웨어 변경(CPU/메모리 핫플러그) 확인 주기 (초)
+HOTPLUG_CHECK_INTERVAL = 300
+
+
+def _hardware_signature():
+    """하드웨어 변경 감지용 값 (논리 CPU 수, 전체 메모리) - 외부 명령 없이 가볍게 읽음"""
+    try:
+        memory_total = os.sysconf('SC_PHYS_PAGES') * os.sysconf('SC_PAGE_SIZE')
+    except (AttributeError, ValueError, OSError):
+        memory_total = psutil.virtual_memory().total
+    return os.cpu_count(), memory_total
+
+
+class HostInfoProvider:
+    """실행 중에 바뀌지 않는 호스트 정보를 한 번만 수집해서 재사용
+
+    platform.processor()는 외부 명령을 실행할 수 있어 매번 부르기엔 비싸다.
+    static()은 캐시된 값을 돌려주고, refresh()를 부르거나 hotplug_interval마다 확인한
+    CPU 수/메모리 크기가 바뀌었을 때만 다시 수집한다.
+    """
+
+    def __init__(self, hotplug_interval=HOTPLUG_CHECK_INTERVAL, clock=time.monotonic):
+        self.hotplug_interval = hotplug_interval
+        self.clock = clock
+        self.lock = threading.Lock()
+        self.refreshes = 0
+        self.refresh()
+
+    def refresh(self):
+        """정적 정보 다시 수집 (명시적 요청 또는 하드웨어 변경 시)"""
+        signature = _hardware_signature()
+        memory_total = psutil.virtual_memory().total
+        info = {
+            'operating_system': platform.system(),
+            'os_version': platform.version(),
+            'os_release': platform.release(),
+            'cpu_type': platform.processor() or platform.machine(),
+            'architecture': platform.machine(),
+            'cpu_cores': os.cpu_count(),
+            'cpu_physical_cores': psutil.cpu_count(logical=False),
+            'memory_size_gb': round(memory_total / (1024**3), 2),
+            'hostname': socket.gethostname(),
+            'python_version': platform.python_version(),
+            'boot_time': datetime.datetime.fromtimestamp(psutil.boot_time()).strftime('%Y-%m-%d %H:%M:%S'),
+            'collected_at': datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        }
+        with self.lock:
+            self.info = info
+            self.signature = signature
+            self.last_check = self.clock()
+            self.refreshes += 1
+        return dict(info)
+
+    def static(self):
+        """캐시된 정적 호스트 정보 (확인 주기가 지났으면 하드웨어 변경 여부만 가볍게 확인)"""
+        if self.hotplug_interval is not None and self.clock() - self.last_check >= self.hotplug_interval:
+            self.check_hotplug()
+        with self.lock:
+            return dict(self.info)
+
+    def check_hotplug(self):
+        """CPU 수나 메모리 크기가 바뀌었으면 다시 수집하고 True 반환"""
+        signature = _hardware_signature()
+        with self.lock:
+            self.last_check = self.clock()
+            changed = signature != self.signature
+        if changed:
+            self.refresh()
+        return changed
+
+
+_default_provider = None
+_default_lock = threading.Lock()
+
+
+def get_host_info_provider():
+    """프로세스 전체에서 공유하는 호스트 정보 제공자 (처음 요청할 때 수집)"""
+    global _default_provider
+    with _default_lock:
+        if _default_provider is None:
+            _default_provider = HostInfoProvider()
+        return _default_provider
@@ -0,0 +1,168 @@
+import heapq
+import os
+import time
+
+import psutil
+
+# 프로세스 목록은 비싸므로 이 주기(초)마다만 다시 훑고, 그 사이에는 직전 결과를 재사용
+PROCESS_SCAN_INTERVAL = 10.0
+TOP_PROCESSES = 5
+
+
+def _total_time(times):
+    """전체 CPU 시간 - 리눅스의 guest/guest_nice는 이미 user/nice에 포함되어 있으므로 빼서 중복 제거"""
+    return sum(times) - getattr(times, 'guest', 0.0) - getattr(times, 'guest_nice', 0.0)
+
+
+def _busy_time(times):
+    """CPU 시간 중 실제로 일한 시간 (idle/iowait 제외)"""
+    return _total_time(times) - times.idle - getattr(times, 'iowait', 0.0)
+
+
+def _percent(busy, total):
+    return round(100.0 * busy / total, 2) if total > 0 else 0.0
+
+
+class LoadSampler:
+    """틱마다 한 번의 스냅샷으로 시스템 부하를 계산하는 샘플러
+
+    CPU 사용률, 디스크/네트워크 속도는 직전 스냅샷과의 카운터 차이로 계산하므로 기다리지 않는다.
+    프로세스 상위 N개는 process_scan_interval초마다만 갱신해서 샘플러 자체 비용을 제한하고,
+    샘플 한 번에 걸린 시간과 CPU 시간을 결과에 함께 보고한다. 프로세스 목록은 첫 sample()에서야
+    처음 훑으므로(그때는 기준값만 잡아 CPU 사용률이 None) 샘플러를 만들기만 하는 쪽은 비용이 없다.
+    """
+
+    def __init__(self, top_n=TOP_PROCESSES, process_scan_interval=PROCESS_SCAN_INTERVAL, clock=time.monotonic):
+        self.top_n = top_n
+        self.process_scan_interval = process_scan_interval
+        self.clock = clock
+
+        self.samples = 0
+        self.total_duration = 0.0
+        self.process_scans = 0
+        self.last_scan = None  # 직전 프로세스 스캔 시각 (CPU 사용률 계산 기준)
+        self.next_scan = None
+        self.top_processes = {'cpu': [], 'memory': []}
+        self.process_cpu = {}  # (pid, 생성 시각) -> 직전 CPU 시간 합
+
+        # 기준 스냅샷 - 첫 sample()부터 바로 차이를 계산할 수 있게 함
+        self.last_time = self.clock()
+        self.last_cpu = psutil.cpu_times(percpu=True)
+        self.last_disk = psutil.disk_io_counters()
+        self.last_net = psutil.net_io_counters()
+
+    def sample(self):
+        """부하 스냅샷 1회 - 직전 sample() 이후의 평균 사용률/속도 반환"""
+        start_time = time.perf_counter()
+        start_cpu = time.process_time()
+
+        now = self.clock()
+        elapsed = max(now - self.last_time, 1e-9)
+        cpu = psutil.cpu_times(percpu=True)
+        memory = psutil.virtual_memory()
+        disk = psutil.disk_io_counters()
+        net = psutil.net_io_counters()
+
+        # 코어별/전체 CPU 사용률 (카운터 차이)
+        per_core = []
+        busy_sum = 0.0
+        total_sum = 0.0
+        for current, previous in zip(cpu, self.last_cpu):
+            busy = max(_busy_time(current) - _busy_time(previous), 0.0)
+            total = max(_total_time(current) - _total_time(previous), 0.0)
+            per_core.append(_percent(busy, total))
+            busy_sum += busy
+            total_sum += total
+
+        load_info = {
+            'cpu_usage_percent': _percent(busy_sum, total_sum),
+            'memory_usage_percent': round(memory.percent, 2),
+            'memory_available_gb': round(memory.available / (1024**3), 2),
+            'per_core_percent': per_core,
+            'load_average': self._load_average(),
+            'disk': self._disk_rates(disk, elapsed),
+            'network': self._network_rates(net, elapsed),
+            'top_processes': self._top_processes(now)
+        }
+
+        self.last_time = now
+        self.last_cpu = cpu
+        self.last_disk = disk
+        self.last_net = net
+
+        duration = time.perf_counter() - start_time
+        self.samples += 1
+        self.total_duration += duration
+        load_info['sampler'] = {
+            'duration_ms': round(duration * 1000, 3),
+            'cpu_time_ms': round((time.process_time() - start_cpu) * 1000, 3),
+            'avg_duration_ms': round(self.total_duration / self.samples * 1000, 3),
+            'process_scans': self.process_scans
+        }
+        return load_info
+
+    def _load_average(self):
+        """1/5/15분 평균 부하 (지원하지 않는 운영체제에서는 None)"""
+        try:
+            one, five, fifteen = os.getloadavg()
+        except (AttributeError, OSError):
+            return None
+        return {'1m': round(one, 2), '5m': round(five, 2), '15m': round(fifteen, 2)}
+
+    def _disk_rates(self, disk, elapsed):
+        if disk is None or self.last_disk is None:
+            return None
+        return {
+            'read_bytes_per_sec': round((disk.read_bytes - self.last_disk.read_bytes) / elapsed, 1),
+            'write_bytes_per_sec': round((disk.write_bytes - self.last_disk.write_bytes) / elapsed, 1),
+            'read_ops_per_sec': round((disk.read_count - self.last_disk.read_count) / elapsed, 1),
+            'write_ops_per_sec': round((disk.write_count - self.last_disk.write_count) / elapsed, 1)
+        }
+
+    def _network_rates(self, net, elapsed):
+        if net is None or self.last_net is None:
+            return None
+        return {
+            'sent_bytes_per_sec': round((net.bytes_sent - self.last_net.bytes_sent) / elapsed, 1),
+            'recv_bytes_per_sec': round((net.bytes_recv - self.last_net.bytes_recv) / elapsed, 1)
+        }
+
+    def _top_processes(self, now):
+        """CPU/메모리(RSS) 상위 N개 프로세스 - 스캔 주기가 안 됐으면 직전 결과 재사용"""
+        if self.top_n <= 0:
+            return self.top_processes
+        if self.next_scan is not None and now < self.next_scan:
+            return self.top_processes
+
+        elapsed = now - self.last_scan if self.last_scan is not None else None
+        process_cpu = {}
+        entries = []
+        for process in psutil.process_iter(['pid', 'name', 'create_time', 'cpu_times', 'memory_info']):
+            info = process.info
+            if info['cpu_times'] is None or info['memory_info'] is None:
+                continue  # 권한이 없거나 이미 종료된 프로세스
+            key = (info['pid'], info['create_time'])
+            cpu_time = info['cpu_times'].user + info['cpu_times'].system
+            process_cpu[key] = cpu_time
+
+            # 직전 스캔 이후 CPU 시간 증가분으로 사용률 계산 (새 프로세스는 다음 스캔부터)
+            previous = self.process_cpu.get(key)
+            cpu_percent = None
+            if elapsed and previous is not None:
+                cpu_percent = round(100.0 * (cpu_time - previous) / elapsed, 2)
+            entries.append((info['pid'], info['name'], cpu_percent, info['memory_info'].rss))
+
+        def to_dict(entry):
+            pid, name, cpu_percent, rss = entry
+            return {'pid': pid, 'name': name, 'cpu_percent': cpu_percent,
+                    'rss_mb': round(rss / (1024**2), 1)}
+
+        self.top_processes = {
+            'cpu': [to_dict(entry) for entry in heapq.nlargest(self.top_n, entries, key=lambda e: e[2] or 0.0)],
+            'memory': [to_dict(entry) for entry in heapq.nlargest(self.top_n, entries, key=lambda e: e[3])]
+        }
+        self.process_cpu = process_cpu
+        self.last_scan = now
+        self.next_scan = now + self.process_scan_interval
+        self.process_scans += 1
+        return self.top_processes
@@ -2,19 +2,38 @@ import random
 import json
 import time
 import datetime
-import platform
 import os
-import psutil
-import threading
 import multiprocessing
 import signal
 import sys
+import threading
+
+import numpy as np
+
+from alert_rules import AlertEngine, load_alert_config
+from collector_runner import run_until_stopped
+from host_info import get_host_info_provider
+from load_sampler import LoadSampler
+from mission_settings import SETTINGS_POLL_INTERVAL, SettingsManager
+from rolling_stats import DEFAULT_WINDOWS, RollingWindowStats
+from scheduler import CollectorScheduler
+from sensor_log_writer import get_log_writer
+from sensor_registry import SensorRegistry
+from sensor_simulator import SensorSimulator
+from telemetry_bus import KIND_LOAD, KIND_SENSOR
+from telemetry_sinks import SHOW_SETTINGS, ConsoleSink, build_sinks
+from timeseries_store import TimeSeriesStore
 
 
 class DummySensor:
     """더미 센서 클래스 - 테스트용 랜덤 데이터 생성"""
     
-    def __init__(self):
+    def __init__(self, log_filename='sensor_log.txt', simulator=None, log_options=None):
+        # 시뮬레이터를 주면 균등 난수 대신 드리프트/잡음/스파이크가 있는 시뮬레이터 값을 사용
+        self.simulator = simulator
+        # 로그는 파일별 공유 기록기가 모아서 백그라운드로 씀 (샘플마다 파일을 열고 닫지 않음)
+        # log_options는 기록기를 처음 만들 때만 적용 (fsync 정책, 파일 교체 크기/날짜, 이전 파일 수)
+        self.log_writer = get_log_writer(log_filename, **(log_options or {}))
         self.env_values = {
             'mars_base_internal_temperature': 0.0, # 화성 기지 내부 온도
             'mars_base_external_temperature': 0.0, # 화성 기지 외부 온도
@@ -26,6 +45,9 @@ class DummySensor:
 
     def set_env(self):
         """랜덤한 환경 데이터 생성"""
+        if self.simulator is not None:
+            self.env_values = self.simulator.next_sample()
+            return
         self.env_values = {
             'mars_base_internal_temperature': round(random.uniform(18, 30), 2), # (18~30도)
             'mars_base_external_temperature': round(random.uniform(0, 21), 2), # (0~21도)
@@ -39,16 +61,15 @@ class DummySensor:
         """환경 데이터 반환 및 로그 기록 (보너스)"""
         timestamp = datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')
         
-        # 로그 파일에 기록
+        # 로그 기록기에 넘기기 (파일 쓰기는 배치로 묶어서 백그라운드에서)
         try:
-            with open('sensor_log.txt', 'a', encoding='utf-8') as f:
-                log_entry = f"{timestamp}, {self.env_values['mars_base_internal_temperature']}, " \
-                           f"{self.env_values['mars_base_external_temperature']}, " \
-                           f"{self.env_values['mars_base_internal_humidity']}, " \
-                           f"{self.env_values['mars_base_external_illuminance']}, " \
-                           f"{self.env_values['mars_base_internal_co2']}, " \
-                           f"{self.env_values['mars_base_internal_oxygen']}\n"
-                f.write(log_entry)
+            log_entry = f"{timestamp}, {self.env_values['mars_base_internal_temperature']}, " \
+                       f"{self.env_values['mars_base_external_temperature']}, " \
+                       f"{self.env_values['mars_base_internal_humidity']}, " \
+                       f"{self.env_values['mars_base_external_illuminance']}, " \
+                       f"{self.env_values['mars_base_internal_co2']}, " \
+                       f"{self.env_values['mars_base_internal_oxygen']}\n"
+            self.log_writer.write(log_entry)
         except Exception as e:
             print(f'로그 기록 오류: {e}')
         
@@ -58,7 +79,27 @@ class DummySensor:
 class MissionComputer:
     """미션 컴퓨터 클래스"""
     
-    def __init__(self):
+    # 수집기: 이름 -> (수집 메소드 이름, 주기 설정 키, 기본 주기)
+    COLLECTORS = {
+        'system_info': ('collect_mission_computer_info', 'system_interval', 20),
+        'system_load': ('collect_mission_computer_load', 'system_interval', 20),
+        'sensor': ('collect_sensor_data', 'sensor_interval', 5)
+    }
+    
+    # 센서 로그 기록기 설정 키 -> SensorLogWriter 옵션 이름
+    LOG_SETTINGS = {
+        'log_fsync_policy': 'fsync_policy',
+        'log_fsync_interval': 'fsync_interval',
+        'log_rotate_bytes': 'rotate_bytes',
+        'log_rotate_daily': 'rotate_daily',
+        'log_backup_count': 'backup_count'
+    }
+    
+    # 시작할 때 한 번만 읽는 설정 - 실행 중에 바뀌면 재시작해야 적용된다고 알림
+    RESTART_SETTINGS = ('simulate', 'sinks', 'sensor_sources', 'sensor_poll_workers', 'sensor_poll_timeout',
+                        'history_dir', 'alert_rules_file', 'top_processes', *LOG_SETTINGS)
+    
+    def __init__(self, telemetry=None):
         self.env_values = {
             'mars_base_internal_temperature': 0.0,
             'mars_base_external_temperature': 0.0,
@@ -67,42 +108,202 @@ class MissionComputer:
             'mars_base_internal_co2': 0.0,
             'mars_base_internal_oxygen': 0.0
         }
-        self.ds = DummySensor() # DummySensor 클래스를 ds라는 이름으로 인스턴스(Instance)로 만듦
         self.running = True
-        self.env_history = []  # 5분 평균 계산용
         self.last_average_time = time.time()
+        self.schedulers = []  # 실행 중인 수집 스케줄러 (stop_system에서 함께 정지)
+        self.telemetry = telemetry  # 텔레메트리 버스 기록기 (멀티프로세스 모드 - 집계/저장은 소비자 프로세스에서)
         
         # 설정 파일 읽기 (보너스)
         self.load_settings()
-    
+        
+        # simulate 설정이 켜져 있으면 센서 값을 시뮬레이터로 생성 (같은 수집 경로로 부하 시험)
+        simulator = None
+        if self.settings.get('simulate', False):
+            simulator = SensorSimulator(rate=1.0 / self.settings.get('sensor_interval', 5))
+        # 센서 로그 기록기 옵션 (설정에 있는 것만 - 나머지는 기록기 기본값)
+        log_options = {option: self.settings[key] for key, option in self.LOG_SETTINGS.items() if key in self.settings}
+        self.ds = DummySensor(simulator=simulator, log_options=log_options) # DummySensor 클래스를 ds라는 이름으로 인스턴스(Instance)로 만듦
+        
+        # 여러 센서 소스 (sensor_sources: 개수 또는 소스 id 목록) - 스레드 풀로 동시에 읽음
+        self.sensor_registry = None
+        sources = self.settings.get('sensor_sources')
+        if sources:
+            source_ids = [f'module-{i + 1:03d}' for i in range(sources)] if isinstance(sources, int) else sources
+            self.sensor_registry = SensorRegistry(self.settings.get('sensor_poll_workers', 16),
+                                                  self.settings.get('sensor_poll_timeout', 2.0))
+            for source_id in source_ids:
+                source_simulator = None
+                if simulator is not None:
+                    source_simulator = SensorSimulator(rate=simulator.rate)
+                self.sensor_registry.register(source_id, DummySensor(simulator=source_simulator,
+                                                                     log_options=log_options))
+
+        self.rolling = None
+        self.rolling_lock = threading.Lock()  # 설정 변경으로 이동 통계를 다시 만드는 동안 추가/조회를 막음
+        self.history = None
+        self.alerts = None
+        self.source_history = {}  # 소스 id -> 이력 저장소 (여러 소스일 때 소스별 폴더)
+        self.source_alerts = {}  # 소스 id -> 경보 엔진 (소스마다 규칙 상태를 따로 유지)
+        if telemetry is None:
+            # 이동 통계 (1분/5분/1시간) - 가장 긴 구간을 담을 만큼만 링 버퍼에 보관
+            windows, capacity = self.rolling_layout(self.settings)
+            self.rolling = RollingWindowStats(self.env_values.keys(), windows, capacity)
 
+            # 센서 이력 저장소 (구간 조회/다운샘플용) - 블록 단위로 모아서 저장
+            self.history = TimeSeriesStore(self.settings.get('history_dir', 'sensor_history'))
+
+            # 경보 규칙 (파일이 없으면 기본 규칙) - 샘플마다 증분 평가
+            self.alert_config = load_alert_config(self.settings.get('alert_rules_file', 'alert_rules.json'))
+            self.alerts = AlertEngine(self.alert_config, self.env_values.keys())
+        
+        # 바뀌지 않는 호스트 정보는 시작할 때 한 번만 수집 (프로세스 안에서 공유)
+        self.host_info = get_host_info_provider()
+        
+        # 출력 대상 (기본은 화면 출력) - 설정의 sinks로 JSON Lines/이진 파일/유닉스 소켓 추가
+        try:
+            self.sinks = build_sinks(self.settings.get('sinks', ['console']))
+        except (OSError, ValueError, KeyError) as e:
+            print(f'출력 설정 오류 (화면 출력만 사용): {e}')
+            self.sinks = [ConsoleSink()]
+        
+        # 부하 샘플러 - 생성할 때 잡은 기준 카운터와의 차이로 계산하므로 수집 시 기다리지 않음
+        self.load_sampler = LoadSampler(top_n=self.settings.get('top_processes', 5))
+        
+        # 주기 외의 설정 변경 반영 (주기는 run_collectors의 스케줄러가 따로 맞춤)
+        self.settings_manager.subscribe(self.apply_settings)
     
     def load_settings(self):
-        """설정 파일 읽기 (보너스)"""
-        try:
-            if os.path.exists('setting.txt'):
-                with open('setting.txt', 'r', encoding='utf-8') as f:
-                    self.settings = json.load(f)
+        """설정 파일 읽기 (보너스) - 이후 파일이 바뀌면 수집기 실행 중에 다시 읽어서 적용"""
+        self.settings_manager = SettingsManager('setting.txt')
+    
+    def rolling_layout(self, settings):
+        """설정의 이동 통계 구간과, 가장 긴 구간을 담는 링 버퍼 크기
+        
+        이동 통계는 모든 소스를 합쳐서 집계하므로 주기마다 소스 수만큼 샘플이 들어온다.
+        """
+        windows = settings.get('rolling_windows') or DEFAULT_WINDOWS  # 비어 있으면 기본 구간
+        source_count = len(self.sensor_registry.sources) if self.sensor_registry is not None else 1
+        capacity = (int(max(windows.values()) / settings.get('sensor_interval', 5)) + 1) * max(source_count, 1)
+        return windows, capacity
+    
+    def apply_settings(self, previous, current, changed):
+        """설정 변경 콜백 - 이동 통계 구간/버퍼 크기를 다시 맞추고, 재시작이 필요한 설정은 알림"""
+        if self.rolling is not None and changed & {'rolling_windows', 'sensor_interval'}:
+            windows, capacity = self.rolling_layout(current)
+            with self.rolling_lock:
+                self.rolling = self.rolling.resized(windows, capacity)
+        
+        restart = sorted(changed.intersection(self.RESTART_SETTINGS))
+        if restart:
+            print(f'재시작해야 적용되는 설정입니다 (지금은 기존 값 사용): {", ".join(restart)}')
+    
+    @property
+    def settings(self):
+        """현재 설정 (읽기 전용 - 파일이 바뀌면 새 객체로 통째로 교체됨)"""
+        return self.settings_manager.current
+    
+    def collect_sensor_data(self):
+        """센서 데이터 1회 수집 및 출력"""
+        if self.sensor_registry is not None:
+            self.collect_registry_data()
+            return
+        
+        # 센서 값 가져오기
+        self.ds.set_env()
+        self.env_values = self.ds.get_env() # 1
+        
+        sample_time = time.time()
+        if self.telemetry is not None:
+            # 버스에 기록만 하고 집계/저장은 소비자 프로세스에 맡김
+            self.telemetry.write(KIND_SENSOR, list(self.env_values.values()), sample_time)
+        
+        # 출력 대상으로 내보내기 (화면에는 JSON 형태로 출력)
+        self.emit('sensor', sample_time, self.env_values) # 2
+        
+        if self.telemetry is None:
+            self.record_sensor_sample(sample_time, self.env_values)
+    
+    def collect_registry_data(self):
+        """등록된 모든 센서 소스를 동시에 1회 읽고, 소스 id를 붙여 출력/집계"""
+        for source_id, sample_time, values in self.sensor_registry.poll_all():
+            self.env_values = values
+            self.emit('sensor', sample_time, {'source': source_id, **values})
+            if self.telemetry is not None:
+                self.telemetry.write(KIND_SENSOR, list(values.values()), sample_time)
             else:
-                # 기본 설정 생성 (최초 생성시)
-                self.settings = {
-                    'show_system_info': True,
-                    'show_load_info': True,
-                    'show_sensor_data': True,
-                    'sensor_interval': 5,
-                    'system_interval': 20
-                }
-                with open('setting.txt', 'w', encoding='utf-8') as f:
-                    json.dump(self.settings, f, indent=2, ensure_ascii=False)
-        except Exception as e:
-            print(f'설정 파일 읽기 오류: {e}')
-            self.settings = {
-                'show_system_info': True,
-                'show_load_info': True,
-                'show_sensor_data': True,
-                'sensor_interval': 5,
-                'system_interval': 20
-            }
+                self.record_sensor_sample(sample_time, values, source_id)
+    
+    def record_sensor_sample(self, sample_time, values, source=None):
+        """센서 샘플 하나를 이동 통계와 이력 저장소에 반영 (values는 채널 딕셔너리 또는 채널 순서 값)
+        
+        이동 통계는 모든 소스를 합쳐서 집계하고, 이력과 경보 상태는 소스별로 따로 둔다.
+        """
+        # 이동 통계 갱신 (샘플당 일정한 비용) 및 이력 저장
+        with self.rolling_lock:
+            self.rolling.add(sample_time, values)
+        self.source_store(source).append(sample_time, values)
+        
+        # 경보 규칙 평가 (상태가 바뀐 규칙만 알림)
+        for alert in self.source_alert_engine(source).process(sample_time, values):
+            if source is not None:
+                alert['source'] = source
+                alert['message'] = f'[{source}] {alert["message"]}'
+            self.emit('alert', sample_time, alert)
+        
+        self.report_average_if_due()
+    
+    def record_sensor_batch(self, timestamps, values):
+        """샘플 배치를 collect_sensor_data와 같은 경로로 반영 (이력 저장은 한 번에, 출력/통계/경보는 샘플마다)
+        
+        timestamps는 (n,) epoch 초, values는 (n, 채널 수) 배열 - 시뮬레이터 배치 부하 시험용.
+        텔레메트리 모드에서는 버스에 기록하고 출력만 하며, 집계/저장은 소비자 프로세스에 맡긴다.
+        """
+        channels = list(self.env_values)
+        if self.history is not None:
+            self.history.append_many(timestamps, values)
+        for sample_time, row in zip(np.asarray(timestamps).tolist(), np.asarray(values).tolist()):
+            if self.telemetry is not None:
+                self.telemetry.write(KIND_SENSOR, row, sample_time)
+            self.emit('sensor', sample_time, dict(zip(channels, row)))
+            if self.rolling is not None:
+                with self.rolling_lock:
+                    self.rolling.add(sample_time, row)
+            if self.alerts is not None:
+                for alert in self.alerts.process(sample_time, row):
+                    self.emit('alert', sample_time, alert)
+        
+        if self.rolling is not None:
+            self.report_average_if_due()
+    
+    def source_store(self, source):
+        """소스의 이력 저장소 (소스가 없으면 기본 저장소, 있으면 history_dir/소스 id - 처음 쓸 때 생성)"""
+        if source is None:
+            return self.history
+        store = self.source_history.get(source)
+        if store is None:
+            store = TimeSeriesStore(os.path.join(self.settings.get('history_dir', 'sensor_history'), source))
+            self.source_history[source] = store
+        return store
+    
+    def source_alert_engine(self, source):
+        """소스의 경보 엔진 (같은 규칙, 소스별 상태)"""
+        if source is None:
+            return self.alerts
+        engine = self.source_alerts.get(source)
+        if engine is None:
+            engine = AlertEngine(self.alert_config, self.env_values.keys())
+            self.source_alerts[source] = engine
+        return engine
+    
+    def report_average_if_due(self):
+        """이동 통계 출력 주기가 됐으면 출력 (여러 소스면 소스 상태도 함께)"""
+        # 5분 평균 계산 (보너스)
+        current_time = time.time()
+        if current_time - self.last_average_time >= 20:  # 5분 = 300초
+            self.calculate_5min_average()
+            if self.sensor_registry is not None:
+                self.emit('sensor_health', current_time, self.sensor_registry.health())
+            self.last_average_time = current_time
     
     def get_sensor_data(self):
         """
@@ -113,123 +314,128 @@ class MissionComputer:
         3. 위의 두 가지 동작을 5초에 한번씩 반복한다.
         """
         print('=== 센서 데이터 모니터링 시작 ===')
-        
-        while self.running:
-            try:
-                # 센서 값 가져오기
-                self.ds.set_env()
-                self.env_values = self.ds.get_env() # 1
-                
-                # 히스토리 저장 (5분 평균용)
-                self.env_history.append({
-                    'timestamp': time.time(),
-                    'data': self.env_values.copy() # 2
-                })
-                
-                # JSON 형태로 출력
-                timestamp = datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-                output_data = {
-                    'timestamp': timestamp,
-                    'sensor_data': self.env_values # 2
-                }
-                
-                if self.settings.get('show_sensor_data', True):
-                    print(f'[센서 데이터] {json.dumps(output_data, indent=2, ensure_ascii=False)}') # 2
-                
-                # 5분 평균 계산 (보너스)
-                current_time = time.time()
-                if current_time - self.last_average_time >= 20:  # 5분 = 300초
-                    self.calculate_5min_average()
-                    self.last_average_time = current_time
-                
-                time.sleep(self.settings.get('sensor_interval', 5))
-                
-            except Exception as e:
-                print(f'센서 데이터 오류: {e}')
-                time.sleep(1)
+        self.run_collectors({'sensor': (self.collect_sensor_data, 'sensor_interval', 5)})
     
     def calculate_5min_average(self):
-        """5분 평균값 계산 (보너스)"""
-        if not self.env_history:
+        """구간별 이동 평균/최소/최대/표준편차 출력 (보너스)"""
+        with self.rolling_lock:
+            window_stats = self.rolling.stats()
+        if window_stats.get('5m') is None:
             return
         
-        current_time = time.time()
-        five_min_ago = current_time - 20
-        
-        # 5분 이내 데이터만 필터링
-        recent_data = [item for item in self.env_history if item['timestamp'] >= five_min_ago]
-        
-        if not recent_data:
-            return
-        
-        # 평균 계산
-        averages = {}
-        for key in self.env_values.keys():
-            values = [item['data'][key] for item in recent_data]
-            averages[key] = round(sum(values) / len(values), 2)
-        
-        timestamp = datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')
         average_output = {
-            'timestamp': timestamp,
-            'type': '5분_평균',
-            'averages': averages
+            'type': '이동_통계',
+            'windows': {
+                name: {
+                    key: {stat: round(value, 2) for stat, value in channel_stats.items()}
+                    for key, channel_stats in stats.items()
+                }
+                for name, stats in window_stats.items() if stats is not None
+            }
         }
         
-        print(f'[5분 평균] {json.dumps(average_output, indent=2, ensure_ascii=False)}')
-        
-        # 오래된 데이터 제거
-        self.env_history = recent_data
+        self.emit('average', time.time(), average_output)
+    
+    def collect_mission_computer_info(self):
+        """미션 컴퓨터 시스템 정보 출력 - 정적 정보는 캐시된 값 사용 (부하 같은 동적 값은 포함하지 않음)"""
+        self.emit('system_info', time.time(), self.host_info.static())
     
     def get_mission_computer_info(self):
         """미션 컴퓨터 시스템 정보 수집 (20초마다 반복)"""
-        while self.running:
+        self.run_collectors({'system_info': (self.collect_mission_computer_info, 'system_interval', 20)})
+    
+    def collect_mission_computer_load(self):
+        """미션 컴퓨터 부하 정보 1회 수집 및 출력 (사용률/속도는 기다리지 않고 직전 수집 이후 값)"""
+        sample_time = time.time()
+        load_info = self.load_sampler.sample()
+        
+        if self.telemetry is not None:
+            self.telemetry.write(KIND_LOAD, [load_info['cpu_usage_percent'], load_info['memory_usage_percent'],
+                                             load_info['memory_available_gb']], sample_time)
+        
+        self.emit('load', sample_time, load_info)
+    
+    def emit(self, kind, timestamp, data):
+        """출력 대상마다 레코드 하나 내보내기 - 화면 출력 여부(show_*) 설정은 사람이 보는 출력에만 적용"""
+        show = self.settings.get(SHOW_SETTINGS.get(kind), True)
+        for sink in self.sinks:
+            if sink.human and not show:
+                continue
             try:
-                system_info = {
-                    'timestamp': datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
-                    'system_info': {
-                        'operating_system': platform.system(),
-                        'os_version': platform.version(),
-                        'cpu_type': platform.processor() or platform.machine(),
-                        'cpu_cores': os.cpu_count(),
-                        'memory_size_gb': round(psutil.virtual_memory().total / (1024**3), 2)
-                    }
-                }
-                
-                if self.settings.get('show_system_info', True):
-                    print(f'[시스템 정보] {json.dumps(system_info, indent=2, ensure_ascii=False)}')
-                
-                time.sleep(self.settings.get('system_interval', 20)) # 20초마다 실행
-                
+                sink.emit(kind, timestamp, data)
             except Exception as e:
-                print(f'시스템 정보 수집 오류: {e}')
-                time.sleep(5)
+                print(f'출력 오류 ({type(sink).__name__}): {e}')
     
     def get_mission_computer_load(self):
         """미션 컴퓨터 부하 정보 수집 (20초마다 반복)"""
-        while self.running:
-            try:
-                load_info = {
-                    'timestamp': datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
-                    'load_info': {
-                        'cpu_usage_percent': round(psutil.cpu_percent(interval=1), 2),
-                        'memory_usage_percent': round(psutil.virtual_memory().percent, 2),
-                        'memory_available_gb': round(psutil.virtual_memory().available / (1024**3), 2)
-                    }
-                }
-                
-                if self.settings.get('show_load_info', True):
-                    print(f'[시스템 부하] {json.dumps(load_info, indent=2, ensure_ascii=False)}')
-                
-                time.sleep(self.settings.get('system_interval', 20)) # 20초마다 실행
-                
-            except Exception as e:
-                print(f'시스템 부하 수집 오류: {e}')
-                time.sleep(5)
+        self.run_collectors({'system_load': (self.collect_mission_computer_load, 'system_interval', 20)})
+    
+    def collectors(self):
+        """스케줄러에 등록할 수집기 목록 - {이름: (수집 함수, 주기 설정 키, 기본 주기)}"""
+        return {name: (getattr(self, method_name), interval_key, default_interval)
+                for name, (method_name, interval_key, default_interval) in self.COLLECTORS.items()}
+    
+    def run_collectors(self, collectors=None, stop_event=None, watch_settings=True, retime=True):
+        """수집기들을 스케줄러 하나로 고정 주기 실행 (running이 False가 되거나 stop_event가 설정될 때까지 현재 스레드에서)
+        
+        watch_settings가 False면 설정 파일 확인은 다른 스케줄러에 맡기고, retime이 False면 주기 변경도
+        호출한 쪽이 retime_schedulers로 한꺼번에 맞춤 (스레드마다 구독하지 않도록)
+        """
+        if collectors is None:
+            collectors = self.collectors()
+        
+        scheduler = CollectorScheduler()
+        for name, (func, interval_key, default_interval) in collectors.items():
+            scheduler.add(name, func, self.settings.get(interval_key, default_interval))
+        
+        # 설정 파일 변경 확인도 같은 스케줄러에서 실행하고, 주기 설정이 바뀌면 재시작 없이 다시 맞춤
+        if watch_settings:
+            scheduler.add('settings', self.settings_manager.check,
+                          self.settings.get('settings_poll_interval', SETTINGS_POLL_INTERVAL))
+        
+        def retime_own(previous, current, changed):
+            self.retime_schedulers([scheduler], collectors, current, changed)
+        
+        if retime:
+            self.settings_manager.subscribe(retime_own)
+        self.schedulers.append(scheduler)
+        try:
+            scheduler.run(lambda: self.running and (stop_event is None or not stop_event.is_set()))
+        finally:
+            self.schedulers.remove(scheduler)
+            self.settings_manager.unsubscribe(retime_own)
+        return scheduler.stats()
+    
+    def retime_schedulers(self, schedulers, collectors, current, changed):
+        """바뀐 주기 설정을 스케줄러들에 반영 - 없는 수집기 이름은 무시하고, 주기는 스케줄러 락 안에서 바뀜"""
+        for scheduler in schedulers:
+            for name, (_, interval_key, default_interval) in collectors.items():
+                if interval_key in changed:
+                    scheduler.set_interval(name, current.get(interval_key, default_interval))
+            if 'settings_poll_interval' in changed:
+                scheduler.set_interval('settings', current.get('settings_poll_interval', SETTINGS_POLL_INTERVAL))
     
-    def stop_system(self):
-        """시스템 정지"""
+    def stop_system(self, announce=True):
+        """시스템 정지 - 진행 중인 로그/출력/이력 데이터를 모두 비우고 출력 대상을 닫음"""
         self.running = False
-        print('System stoped….')
+        for scheduler in list(self.schedulers):
+            scheduler.stop()
+        if self.sensor_registry is not None:
+            self.sensor_registry.shutdown()
+        self.ds.log_writer.flush()
+        # 출력 대상은 비우고 닫음 (파일/소켓 반환) - 목록을 먼저 비워서 두 번 불려도 다시 닫지 않음
+        sinks, self.sinks = self.sinks, []
+        for sink in sinks:
+            try:
+                sink.close()
+            except Exception as e:
+                print(f'출력 닫기 오류 ({type(sink).__name__}): {e}')
+        if self.history is not None:
+            self.history.flush()
+        for store in self.source_history.values():
+            store.flush()
+        if announce:
+            print('System stoped….')
 
 
 def signal_handler(signum, frame):
@@ -238,77 +444,6 @@ def signal_handler(signum, frame):
     sys.exit(0)
 
 
-def run_multithread():
-    """멀티스레드 실행"""
-    print('=== 멀티스레드 모드 시작 ===')
-    
-    RunComputer = MissionComputer() # MissionComputer 클래스를 RunComputer 라는 이름으로 인스턴스화
-    
-    # 스레드 생성 - 기존 메소드 사용
-    thread1 = threading.Thread(target=RunComputer.get_mission_computer_info, daemon=True)
-    thread2 = threading.Thread(target=RunComputer.get_mission_computer_load, daemon=True)
-    thread3 = threading.Thread(target=RunComputer.get_sensor_data, daemon=True)
-    
-    # 스레드 시작
-    thread1.start()
-    thread2.start()
-    thread3.start()
-    
-    try:
-        # 메인 스레드에서 키 입력 대기
-        while True:
-            user_input = input('시스템을 중지하려면 "q" 입력: ')
-            if user_input.lower() == 'q':
-                RunComputer.stop_system()
-                break
-    except Exception as e:
-        print(f'오류 발생: {e}')
-    
-    print('멀티스레드 실행 완료')
-
-
-def run_multiprocess():
-    """멀티프로세스 실행"""
-    print('=== 멀티프로세스 모드 시작 ===')
-    
-    # MissionComputer를 RunComputer1, RunComputer2, RunComputer3으로 인스턴스화
-    RunComputer1 = MissionComputer()
-    RunComputer2 = MissionComputer()
-    RunComputer3 = MissionComputer()
-    
-    # 각각을 별도 프로세스로 실행 - 기존 메소드 사용
-    process1 = multiprocessing.Process(target=RunComputer1.get_mission_computer_info)
-    process2 = multiprocessing.Process(target=RunComputer2.get_mission_computer_load)
-    process3 = multiprocessing.Process(target=RunComputer3.get_sensor_data)
-    
-    try:
-        # 프로세스 시작
-        process1.start()
-        process2.start()
-        process3.start()
-        
-        # 키 입력 대기
-        while True:
-            user_input = input('시스템을 중지하려면 "q" 입력: ')
-            if user_input.lower() == 'q':
-                print('System stoped….')
-                break
-    
-    except Exception as e:
-        print(f'오류 발생: {e}')
-    finally:
-        # 프로세스 종료
-        process1.terminate()
-        process2.terminate()
-        process3.terminate()
-        
-        process1.join()
-        process2.join()
-        process3.join()
-        
-        print('멀티프로세스 실행 완료')
-
-
 def test_dummy_sensor():
     """더미 센서 테스트"""
     print('=== 더미 센서 테스트 ===')
@@ -330,126 +465,34 @@ def main():
     print('2. 싱글 스레드 실행')
     print('3. 멀티 스레드 실행')
     print('4. 멀티 프로세스 실행')
-    print('5. 종료')
+    print('5. asyncio 실행')
+    print('6. 종료')
     
     while True:
         try:
-            choice = input('\n선택하세요 (1-5): ').strip()
+            choice = input('\n선택하세요 (1-6): ').strip()
             
             if choice == '1':
                 test_dummy_sensor()
                 
             elif choice == '2':
-                RunComputer = MissionComputer()
                 print('싱글 스레드 모드 - q로 종료 또는 Ctrl+C')
-                
-                # 시스템 정보 및 부하 지속 출력 (20초마다 반복)
-                print('시스템 정보 및 부하 모니터링 시작 (20초마다 반복, q 또는 Ctrl+C로 종료)')
-                
-                # q 입력 감지를 위한 백그라운드 입력 스레드
-                def _single_input_listener():
-                    try:
-                        while RunComputer.running:
-                            user_input = input('시스템을 중지하려면 "q" 입력: ')
-                            if user_input.lower() == 'q':
-                                RunComputer.stop_system()
-                                break
-                    except Exception as e:
-                        print(f'오류 발생: {e}')
-
-                threading.Thread(target=_single_input_listener, daemon=True).start()
-                
-                # 시스템 정보 및 부하를 별도 스레드로 실행
-                def _system_monitor():
-                    try:
-                        while RunComputer.running:
-                            # 시스템 정보 출력
-                            if RunComputer.settings.get('show_system_info', True):
-                                system_info = {
-                                    'timestamp': datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
-                                    'system_info': {
-                                        'operating_system': platform.system(),
-                                        'os_version': platform.version(),
-                                        'cpu_type': platform.processor() or platform.machine(),
-                                        'cpu_cores': os.cpu_count(),
-                                        'memory_size_gb': round(psutil.virtual_memory().total / (1024**3), 2)
-                                    }
-                                }
-                                print(f'[시스템 정보] {json.dumps(system_info, indent=2, ensure_ascii=False)}')
-                            
-                            time.sleep(RunComputer.settings.get('system_interval', 20))
-                    except Exception as e:
-                        print(f'시스템 정보 모니터링 오류: {e}')
-                
-                def _load_monitor():
-                    try:
-                        while RunComputer.running:
-                            # 시스템 부하 출력
-                            if RunComputer.settings.get('show_load_info', True):
-                                load_info = {
-                                    'timestamp': datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
-                                    'load_info': {
-                                        'cpu_usage_percent': round(psutil.cpu_percent(interval=1), 2),
-                                        'memory_usage_percent': round(psutil.virtual_memory().percent, 2),
-                                        'memory_available_gb': round(psutil.virtual_memory().available / (1024**3), 2)
-                                    }
-                                }
-                                print(f'[시스템 부하] {json.dumps(load_info, indent=2, ensure_ascii=False)}')
-                            
-                            time.sleep(RunComputer.settings.get('system_interval', 20))
-                    except Exception as e:
-                        print(f'시스템 부하 모니터링 오류: {e}')
-                
-                # 시스템 모니터링 스레드 시작
-                threading.Thread(target=_system_monitor, daemon=True).start()
-                threading.Thread(target=_load_monitor, daemon=True).start()
-                
-                # 센서 데이터 지속 출력 (5초마다 반복)
-                print('센서 데이터 모니터링 시작 (5초마다 반복)')
-                try:
-                    while RunComputer.running:
-                        # 센서 값 가져오기
-                        RunComputer.ds.set_env()
-                        RunComputer.env_values = RunComputer.ds.get_env()
-                        
-                        # 히스토리 저장 (5분 평균용)
-                        RunComputer.env_history.append({
-                            'timestamp': time.time(),
-                            'data': RunComputer.env_values.copy()
-                        })
-                        
-                        # JSON 형태로 출력
-                        timestamp = datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-                        output_data = {
-                            'timestamp': timestamp,
-                            'sensor_data': RunComputer.env_values
-                        }
-                        
-                        if RunComputer.settings.get('show_sensor_data', True):
-                            print(f'[센서 데이터] {json.dumps(output_data, indent=2, ensure_ascii=False)}')
-                        
-                        # 5분 평균 계산 (보너스)
-                        current_time = time.time()
-                        if current_time - RunComputer.last_average_time >= 20:  # 5분 = 300초
-                            RunComputer.calculate_5min_average()
-                            RunComputer.last_average_time = current_time
-                        
-                        time.sleep(RunComputer.settings.get('sensor_interval', 5))
-                        
-                except KeyboardInterrupt:
-                    print('\nCtrl+C로 프로그램을 종료합니다.')
-                    RunComputer.stop_system()
-                except Exception as e:
-                    print(f'센서 데이터 오류: {e}')
-                    RunComputer.stop_system()
+                run_until_stopped(MissionComputer, 'single')
                 
             elif choice == '3':
-                run_multithread()
+                print('=== 멀티스레드 모드 시작 ===')
+                run_until_stopped(MissionComputer, 'thread')
                 
             elif choice == '4':
-                run_multiprocess()
+                # 수집 프로세스가 공유 메모리 버스에 쓰고 소비자 프로세스 1개가 집계
+                print('=== 멀티프로세스 모드 시작 ===')
+                run_until_stopped(MissionComputer, 'process')
                 
             elif choice == '5':
+                print('=== asyncio 모드 시작 ===')
+                run_until_stopped(MissionComputer, 'asyncio')
+                
+            elif choice == '6':
                 print('프로그램을 종료합니다.')
                 break
                 
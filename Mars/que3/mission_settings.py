@@ -0,0 +1,153 @@
+import json
+import os
+import threading
+import types
+
+from sensor_log_writer import FSYNC_POLICIES
+
+# 설정 파일이 없을 때 만드는 기본 설정
+DEFAULT_SETTINGS = {
+    'show_system_info': True,
+    'show_load_info': True,
+    'show_sensor_data': True,
+    'sensor_interval': 5,
+    'system_interval': 20
+}
+
+# 값 종류 검증 규칙 (목록에 없는 키는 그대로 둠)
+BOOL_KEYS = ('show_system_info', 'show_load_info', 'show_sensor_data')
+INTERVAL_KEYS = ('sensor_interval', 'system_interval', 'settings_poll_interval', 'log_fsync_interval')
+
+# 설정 파일 변경 확인 주기 (초)
+SETTINGS_POLL_INTERVAL = 2.0
+
+
+def validate_settings(raw):
+    """설정 딕셔너리 검증 - 기본값을 채운 새 딕셔너리 반환, 잘못된 값이면 ValueError"""
+    if not isinstance(raw, dict):
+        raise ValueError('설정 파일은 JSON 객체여야 합니다.')
+
+    settings = dict(DEFAULT_SETTINGS)
+    settings.update(raw)
+    for key in BOOL_KEYS:
+        if not isinstance(settings[key], bool):
+            raise ValueError(f'{key}는 true/false여야 합니다: {settings[key]!r}')
+    for key in INTERVAL_KEYS:
+        if key in settings:
+            value = settings[key]
+            if isinstance(value, bool) or not isinstance(value, (int, float)) or value <= 0:
+                raise ValueError(f'{key}는 0보다 큰 숫자여야 합니다: {value!r}')
+    windows = settings.get('rolling_windows')
+    if windows is not None:
+        if not isinstance(windows, dict) or not windows or any(
+                isinstance(seconds, bool) or not isinstance(seconds, (int, float)) or seconds <= 0
+                for seconds in windows.values()):
+            raise ValueError(f'rolling_windows는 {{이름: 초}} 형식이어야 합니다: {windows!r}')
+    # 센서 로그 기록기 옵션 (없으면 기록기 기본값)
+    if 'log_fsync_policy' in settings and settings['log_fsync_policy'] not in FSYNC_POLICIES:
+        raise ValueError(f'log_fsync_policy는 {", ".join(FSYNC_POLICIES)} 중 하나여야 합니다: '
+                         f'{settings["log_fsync_policy"]!r}')
+    if 'log_rotate_daily' in settings and not isinstance(settings['log_rotate_daily'], bool):
+        raise ValueError(f'log_rotate_daily는 true/false여야 합니다: {settings["log_rotate_daily"]!r}')
+    rotate_bytes = settings.get('log_rotate_bytes')
+    if rotate_bytes is not None and (isinstance(rotate_bytes, bool) or not isinstance(rotate_bytes, int)
+                                     or rotate_bytes <= 0):
+        raise ValueError(f'log_rotate_bytes는 0보다 큰 정수(바이트) 또는 null이어야 합니다: {rotate_bytes!r}')
+    if 'log_backup_count' in settings:
+        backup_count = settings['log_backup_count']
+        if isinstance(backup_count, bool) or not isinstance(backup_count, int) or backup_count < 1:
+            raise ValueError(f'log_backup_count는 1 이상의 정수여야 합니다: {backup_count!r}')
+    sources = settings.get('sensor_sources')
+    if sources is not None:
+        if isinstance(sources, bool) or not isinstance(sources, (int, list)) or (
+                isinstance(sources, int) and sources < 0) or (
+                isinstance(sources, list) and (not all(isinstance(item, str) and item for item in sources)
+                                               or len(set(sources)) != len(sources))):
+            raise ValueError(f'sensor_sources는 소스 개수 또는 서로 다른 소스 id 목록이어야 합니다: {sources!r}')
+    return settings
+
+
+class SettingsManager:
+    """설정 파일을 읽어 읽기 전용 설정 객체로 제공하고, 파일이 바뀌면 검증 후 통째로 교체
+
+    current는 항상 완성된 읽기 전용 매핑을 가리키므로, 읽는 쪽은 락 없이 참조만 가져가면 된다.
+    check()는 파일 수정 시각/크기로 변경을 감지하고(inotify 대신 가벼운 폴링),
+    새 설정이 잘못됐으면 기존 설정을 유지한다. 바뀐 키는 subscribe한 콜백으로 알린다.
+    """
+
+    def __init__(self, filename='setting.txt'):
+        self.filename = filename
+        self.lock = threading.Lock()
+        self.listeners = []
+        self.reloads = 0
+        self.errors = 0
+        self.signature = None
+        self.current = types.MappingProxyType(dict(DEFAULT_SETTINGS))
+        self._load_initial()
+
+    def _load_initial(self):
+        """처음 읽기 - 파일이 없으면 기본 설정으로 만들고, 읽기 실패면 기본 설정 사용 (기존 동작)"""
+        try:
+            if not os.path.exists(self.filename):
+                # 기본 설정 생성 (최초 생성시)
+                with open(self.filename, 'w', encoding='utf-8') as f:
+                    json.dump(DEFAULT_SETTINGS, f, indent=2, ensure_ascii=False)
+            self.signature = self._file_signature()
+            self.current = types.MappingProxyType(self._read())
+        except Exception as e:
+            print(f'설정 파일 읽기 오류: {e}')
+
+    def _file_signature(self):
+        try:
+            stat = os.stat(self.filename)
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
+    def _read(self):
+        with open(self.filename, 'r', encoding='utf-8') as f:
+            return validate_settings(json.load(f))
+
+    def subscribe(self, callback):
+        """설정이 바뀔 때 callback(이전 설정, 새 설정, 바뀐 키 집합) 호출"""
+        with self.lock:
+            self.listeners.append(callback)
+
+    def unsubscribe(self, callback):
+        with self.lock:
+            if callback in self.listeners:
+                self.listeners.remove(callback)
+
+    def check(self):
+        """파일이 바뀌었으면 다시 읽어서 교체 - 교체했으면 True"""
+        signature = self._file_signature()
+        if signature is None or signature == self.signature:
+            return False
+
+        with self.lock:
+            if signature == self.signature:
+                return False  # 다른 스레드가 먼저 처리함
+            self.signature = signature
+            try:
+                settings = self._read()
+            except (OSError, ValueError) as e:
+                # 쓰는 도중이거나 잘못된 설정 - 기존 설정 유지
+                self.errors += 1
+                print(f'설정 파일 다시 읽기 오류 (기존 설정 유지): {e}')
+                return False
+
+            previous = self.current
+            changed = {key for key in set(previous) | set(settings) if previous.get(key) != settings.get(key)}
+            if not changed:
+                return False
+            self.current = types.MappingProxyType(settings)
+            self.reloads += 1
+            listeners = list(self.listeners)
+
+        print(f'설정 변경 적용: {", ".join(sorted(changed))}')
+        for callback in listeners:
+            try:
+                callback(previous, self.current, changed)
+            except Exception as e:
+                print(f'설정 변경 알림 오류: {e}')
+        return True
@@ -0,0 +1,153 @@
+import collections
+import math
+
+import numpy as np
+
+# 기본 이동 통계 구간 (이름: 초)
+DEFAULT_WINDOWS = {'1m': 60, '5m': 300, '1h': 3600}
+
+# 구간 합계를 처음부터 다시 계산하는 주기 (샘플 수) - 더하고 빼기를 반복하며 쌓이는 오차 제거
+RESYNC_INTERVAL = 4096
+
+
+class _WindowState:
+    """구간 하나의 누적 상태 - 기준값을 뺀(shifted) 합계/제곱합과 채널별 최소/최대 단조 덱
+
+    분산을 sum_sq/n - mean²로 바로 구하면 평균이 표준편차보다 훨씬 클 때 자릿수가 상쇄되어
+    정밀도를 잃는다. 구간 평균에 가까운 기준값(shift)을 빼고 누적하면 상쇄가 거의 없다.
+    """
+
+    def __init__(self, seconds, channel_count):
+        self.seconds = seconds
+        self.start = 0  # 구간에 남아 있는 가장 오래된 샘플 번호
+        self.shift = np.zeros(channel_count)  # 구간이 비었을 때 첫 샘플, 다시 계산할 때 구간 평균
+        self.sum = np.zeros(channel_count)
+        self.sum_sq = np.zeros(channel_count)
+        # 덱에는 (샘플 번호, 값)을 담음 - min은 값이 증가하는 순서, max는 감소하는 순서 유지
+        self.min_queues = [collections.deque() for _ in range(channel_count)]
+        self.max_queues = [collections.deque() for _ in range(channel_count)]
+
+
+class RollingWindowStats:
+    """고정 크기 링 버퍼(채널별 NumPy 컬럼)에서 여러 시간 구간의 이동 평균/최소/최대/표준편차 계산
+
+    샘플을 추가할 때마다 구간별 합계와 최소/최대 덱을 갱신하므로 샘플당 비용이 일정하고,
+    메모리는 capacity개 샘플로 고정된다. 구간에 capacity보다 많은 샘플이 들어오면
+    최근 capacity개 샘플만 통계에 반영한다.
+    """
+
+    def __init__(self, channels, windows=None, capacity=4096):
+        if capacity <= 0:
+            raise ValueError(f'버퍼 크기는 0보다 커야 합니다: {capacity}')
+
+        self.channels = list(channels)
+        self.windows = dict(DEFAULT_WINDOWS if windows is None else windows)
+        self.capacity = capacity
+        self.times = np.zeros(capacity)
+        self.values = np.zeros((capacity, len(self.channels)))
+        self.count = 0  # 지금까지 추가한 샘플 수 (다음 샘플 번호)
+        self.states = {name: _WindowState(seconds, len(self.channels))
+                       for name, seconds in self.windows.items()}
+
+    def add(self, timestamp, values):
+        """샘플 하나 추가 - values는 채널 순서의 시퀀스 또는 채널 이름 딕셔너리"""
+        if isinstance(values, dict):
+            values = [values[channel] for channel in self.channels]
+        sample = np.asarray(values, dtype=np.float64)
+        seq = self.count
+        slot = seq % self.capacity
+
+        # 새 샘플이 덮어쓸 칸이 아직 구간에 있으면 먼저 제거 (덮어쓰기 전 값으로 빼야 함)
+        for state in self.states.values():
+            self._evict(state, seq - self.capacity + 1, None)
+
+        self.times[slot] = timestamp
+        self.values[slot] = sample
+        self.count = seq + 1
+
+        for state in self.states.values():
+            if state.start == seq:
+                # 구간이 비어 있음 - 새 샘플을 기준값으로 삼고 누적값을 정확히 0에서 시작
+                state.shift = sample.copy()
+                state.sum[:] = 0.0
+                state.sum_sq[:] = 0.0
+            delta = sample - state.shift
+            state.sum += delta
+            state.sum_sq += delta * delta
+            # 단조 덱 갱신 - 새 값 때문에 더 이상 최소/최대가 될 수 없는 뒤쪽 샘플 제거
+            for value, min_queue, max_queue in zip(sample.tolist(), state.min_queues, state.max_queues):
+                while min_queue and min_queue[-1][1] >= value:
+                    min_queue.pop()
+                min_queue.append((seq, value))
+                while max_queue and max_queue[-1][1] <= value:
+                    max_queue.pop()
+                max_queue.append((seq, value))
+            self._evict(state, None, timestamp - state.seconds)
+
+        if self.count % RESYNC_INTERVAL == 0:
+            self._resync()
+
+    def resized(self, windows, capacity):
+        """구간/버퍼 크기를 바꾼 새 통계 객체 - 지금 버퍼에 있는 샘플 중 새 버퍼에 들어가는 최근 샘플을 옮겨 담음"""
+        rebuilt = RollingWindowStats(self.channels, windows, capacity)
+        first = max(self.count - min(self.capacity, capacity), 0)
+        slots = np.arange(first, self.count) % self.capacity
+        for timestamp, values in zip(self.times[slots].tolist(), self.values[slots]):
+            rebuilt.add(timestamp, values)
+        return rebuilt
+
+    def _evict(self, state, min_start, min_time):
+        """샘플 번호가 min_start보다 작거나 시각이 min_time보다 이른 샘플을 구간에서 제거"""
+        start = state.start
+        while start < self.count:
+            slot = start % self.capacity
+            if not ((min_start is not None and start < min_start)
+                    or (min_time is not None and self.times[slot] < min_time)):
+                break
+            delta = self.values[slot] - state.shift
+            state.sum -= delta
+            state.sum_sq -= delta * delta
+            start += 1
+
+        if start != state.start:
+            state.start = start
+            for queues in (state.min_queues, state.max_queues):
+                for queue in queues:
+                    while queue and queue[0][0] < start:
+                        queue.popleft()
+
+    def _resync(self):
+        """구간 합계를 버퍼 값으로 다시 계산하고 기준값을 현재 구간 평균으로 옮김 (RESYNC_INTERVAL 샘플마다 1번)"""
+        for state in self.states.values():
+            window = self.values[np.arange(state.start, self.count) % self.capacity]
+            if not len(window):
+                continue
+            state.shift = window.mean(axis=0)
+            delta = window - state.shift
+            state.sum = delta.sum(axis=0)
+            state.sum_sq = (delta * delta).sum(axis=0)
+
+    def window_stats(self, name):
+        """구간 하나의 채널별 {count, mean, min, max, std} - 샘플이 없으면 None"""
+        state = self.states[name]
+        count = self.count - state.start
+        if count == 0:
+            return None
+
+        result = {}
+        for channel_index, channel in enumerate(self.channels):
+            mean_delta = state.sum[channel_index] / count
+            # 기준값 기준 분산 - 음수는 반올림 오차에 대한 마지막 방어로만 0으로 자름
+            variance = max(0.0, state.sum_sq[channel_index] / count - mean_delta * mean_delta)
+            result[channel] = {
+                'count': count,
+                'mean': float(state.shift[channel_index] + mean_delta),
+                'min': state.min_queues[channel_index][0][1],
+                'max': state.max_queues[channel_index][0][1],
+                'std': math.sqrt(variance)
+            }
+        return result
+
+    def stats(self):
+        """모든 구간의 채널별 통계 {구간 이름: {채널: {...}}}"""
+        return {name: self.window_stats(name) for name in self.windows}
@@ -0,0 +1,150 @@
+import heapq
+import threading
+import time
+
+
+class ScheduledCollector:
+    """스케줄러에 등록된 수집기 하나의 상태와 실행 통계"""
+
+    def __init__(self, name, func, interval, next_run):
+        self.name = name
+        self.func = func
+        self.interval = interval
+        self.next_run = next_run
+        self.runs = 0
+        self.missed = 0  # 밀려서 건너뛴 주기 수
+        self.errors = 0
+        self.max_lag = 0.0  # 예정 시각보다 늦게 실행된 최대 시간(초)
+        self.last_duration = 0.0
+        self.total_duration = 0.0
+
+    def stats(self):
+        return {
+            'interval': self.interval,
+            'runs': self.runs,
+            'missed': self.missed,
+            'errors': self.errors,
+            'max_lag_ms': round(self.max_lag * 1000, 3),
+            'last_duration_ms': round(self.last_duration * 1000, 3),
+            'avg_duration_ms': round(self.total_duration / self.runs * 1000, 3) if self.runs else 0.0
+        }
+
+
+class CollectorScheduler:
+    """여러 수집기를 스레드 하나에서 고정 주기로 실행하는 스케줄러
+
+    다음 실행 시각을 '이전 예정 시각 + 주기'로 잡아서 작업 시간만큼 주기가 밀리지 않는다.
+    한 주기 이상 밀리면 밀린 실행을 몰아서 하지 않고 건너뛴 뒤 missed로 기록한다.
+    """
+
+    def __init__(self, clock=time.monotonic):
+        self.clock = clock
+        self.collectors = {}
+        self.queue = []  # (다음 실행 시각, 등록 순서, 이름) 힙
+        self.sequence = 0
+        self.lock = threading.Lock()
+        self.wakeup = threading.Event()  # 등록/주기 변경/정지 시 대기 중인 스케줄러를 깨움
+        self.running = False
+
+    def add(self, name, func, interval, start_delay=0.0):
+        """수집기 등록 - interval초마다 func() 실행"""
+        if interval <= 0:
+            raise ValueError(f'주기는 0보다 커야 합니다: {name}={interval}')
+        with self.lock:
+            collector = ScheduledCollector(name, func, interval, self.clock() + start_delay)
+            self.collectors[name] = collector
+            self._push(collector)
+        self.wakeup.set()
+
+    def remove(self, name):
+        """수집기 등록 해제 (힙에 남은 항목은 꺼낼 때 무시)"""
+        with self.lock:
+            self.collectors.pop(name, None)
+        self.wakeup.set()
+
+    def set_interval(self, name, interval):
+        """수집기 주기 변경 - 다음 실행부터 새 주기 적용"""
+        if interval <= 0:
+            raise ValueError(f'주기는 0보다 커야 합니다: {name}={interval}')
+        with self.lock:
+            collector = self.collectors.get(name)
+            if collector is None or collector.interval == interval:
+                return
+            # 예정 시각을 새 주기 기준으로 다시 잡음 (주기를 줄였으면 바로 앞당겨짐)
+            collector.next_run = collector.next_run - collector.interval + interval
+            collector.interval = interval
+            self._push(collector)
+        self.wakeup.set()
+
+    def _push(self, collector):
+        self.sequence += 1
+        heapq.heappush(self.queue, (collector.next_run, self.sequence, collector.name))
+
+    def _take_due(self):
+        """예정 시각이 된 수집기 하나를 꺼내 다음 실행 시각을 잡고 (수집기, None)을 반환
+
+        아직 실행할 수집기가 없으면 (None, 남은 시간) - 수집기가 하나도 없으면 남은 시간도 None.
+        해제됐거나 주기가 바뀌어 낡은 힙 항목은 버린다. 확인과 꺼내기를 한 번의 락 안에서 해서
+        그 사이에 add/set_interval이 더 이른 항목을 넣어도 엉뚱한 항목을 꺼내지 않는다.
+        """
+        with self.lock:
+            while self.queue:
+                due, _, name = self.queue[0]
+                collector = self.collectors.get(name)
+                if collector is None or collector.next_run != due:
+                    heapq.heappop(self.queue)
+                    continue
+
+                now = self.clock()
+                if due > now:
+                    return None, due - now
+
+                heapq.heappop(self.queue)
+                # 고정 주기: 작업 시간과 관계없이 예정 시각 기준으로 다음 실행 시각 계산
+                next_run = due + collector.interval
+                if next_run <= now:
+                    skipped = int((now - due) // collector.interval)
+                    collector.missed += skipped
+                    next_run = due + (skipped + 1) * collector.interval
+                collector.next_run = next_run
+                self._push(collector)
+                collector.max_lag = max(collector.max_lag, now - due)
+                return collector, None
+        return None, None
+
+    def run_pending(self):
+        """예정 시각이 된 수집기를 모두 실행하고, 다음 실행까지 남은 시간(초)을 반환"""
+        while True:
+            collector, delay = self._take_due()
+            if collector is None:
+                return delay
+
+            start_time = self.clock()
+            try:
+                collector.func()
+            except Exception as e:
+                collector.errors += 1
+                print(f'수집기 {collector.name} 실행 오류: {e}')
+            collector.last_duration = self.clock() - start_time
+            collector.total_duration += collector.last_duration
+            collector.runs += 1
+
+    def run(self, should_continue=None):
+        """stop()이 호출되거나 should_continue()가 False가 될 때까지 현재 스레드에서 실행"""
+        self.running = True
+        while self.running and (should_continue is None or should_continue()):
+            delay = self.run_pending()
+            # 최대 0.5초 단위로 깨어나 정지 조건을 확인
+            timeout = 0.5 if delay is None else min(delay, 0.5)
+            if self.wakeup.wait(timeout):
+                self.wakeup.clear()
+        self.running = False
+
+    def stop(self):
+        self.running = False
+        self.wakeup.set()
+
+    def stats(self):
+        """수집기별 실행 통계"""
+        with self.lock:
+            return {name: collector.stats() for name, collector in self.collectors.items()}
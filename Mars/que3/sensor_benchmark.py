@@ -0,0 +1,108 @@
+import os
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+from alert_rules import AlertEngine, DEFAULT_RULES
+from rolling_stats import RollingWindowStats
+from sensor_simulator import SensorSimulator
+from telemetry_sinks import BinarySink
+from timeseries_store import DEFAULT_CHANNELS, TimeSeriesStore
+
+# 벤치마크용 기본 샘플 수와 샘플 속도(초당)
+DEFAULT_SAMPLES = 200000
+DEFAULT_RATE = 1000.0
+
+
+def measure(label, func, *args, count=None):
+    """실행 시간 측정 (count를 주면 초당 처리량도 출력)"""
+    start_time = time.perf_counter()
+    result = func(*args)
+    elapsed = time.perf_counter() - start_time
+    rate = f'  {count / elapsed:14,.0f} 샘플/초' if count else ''
+    print(f'{label:<36} {elapsed:8.3f}초{rate}')
+    return result
+
+
+def main():
+    total = int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_SAMPLES
+    rate = float(sys.argv[2]) if len(sys.argv) > 2 else DEFAULT_RATE
+    print(f'=== 센서 {total}샘플 (초당 {rate:g}샘플 간격) 벤치마크 ===')
+
+    # 생성: 시뮬레이터 배치 생성 vs DummySensor 방식(random.uniform 6번 + round)
+    simulator = SensorSimulator(rate=rate, seed=0)
+    timestamps, values = measure('SensorSimulator.generate', simulator.generate, total, 1.7e9, count=total)
+
+    def dummy_samples():
+        import random
+        return [[round(random.uniform(18, 30), 2), round(random.uniform(0, 21), 2),
+                 round(random.uniform(50, 60), 2), round(random.uniform(500, 715), 2),
+                 round(random.uniform(0.02, 0.1), 4), round(random.uniform(4, 7), 2)] for _ in range(total)]
+
+    measure('random.uniform x6 (DummySensor 방식)', dummy_samples, count=total)
+    spikes = np.abs(values - np.median(values, axis=0)) > 4 * simulator.noise
+    print(f'{"":<36} 스파이크 비율 {spikes.mean():.4%}, '
+          f'CO2-산소 상관 {np.corrcoef(values[:, 4], values[:, 5])[0, 1]:.2f}')
+
+    rows = values.tolist()
+    times = timestamps.tolist()
+
+    # 집계: 이동 통계 (1분/5분/1시간)
+    def rolling():
+        stats = RollingWindowStats(DEFAULT_CHANNELS, capacity=min(total, int(3600 * rate) + 1))
+        for sample_time, row in zip(times, rows):
+            stats.add(sample_time, row)
+        return stats
+
+    measure('RollingWindowStats.add', rolling, count=total)
+
+    # 경보: 기본 규칙
+    def alerts():
+        engine = AlertEngine(DEFAULT_RULES, DEFAULT_CHANNELS)
+        for sample_time, row in zip(times, rows):
+            engine.process(sample_time, row)
+        return engine.stats()
+
+    alert_stats = measure('AlertEngine.process', alerts, count=total)
+    print(f'{"":<36} 발생 {alert_stats["fired"]}건, 억제 {alert_stats["suppressed"]}건')
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        # 저장: 시계열 저장소 (배치 추가)
+        store = TimeSeriesStore(os.path.join(temp_dir, 'history'))
+        measure('TimeSeriesStore.append_many', lambda: (store.append_many(timestamps, values), store.flush()),
+                count=total)
+        print(f'{"":<36} {store.info()["bytes_per_sample"]} 바이트/샘플')
+
+        # 출력: 이진 레코드 파일
+        def binary_sink():
+            sink = BinarySink(os.path.join(temp_dir, 'telemetry.bin'))
+            for sample_time, row in zip(times, rows):
+                sink.emit('sensor', sample_time, dict(zip(DEFAULT_CHANNELS, row)))
+            sink.close()
+
+        measure('BinarySink.emit', binary_sink, count=total)
+
+        # 전체 경로: MissionComputer.record_sensor_batch (임시 폴더에서 기본 설정으로 실행)
+        current_dir = os.getcwd()
+        os.chdir(temp_dir)
+        try:
+            import mars_mission_computer
+            computer = mars_mission_computer.MissionComputer()
+            computer.sinks = []  # 화면 출력 제외 - 집계/경보/저장 비용만 측정
+            batch_size = 10000
+            simulator = SensorSimulator(rate=rate, seed=1)
+
+            def pipeline():
+                for batch_times, batch_values in simulator.iter_batches(batch_size, total, 1.7e9):
+                    computer.record_sensor_batch(batch_times, batch_values)
+                computer.history.flush()
+
+            measure('record_sensor_batch (생성 포함)', pipeline, count=total)
+        finally:
+            os.chdir(current_dir)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,260 @@
+import atexit
+import datetime
+import glob
+import os
+import queue
+import threading
+import time
+
+# fsync 정책: never(운영체제에 맡김), batch(배치를 쓸 때마다), interval(fsync_interval초마다 최대 1번)
+FSYNC_POLICIES = ('never', 'batch', 'interval')
+
+
+class SensorLogWriter:
+    """센서 로그를 메모리에 모았다가 백그라운드 스레드에서 묶어서 쓰는 로그 기록기
+
+    - 큐가 가득 차면 write가 잠시 기다리고(block_timeout), 그래도 못 넣으면 버리고 dropped로 센다.
+    - batch_size줄이 모이거나 flush_interval초가 지나면 한 번에 쓴다.
+    - rotate_bytes를 넘거나(rotate_daily면) 날짜가 바뀌면 기존 파일 이름을 바꾸고 새 파일에 쓴다.
+      이전 파일은 크기 기준이든 날짜 기준이든 최대 backup_count개만 남긴다.
+    - 백그라운드 스레드가 오류로 끝나면 이후 write는 기다리지 않고 바로 버린다(dropped).
+    """
+
+    def __init__(self, filename, batch_size=256, flush_interval=1.0, queue_size=10000,
+                 fsync_policy='never', fsync_interval=5.0, rotate_bytes=None, rotate_daily=False,
+                 backup_count=5, block_timeout=0.5):
+        if fsync_policy not in FSYNC_POLICIES:
+            raise ValueError(f'지원하지 않는 fsync 정책입니다: {fsync_policy} (지원: {", ".join(FSYNC_POLICIES)})')
+
+        self.filename = filename
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.queue_size = queue_size
+        self.fsync_policy = fsync_policy
+        self.fsync_interval = fsync_interval
+        self.rotate_bytes = rotate_bytes
+        self.rotate_daily = rotate_daily
+        self.backup_count = backup_count
+        self.block_timeout = block_timeout
+
+        self.written = 0
+        self.batches = 0
+        self.dropped = 0
+        self.rotations = 0
+        self.error = None  # 백그라운드 스레드를 끝낸 오류
+
+        self.pid = None
+        self.lock = threading.Lock()
+        self.closed = False
+
+    def _ensure_started(self):
+        """처음 쓸 때 (또는 fork된 자식 프로세스에서 처음 쓸 때) 큐와 백그라운드 스레드 시작"""
+        if self.pid == os.getpid():
+            return
+        with self.lock:
+            if self.pid == os.getpid():
+                return
+            self.queue = queue.Queue(maxsize=self.queue_size)
+            self.thread = threading.Thread(target=self._run, name=f'log-writer:{self.filename}', daemon=True)
+            self.pid = os.getpid()
+            self.thread.start()
+
+    def write(self, line):
+        """로그 한 줄 추가 (실제 파일 쓰기는 백그라운드 스레드에서)"""
+        if self.closed:
+            raise ValueError('닫힌 로그 기록기입니다.')
+        self._ensure_started()
+        if not self.thread.is_alive():
+            self.dropped += 1  # 기록 스레드가 죽음 - 수집기를 붙잡지 않고 바로 버림
+            return
+        try:
+            self.queue.put(line, timeout=self.block_timeout)
+        except queue.Full:
+            self.dropped += 1
+
+    def flush(self, timeout=5.0):
+        """지금까지 넣은 로그를 모두 파일에 쓸 때까지 기다림 (timeout 안에 못 쓰면 False)"""
+        if self.pid != os.getpid():
+            return True
+        if not self.thread.is_alive():
+            return False
+        deadline = time.monotonic() + timeout
+        done = threading.Event()
+        try:
+            self.queue.put(done, timeout=timeout)
+        except queue.Full:
+            return False
+        return done.wait(max(0.0, deadline - time.monotonic())) and self.error is None
+
+    def close(self, timeout=5.0):
+        """남은 로그를 모두 쓰고 백그라운드 스레드 종료 (timeout 안에 못 끝내면 포기)"""
+        if self.closed:
+            return
+        self.closed = True
+        if self.pid == os.getpid() and self.thread.is_alive():
+            deadline = time.monotonic() + timeout
+            try:
+                self.queue.put(None, timeout=timeout)
+            except queue.Full:
+                print(f'로그 기록기 종료 대기 시간 초과: {self.filename}')
+                return
+            self.thread.join(max(0.0, deadline - time.monotonic()))
+
+    def stats(self):
+        return {
+            'written': self.written,
+            'batches': self.batches,
+            'dropped': self.dropped,
+            'rotations': self.rotations
+        }
+
+    def _run(self):
+        """백그라운드 스레드: 큐에서 꺼내 배치로 모았다가 크기/시간 조건이 되면 파일에 쓰기"""
+        pending = []
+        last_flush = time.monotonic()
+        last_fsync = last_flush
+        file = None
+        file_day = None
+        waiter = None
+
+        try:
+            while True:
+                timeout = max(0.0, self.flush_interval - (time.monotonic() - last_flush))
+                try:
+                    item = self.queue.get(timeout=timeout)
+                except queue.Empty:
+                    item = ''  # 시간 초과 - 모인 것만 쓰기
+
+                stop = item is None
+                waiter = item if isinstance(item, threading.Event) else None
+                if isinstance(item, str) and item:
+                    pending.append(item)
+
+                now = time.monotonic()
+                if pending and (len(pending) >= self.batch_size or now - last_flush >= self.flush_interval
+                                or stop or waiter is not None):
+                    file, file_day = self._write_batch(file, file_day, pending)
+                    self.written += len(pending)
+                    self.batches += 1
+                    pending = []
+                    last_flush = now
+
+                    if self.fsync_policy == 'batch' or (
+                            self.fsync_policy == 'interval' and now - last_fsync >= self.fsync_interval):
+                        os.fsync(file.fileno())
+                        last_fsync = now
+                elif not pending:
+                    last_flush = now
+
+                if waiter is not None:
+                    waiter.set()
+                if stop:
+                    break
+        except Exception as e:
+            self.error = e
+            print(f'로그 기록 오류: {e}')
+            # 못 쓴 로그는 버린 것으로 세고, flush를 기다리는 쪽은 바로 깨움
+            self.dropped += len(pending)
+            if waiter is not None:
+                waiter.set()
+            while True:
+                try:
+                    item = self.queue.get_nowait()
+                except queue.Empty:
+                    break
+                if isinstance(item, threading.Event):
+                    item.set()
+                elif item:
+                    self.dropped += 1
+        finally:
+            if file is not None:
+                if self.fsync_policy != 'never':
+                    os.fsync(file.fileno())
+                file.close()
+
+    def _write_batch(self, file, file_day, lines):
+        """배치 하나 쓰기 - 필요하면 먼저 파일 교체(rotation)"""
+        data = ''.join(lines)
+        today = datetime.date.today()
+
+        if file is not None:
+            rotate = self.rotate_daily and file_day != today
+            if self.rotate_bytes and file.tell() + len(data.encode('utf-8')) > self.rotate_bytes and file.tell() > 0:
+                rotate = True
+            if rotate:
+                file.close()
+                self._rotate(file_day)
+                file = None
+
+        if file is None:
+            if self.rotate_daily and os.path.exists(self.filename):
+                # 이전 실행에서 남은 파일이 다른 날짜면 먼저 교체
+                modified = datetime.date.fromtimestamp(os.path.getmtime(self.filename))
+                if modified != today:
+                    self._rotate(modified)
+            file = open(self.filename, 'a', encoding='utf-8')
+            file_day = today
+
+        file.write(data)
+        file.flush()
+        return file, file_day
+
+    def _rotate(self, file_day):
+        """현재 로그 파일 이름 변경 - 날짜 기준이면 파일명.YYYY-MM-DD, 크기 기준이면 파일명.1, .2, ..."""
+        if self.rotate_daily and file_day is not None and file_day != datetime.date.today():
+            target = f'{self.filename}.{file_day.isoformat()}'
+            suffix = 1
+            while os.path.exists(target):
+                target = f'{self.filename}.{file_day.isoformat()}.{suffix}'
+                suffix += 1
+            os.replace(self.filename, target)
+            self._remove_old_daily_backups()
+        else:
+            for index in range(self.backup_count - 1, 0, -1):
+                source = f'{self.filename}.{index}'
+                if os.path.exists(source):
+                    os.replace(source, f'{self.filename}.{index + 1}')
+            os.replace(self.filename, f'{self.filename}.1')
+        self.rotations += 1
+
+    def _remove_old_daily_backups(self):
+        """날짜 기준 이전 파일(파일명.YYYY-MM-DD[.N])을 오래된 것부터 지워 backup_count개만 남김"""
+        pattern = f'{glob.escape(self.filename)}.[0-9][0-9][0-9][0-9]-[0-9][0-9]-[0-9][0-9]*'
+
+        def backup_order(path):
+            date, _, suffix = path[len(self.filename) + 1:].partition('.')
+            return date, int(suffix) if suffix.isdigit() else 0
+
+        backups = sorted(glob.glob(pattern), key=backup_order)
+        for path in backups[:max(0, len(backups) - self.backup_count)]:
+            try:
+                os.remove(path)
+            except OSError as e:
+                print(f'이전 로그 파일 삭제 오류: {e}')
+
+
+# 파일별로 하나씩 공유하는 기록기 (같은 파일에 여러 기록기가 동시에 쓰지 않도록)
+_writers = {}
+_writers_lock = threading.Lock()
+
+
+def get_log_writer(filename, **options):
+    """파일별 공유 로그 기록기 반환 (처음 요청할 때 options로 생성)"""
+    with _writers_lock:
+        writer = _writers.get(filename)
+        if writer is None or writer.closed:
+            writer = SensorLogWriter(filename, **options)
+            _writers[filename] = writer
+        return writer
+
+
+def close_all_writers():
+    """모든 공유 로그 기록기의 남은 로그를 쓰고 닫기 (프로세스 종료 시 자동 호출)"""
+    with _writers_lock:
+        writers = list(_writers.values())
+        _writers.clear()
+    for writer in writers:
+        writer.close()
+
+
+atexit.register(close_all_writers)
@@ -0,0 +1,178 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
+
+# 연속 실패가 이 횟수 이상이면 down, 그 전까지는 degraded
+DOWN_AFTER_ERRORS = 3
+
+# 지연 시간 이동 평균 가중치 (최근 값 비중)
+LATENCY_SMOOTHING = 0.2
+
+
+class SensorSource:
+    """센서 소스 하나와 상태(성공/실패 횟수, 지연 시간) 기록"""
+
+    def __init__(self, source_id, sensor):
+        self.source_id = source_id
+        self.sensor = sensor
+        self.in_flight = False  # 이전 읽기가 아직 끝나지 않았으면 이번 주기는 건너뜀
+        self.deadline = None  # 이번 읽기의 마감 시각 (제출 시각 + timeout, perf_counter 기준)
+        self.dropped = False  # 마감을 넘겨 이번 결과를 버리기로 함 (timeout으로 기록됨)
+        self.delivered = False  # 마감 안에 끝나 poll_all이 결과를 받아 감
+        self.polls = 0
+        self.errors = 0
+        self.timeouts = 0
+        self.skipped = 0
+        self.consecutive_errors = 0
+        self.last_error = None
+        self.last_success = None
+        self.last_latency = None
+        self.avg_latency = None
+        self.max_latency = 0.0
+
+    def read(self):
+        """센서 값 읽기 - DummySensor처럼 set_env/get_env가 있으면 사용, 아니면 호출 가능한 객체로 취급"""
+        if hasattr(self.sensor, 'get_env'):
+            self.sensor.set_env()
+            return self.sensor.get_env()
+        return self.sensor()
+
+    def record_latency(self, latency):
+        self.last_latency = latency
+        self.max_latency = max(self.max_latency, latency)
+        if self.avg_latency is None:
+            self.avg_latency = latency
+        else:
+            self.avg_latency += LATENCY_SMOOTHING * (latency - self.avg_latency)
+
+    def status(self, down_after=DOWN_AFTER_ERRORS):
+        if self.consecutive_errors == 0:
+            return 'ok'
+        return 'degraded' if self.consecutive_errors < down_after else 'down'
+
+    def health(self, down_after=DOWN_AFTER_ERRORS):
+        to_ms = lambda seconds: None if seconds is None else round(seconds * 1000, 3)
+        return {
+            'status': self.status(down_after),
+            'polls': self.polls,
+            'errors': self.errors,
+            'timeouts': self.timeouts,
+            'skipped': self.skipped,
+            'last_error': self.last_error,
+            'last_success': self.last_success,
+            'last_latency_ms': to_ms(self.last_latency),
+            'avg_latency_ms': to_ms(self.avg_latency),
+            'max_latency_ms': to_ms(self.max_latency)
+        }
+
+
+class SensorRegistry:
+    """여러 센서 소스를 정해진 수의 스레드로 동시에 읽는 레지스트리
+
+    poll_all()은 모든 소스를 스레드 풀(max_workers개)에 넣고 timeout초까지 기다린 뒤,
+    소스 id가 붙은 (소스 id, 시각, 값) 레코드를 시각 순으로 돌려준다. 마감은 제출 시각부터 재므로
+    풀에서 차례를 기다린 시간도 포함된다. 마감을 넘긴 소스는 timeout으로 기록하고 결과를 버리며
+    (아직 시작하지 않았으면 읽지도 않음), 이전 읽기가 끝나지 않은 소스는 다시 넣지 않아 작업이 쌓이지 않는다.
+    """
+
+    def __init__(self, max_workers=16, timeout=2.0, down_after=DOWN_AFTER_ERRORS):
+        self.timeout = timeout
+        self.down_after = down_after
+        self.sources = {}
+        self.lock = threading.Lock()
+        self.state_lock = threading.Lock()  # 결과 전달/버림 판정과 소스 상태 갱신을 한 번에
+        self.executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='sensor-poll')
+
+    def register(self, source_id, sensor):
+        with self.lock:
+            if source_id in self.sources:
+                raise ValueError(f'이미 등록된 센서 소스입니다: {source_id}')
+            self.sources[source_id] = SensorSource(source_id, sensor)
+
+    def unregister(self, source_id):
+        with self.lock:
+            self.sources.pop(source_id, None)
+
+    def poll_all(self):
+        """모든 소스를 한 번씩 동시에 읽어서 [(소스 id, epoch 초, 값 딕셔너리)] 반환"""
+        with self.lock:
+            sources = list(self.sources.values())
+
+        deadline = time.perf_counter() + self.timeout
+        futures = {}
+        for source in sources:
+            if source.in_flight:
+                source.skipped += 1
+                continue
+            source.in_flight = True
+            source.deadline = deadline
+            source.dropped = False
+            source.delivered = False
+            futures[self.executor.submit(self._poll, source)] = source
+
+        wait(futures, timeout=max(deadline - time.perf_counter(), 0.0))
+        records = []
+        for future, source in futures.items():
+            with self.state_lock:
+                if not source.delivered:
+                    # 마감 안에 못 읽음 - 나중에 끝나도 결과는 버림 (지연 시간은 그때 기록)
+                    source.dropped = True
+                    source.timeouts += 1
+                    source.consecutive_errors += 1
+                    source.last_error = f'timeout ({self.timeout}초)'
+                    continue
+            # 마감 안에 결과가 정해짐 - 반환 직전이면 잠깐 기다려서 받음
+            record = future.result()
+            if record is not None:
+                records.append(record)
+        records.sort(key=lambda record: record[1])
+        return records
+
+    def _poll(self, source):
+        with self.state_lock:
+            if source.dropped or time.perf_counter() > source.deadline:
+                # 풀에서 기다리는 동안 마감이 지남 - 읽지 않고 버림
+                source.dropped = True
+                source.in_flight = False
+                return None
+
+        start_time = time.perf_counter()
+        error = None
+        try:
+            values = source.read()
+        except Exception as e:
+            error = f'{type(e).__name__}: {e}'
+        latency = time.perf_counter() - start_time
+        sample_time = time.time()
+
+        with self.state_lock:
+            source.polls += 1
+            source.record_latency(latency)
+            source.in_flight = False
+            if source.dropped or time.perf_counter() > source.deadline:
+                # 이미 timeout으로 기록됨 (또는 곧 기록됨) - 늦게 끝난 결과는 버리고 실패 상태 유지
+                source.dropped = True
+                return None
+            source.delivered = True
+            if error is not None:
+                source.errors += 1
+                source.consecutive_errors += 1
+                source.last_error = error
+                return None
+            source.consecutive_errors = 0
+            source.last_success = sample_time
+        return source.source_id, sample_time, values
+
+    def health(self):
+        """소스별 상태와 전체 요약"""
+        with self.lock:
+            sources = list(self.sources.values())
+        per_source = {source.source_id: source.health(self.down_after) for source in sources}
+        statuses = [item['status'] for item in per_source.values()]
+        return {
+            'summary': {status: statuses.count(status) for status in ('ok', 'degraded', 'down')},
+            'sources': per_source
+        }
+
+    def shutdown(self):
+        self.executor.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,129 @@
+import time
+
+import numpy as np
+
+from timeseries_store import DEFAULT_CHANNELS
+
+# 채널별 기본 분포 - DummySensor의 범위를 중심값/잡음으로 옮긴 값
+# base: 중심값, noise: 샘플 잡음 표준편차, drift: 초당 드리프트(랜덤 워크) 표준편차,
+# spike_rate: 샘플당 스파이크 확률, spike: 스파이크 크기, limits: 물리적 한계, decimals: 반올림 자릿수
+DEFAULT_SPECS = {
+    'mars_base_internal_temperature': {'base': 24.0, 'noise': 0.8, 'drift': 0.01, 'spike_rate': 0.001,
+                                       'spike': 6.0, 'limits': (-20.0, 60.0), 'decimals': 2},
+    'mars_base_external_temperature': {'base': 10.5, 'noise': 2.0, 'drift': 0.05, 'spike_rate': 0.001,
+                                       'spike': 10.0, 'limits': (-120.0, 40.0), 'decimals': 2},
+    'mars_base_internal_humidity': {'base': 55.0, 'noise': 0.8, 'drift': 0.01, 'spike_rate': 0.001,
+                                    'spike': 5.0, 'limits': (0.0, 100.0), 'decimals': 2},
+    'mars_base_external_illuminance': {'base': 607.5, 'noise': 15.0, 'drift': 0.5, 'spike_rate': 0.0005,
+                                       'spike': 80.0, 'limits': (0.0, 1500.0), 'decimals': 2},
+    'mars_base_internal_co2': {'base': 0.06, 'noise': 0.006, 'drift': 0.0001, 'spike_rate': 0.001,
+                               'spike': 0.03, 'limits': (0.0, 5.0), 'decimals': 4},
+    'mars_base_internal_oxygen': {'base': 5.5, 'noise': 0.25, 'drift': 0.005, 'spike_rate': 0.001,
+                                  'spike': 1.2, 'limits': (0.0, 30.0), 'decimals': 2}
+}
+
+# 채널 간 잡음 상관계수 (내부 온도↔습도 음의 상관, CO2↔산소 음의 상관, 외부 온도↔조도 양의 상관)
+DEFAULT_CORRELATIONS = {
+    ('mars_base_internal_temperature', 'mars_base_internal_humidity'): -0.5,
+    ('mars_base_internal_co2', 'mars_base_internal_oxygen'): -0.7,
+    ('mars_base_external_temperature', 'mars_base_external_illuminance'): 0.6
+}
+
+
+class SensorSimulator:
+    """NumPy로 센서 샘플을 묶음 단위로 생성하는 시뮬레이터
+
+    샘플 값 = 중심값 + 드리프트(배치를 넘어 이어지는 랜덤 워크) + 상관된 잡음 + 가끔의 스파이크.
+    한 번에 (n, 채널 수) 배열을 만들어 초당 수백만 샘플까지 생성할 수 있다.
+    """
+
+    def __init__(self, specs=None, correlations=None, rate=1.0, seed=None, channels=None):
+        self.channels = list(channels or DEFAULT_CHANNELS)
+        specs = {**DEFAULT_SPECS, **(specs or {})}
+        missing = [channel for channel in self.channels if channel not in specs]
+        if missing:
+            raise ValueError(f'분포 설정이 없는 채널입니다: {", ".join(missing)}')
+        if rate <= 0:
+            raise ValueError(f'샘플 속도는 0보다 커야 합니다: {rate}')
+
+        self.rate = rate
+        self.rng = np.random.default_rng(seed)
+
+        def column(key):
+            return np.array([specs[channel][key] for channel in self.channels], dtype=np.float64)
+
+        self.base = column('base')
+        self.noise = column('noise')
+        self.drift = column('drift')
+        self.spike_rate = column('spike_rate')
+        self.spike = column('spike')
+        self.lower = np.array([specs[channel]['limits'][0] for channel in self.channels])
+        self.upper = np.array([specs[channel]['limits'][1] for channel in self.channels])
+        self.decimals = [specs[channel]['decimals'] for channel in self.channels]
+
+        # 상관 행렬의 촐레스키 분해 - 독립 정규 난수에 곱하면 상관된 잡음이 됨
+        correlation = np.eye(len(self.channels))
+        pairs = DEFAULT_CORRELATIONS if correlations is None else correlations
+        for (first, second), value in pairs.items():
+            if first in self.channels and second in self.channels:
+                i, j = self.channels.index(first), self.channels.index(second)
+                correlation[i, j] = correlation[j, i] = value
+        self.mixing = np.linalg.cholesky(correlation)
+
+        self.offset = np.zeros(len(self.channels))  # 드리프트 누적값 (배치 사이에 이어짐)
+        self.next_time = None
+        self.generated = 0
+
+        # next_sample()용 미리 만든 배치
+        self.cache = None
+        self.cache_position = 0
+
+    def generate(self, count, start_time=None):
+        """샘플 count개 생성 - (epoch 초 배열 (n,), 값 배열 (n, 채널 수)) 반환"""
+        if start_time is None:
+            start_time = self.next_time if self.next_time is not None else time.time()
+        interval = 1.0 / self.rate
+        timestamps = start_time + np.arange(count) * interval
+        self.next_time = start_time + count * interval
+
+        channel_count = len(self.channels)
+        # 드리프트: 샘플 간격에 맞춘 랜덤 워크 (누적합 + 직전 배치 끝값)
+        steps = self.rng.standard_normal((count, channel_count)) * (self.drift * np.sqrt(interval))
+        drift = np.cumsum(steps, axis=0) + self.offset
+        if count:
+            self.offset = drift[-1].copy()
+
+        noise = (self.rng.standard_normal((count, channel_count)) @ self.mixing.T) * self.noise
+        values = self.base + drift + noise
+
+        # 스파이크: 채널별 확률로 위/아래 방향 큰 값
+        spikes = self.rng.random((count, channel_count)) < self.spike_rate
+        if spikes.any():
+            signs = np.where(self.rng.random(int(spikes.sum())) < 0.5, -1.0, 1.0)
+            values[spikes] += signs * np.broadcast_to(self.spike, values.shape)[spikes]
+
+        np.clip(values, self.lower, self.upper, out=values)
+        for column, digits in enumerate(self.decimals):
+            values[:, column] = np.round(values[:, column], digits)
+
+        self.generated += count
+        return timestamps, values
+
+    def iter_batches(self, batch_size, total=None, start_time=None):
+        """batch_size개씩 (시각, 값) 배치를 계속 생성 (total개를 채우면 종료)"""
+        produced = 0
+        while total is None or produced < total:
+            count = batch_size if total is None else min(batch_size, total - produced)
+            yield self.generate(count, start_time)
+            start_time = None
+            produced += count
+
+    def next_sample(self, batch_size=1024):
+        """샘플 하나를 채널 딕셔너리로 반환 (내부적으로는 배치로 미리 생성)"""
+        if self.cache is None or self.cache_position >= len(self.cache):
+            _, values = self.generate(batch_size)
+            self.cache = values.tolist()
+            self.cache_position = 0
+        row = self.cache[self.cache_position]
+        self.cache_position += 1
+        return dict(zip(self.channels, row))
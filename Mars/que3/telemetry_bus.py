@@ -0,0 +1,186 @@
+import struct
+import time
+from multiprocessing import shared_memory
+
+import numpy as np
+
+# 공유 메모리 머리글: 매직, 버전, 생산자 수, 링 크기, 레코드 크기
+BUS_MAGIC = b'MARSTLM\0'
+BUS_VERSION = 1
+BUS_HEADER = struct.Struct('<8sIIII')
+HEADER_SIZE = 64
+CURSOR_STRIDE = 64  # 생산자별 쓰기 카운터 - 캐시 라인마다 하나씩 두어 서로 간섭하지 않게 함
+
+# 레코드 종류
+KIND_SENSOR = 1  # 값: DummySensor.env_values 순서의 6개 채널
+KIND_LOAD = 2    # 값: CPU 사용률(%), 메모리 사용률(%), 사용 가능 메모리(GB)
+
+MAX_VALUES = 8
+
+# 고정 크기 텔레메트리 레코드
+RECORD_DTYPE = np.dtype([
+    ('seq', '<u8'),     # 생산자별 일련 번호 (덮어쓰기 감지용)
+    ('time', '<f8'),    # epoch 초
+    ('kind', '<u2'),
+    ('source', '<u2'),  # 생산자 번호
+    ('count', '<u2'),   # values 중 사용한 개수
+    ('reserved', '<u2'),
+    ('values', '<f8', (MAX_VALUES,))
+])
+
+
+class TelemetryBus:
+    """공유 메모리 위의 생산자별 텔레메트리 링 버퍼
+
+    생산자(수집 프로세스)마다 링을 하나씩 두므로 쓰기에 락이 필요 없다. 생산자는 레코드를 채운 뒤
+    자기 쓰기 카운터를 올리고, 소비자는 카운터까지의 레코드를 복사한 다음 카운터와 레코드의 seq를
+    다시 확인한다. 소비자가 capacity개 넘게 뒤처지거나 복사하는 동안 생산자가 한 바퀴 돌아
+    덮어쓴 레코드는 버리고 dropped로 센다.
+    """
+
+    def __init__(self, producers=3, capacity=4096, name=None, create=True):
+        if create:
+            size = HEADER_SIZE + producers * CURSOR_STRIDE + producers * capacity * RECORD_DTYPE.itemsize
+            self.shm = shared_memory.SharedMemory(name=name, create=True, size=size)
+            self.shm.buf[:size] = bytes(size)
+            BUS_HEADER.pack_into(self.shm.buf, 0, BUS_MAGIC, BUS_VERSION, producers, capacity,
+                                 RECORD_DTYPE.itemsize)
+        else:
+            self.shm = shared_memory.SharedMemory(name=name)
+            magic, version, producers, capacity, record_size = BUS_HEADER.unpack_from(self.shm.buf, 0)
+            if magic != BUS_MAGIC or version != BUS_VERSION or record_size != RECORD_DTYPE.itemsize:
+                self.shm.close()
+                raise ValueError(f'텔레메트리 버스 형식이 다릅니다: {name}')
+
+        self.name = self.shm.name
+        self.owner = create
+        self.producers = producers
+        self.capacity = capacity
+        self.write_seqs = np.ndarray((producers,), dtype='<u8', buffer=self.shm.buf, offset=HEADER_SIZE,
+                                     strides=(CURSOR_STRIDE,))
+        self.rings = np.ndarray((producers, capacity), dtype=RECORD_DTYPE, buffer=self.shm.buf,
+                                offset=HEADER_SIZE + producers * CURSOR_STRIDE)
+
+    @classmethod
+    def attach(cls, name):
+        """다른 프로세스에서 이름으로 기존 버스에 연결"""
+        return cls(name=name, create=False)
+
+    def writer(self, producer):
+        return TelemetryWriter(self, producer)
+
+    def reader(self):
+        return TelemetryReader(self)
+
+    def close(self):
+        """이 프로세스의 연결 해제 (읽어 간 레코드 뷰를 모두 버린 뒤 호출)"""
+        self.write_seqs = None
+        self.rings = None
+        self.shm.close()
+
+    def unlink(self):
+        """버스 삭제 (만든 프로세스에서 한 번만)"""
+        if self.owner:
+            self.shm.unlink()
+
+
+class TelemetryWriter:
+    """생산자 하나의 기록기 - 한 프로세스(또는 스레드)에서만 사용"""
+
+    def __init__(self, bus, producer):
+        if not 0 <= producer < bus.producers:
+            raise ValueError(f'생산자 번호가 범위를 벗어났습니다: {producer} (0~{bus.producers - 1})')
+        self.bus = bus
+        self.producer = producer
+        self.ring = bus.rings[producer]
+        self.seq = int(bus.write_seqs[producer])
+
+    def write(self, kind, values, timestamp=None):
+        """레코드 하나 기록 - seq를 먼저 바꾸고 나머지를 채운 다음 카운터를 올림
+
+        소비자는 복사한 레코드의 seq가 기대한 번호와 다르거나 복사 후 카운터가 그 칸까지 돌아왔으면
+        (덮어쓰는 중이었으면) 그 레코드를 버린다.
+        """
+        if len(values) > MAX_VALUES:
+            raise ValueError(f'값은 최대 {MAX_VALUES}개입니다: {len(values)}')
+        record = self.ring[self.seq % self.bus.capacity]
+        record['seq'] = self.seq
+        record['time'] = time.time() if timestamp is None else timestamp
+        record['kind'] = kind
+        record['source'] = self.producer
+        record['count'] = len(values)
+        record['values'][:len(values)] = values
+        self.seq += 1
+        self.bus.write_seqs[self.producer] = self.seq
+
+
+class TelemetryReader:
+    """모든 생산자의 링을 읽는 소비자 - 생산자별 읽기 위치를 따로 관리"""
+
+    def __init__(self, bus):
+        self.bus = bus
+        self.cursors = [0] * bus.producers
+        self.received = 0
+        self.dropped = 0
+
+    def poll(self):
+        """새 레코드를 생산자별 구조화 배열(공유 메모리의 복사본) 목록으로 반환
+
+        복사본이므로 생산자가 계속 써도 반환한 배열은 바뀌지 않는다. 복사하는 동안 덮어써진 레코드는
+        빠지므로 배열 길이가 새로 쓰인 레코드 수보다 짧을 수 있다.
+        """
+        capacity = self.bus.capacity
+        batches = []
+        for producer in range(self.bus.producers):
+            write_seq = int(self.bus.write_seqs[producer])
+            cursor = self.cursors[producer]
+            if write_seq - cursor > capacity:
+                # 한 바퀴 넘게 밀림 - 덮어써진 레코드는 건너뜀
+                self.dropped += write_seq - capacity - cursor
+                cursor = write_seq - capacity
+            if cursor == write_seq:
+                continue
+
+            records = self._copy_valid(producer, cursor, write_seq)
+            if len(records):
+                batches.append(records)
+            self.received += len(records)
+            self.cursors[producer] = write_seq
+        return batches
+
+    def _copy_valid(self, producer, cursor, write_seq):
+        """생산자 링의 [cursor, write_seq) 레코드를 복사하고 복사 중 덮어써진 레코드를 뺀 배열 반환"""
+        capacity = self.bus.capacity
+        ring = self.bus.rings[producer]
+        start = cursor % capacity
+        end = start + (write_seq - cursor)
+        if end <= capacity:
+            records = ring[start:end].copy()
+        else:
+            # 링 끝에서 처음으로 넘어감
+            records = np.concatenate((ring[start:], ring[:end - capacity]))
+
+        # 복사를 마친 뒤 다시 확인 - 카운터로는 복사 중 한 바퀴 밀려 덮어써진 레코드를,
+        # 링의 seq로는 생산자가 지금 채우는 중인(카운터를 아직 올리지 않은) 칸을 걸러냄
+        oldest = int(self.bus.write_seqs[producer]) - capacity
+        expected = np.arange(cursor, write_seq, dtype=np.uint64)
+        if end <= capacity:
+            live_seqs = ring['seq'][start:end]
+        else:
+            live_seqs = np.concatenate((ring['seq'][start:], ring['seq'][:end - capacity]))
+        valid = (records['seq'] == expected) & (live_seqs == expected)
+        if oldest > cursor:
+            valid &= expected >= oldest
+        lapped = len(records) - int(np.count_nonzero(valid))
+        if lapped:
+            self.dropped += lapped
+            records = records[valid]
+        return records
+
+    def stats(self):
+        return {
+            'received': self.received,
+            'dropped': self.dropped,
+            'pending': sum(int(self.bus.write_seqs[producer]) - self.cursors[producer]
+                           for producer in range(self.bus.producers))
+        }
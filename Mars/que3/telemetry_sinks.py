@@ -0,0 +1,209 @@
+import datetime
+import json
+import socket
+import struct
+import sys
+import threading
+
+from timeseries_store import DEFAULT_CHANNELS
+
+# 콘솔 출력 형식: 종류 -> (머리말, JSON 안에서 데이터를 담을 키 - None이면 데이터 딕셔너리를 그대로 펼침)
+CONSOLE_FORMATS = {
+    'sensor': ('센서 데이터', 'sensor_data'),
+    'system_info': ('시스템 정보', 'system_info'),
+    'load': ('시스템 부하', 'load_info'),
+    'average': ('이동 통계', None),
+    'sensor_health': ('센서 상태', None)
+}
+
+# 종류별 화면 출력 설정 키 (사람이 보는 콘솔 출력에만 적용)
+SHOW_SETTINGS = {
+    'sensor': 'show_sensor_data',
+    'system_info': 'show_system_info',
+    'load': 'show_load_info'
+}
+
+# 이진 레코드: 머리글(내용 길이 uint32, 종류 uint16, epoch 초 float64) + 내용
+# 센서 샘플은 채널 순서의 float64 6개로 고정, 나머지 종류는 압축 JSON(UTF-8)
+RECORD_HEADER = struct.Struct('<IHd')
+SENSOR_PAYLOAD = struct.Struct(f'<{len(DEFAULT_CHANNELS)}d')
+BINARY_KINDS = {'sensor': 1, 'load': 2, 'system_info': 3, 'average': 4, 'alert': 5, 'sensor_health': 6}
+BINARY_KIND_NAMES = {code: name for name, code in BINARY_KINDS.items()}
+BUFFER_BYTES = 64 * 1024
+
+
+class ConsoleSink:
+    """사람이 읽는 들여쓰기 JSON 출력 (기존 화면 출력 형식)"""
+
+    human = True
+
+    def __init__(self, stream=None):
+        self.stream = stream
+
+    def emit(self, kind, timestamp, data):
+        stream = self.stream or sys.stdout
+        if kind == 'alert':
+            label = '경보' if data['state'] == 'firing' else '경보 해제'
+            print(f'[{label}] {data["severity"]} {data["rule"]}: {data["message"]}', file=stream)
+            return
+
+        label, key = CONSOLE_FORMATS.get(kind, (kind, 'data'))
+        output = {'timestamp': datetime.datetime.fromtimestamp(timestamp).strftime('%Y-%m-%d %H:%M:%S')}
+        if key is None:
+            output.update(data)
+        else:
+            output[key] = data
+        print(f'[{label}] {json.dumps(output, indent=2, ensure_ascii=False)}', file=stream)
+
+    def flush(self):
+        (self.stream or sys.stdout).flush()
+
+    def close(self):
+        self.flush()
+
+
+class _BufferedSink:
+    """바이트를 모았다가 BUFFER_BYTES를 넘으면 한 번에 쓰는 기계용 출력의 공통 부분"""
+
+    human = False
+
+    def __init__(self, buffer_bytes=BUFFER_BYTES):
+        self.buffer = bytearray()
+        self.buffer_bytes = buffer_bytes
+        self.lock = threading.Lock()
+        self.records = 0
+
+    def _append(self, data):
+        with self.lock:
+            self.buffer += data
+            self.records += 1
+            if len(self.buffer) >= self.buffer_bytes:
+                self._flush_locked()
+
+    def flush(self):
+        with self.lock:
+            self._flush_locked()
+
+    def _flush_locked(self):
+        if self.buffer:
+            self._write(bytes(self.buffer))
+            self.buffer.clear()
+
+
+class JsonLinesSink(_BufferedSink):
+    """한 줄에 레코드 하나인 압축 JSON (JSON Lines) 파일 출력"""
+
+    def __init__(self, path, buffer_bytes=BUFFER_BYTES):
+        super().__init__(buffer_bytes)
+        self.file = open(path, 'ab')
+
+    def emit(self, kind, timestamp, data):
+        line = json.dumps({'kind': kind, 'time': timestamp, 'data': data}, separators=(',', ':'),
+                          ensure_ascii=False)
+        self._append(line.encode('utf-8') + b'\n')
+
+    def _write(self, data):
+        self.file.write(data)
+        self.file.flush()
+
+    def close(self):
+        self.flush()
+        self.file.close()
+
+
+class BinarySink(_BufferedSink):
+    """길이 머리글이 붙은 이진 레코드를 파일 또는 유닉스 소켓으로 출력"""
+
+    def __init__(self, path=None, socket_path=None, buffer_bytes=BUFFER_BYTES):
+        if (path is None) == (socket_path is None):
+            raise ValueError('path와 socket_path 중 하나만 지정해야 합니다.')
+        super().__init__(buffer_bytes)
+        self.file = None
+        self.socket = None
+        if path is not None:
+            self.file = open(path, 'ab')
+        else:
+            self.socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            self.socket.connect(socket_path)
+
+    def emit(self, kind, timestamp, data):
+        self._append(encode_record(kind, timestamp, data))
+
+    def _write(self, data):
+        if self.file is not None:
+            self.file.write(data)
+            self.file.flush()
+        else:
+            self.socket.sendall(data)
+
+    def close(self):
+        self.flush()
+        if self.file is not None:
+            self.file.close()
+        else:
+            self.socket.close()
+
+
+def encode_record(kind, timestamp, data):
+    """레코드 하나를 이진 형식으로 변환"""
+    code = BINARY_KINDS.get(kind, 0)
+    if code == BINARY_KINDS['sensor'] and isinstance(data, dict) and len(data) == len(DEFAULT_CHANNELS):
+        try:
+            payload = SENSOR_PAYLOAD.pack(*[data[channel] for channel in DEFAULT_CHANNELS])
+            return RECORD_HEADER.pack(len(payload), code, timestamp) + payload
+        except KeyError:
+            pass
+    payload = json.dumps(data if code else {'kind': kind, 'data': data}, separators=(',', ':'),
+                         ensure_ascii=False).encode('utf-8')
+    return RECORD_HEADER.pack(len(payload), code | 0x8000, timestamp) + payload
+
+
+def iter_binary_records(stream):
+    """이진 레코드 스트림(파일 객체)을 (종류, epoch 초, 데이터)로 하나씩 읽기"""
+    while True:
+        header = stream.read(RECORD_HEADER.size)
+        if len(header) < RECORD_HEADER.size:
+            return
+        length, code, timestamp = RECORD_HEADER.unpack(header)
+        payload = stream.read(length)
+        if len(payload) < length:
+            return  # 끊긴 마지막 레코드
+
+        if code & 0x8000:
+            data = json.loads(payload.decode('utf-8'))
+            code &= 0x7fff
+            if not code:
+                yield data['kind'], timestamp, data['data']
+                continue
+        else:
+            data = dict(zip(DEFAULT_CHANNELS, SENSOR_PAYLOAD.unpack(payload)))
+        yield BINARY_KIND_NAMES.get(code, str(code)), timestamp, data
+
+
+def build_sinks(configs):
+    """설정 목록으로 출력 대상 생성 - 'console' 또는 {'type': console|jsonl|binary, 'path'|'socket': ...}
+
+    중간에 하나라도 만들지 못하면 이미 연 출력 대상을 닫고 예외를 다시 올린다.
+    """
+    sinks = []
+    try:
+        for config in configs:
+            if isinstance(config, str):
+                config = {'type': config}
+            sink_type = config.get('type')
+            if sink_type == 'console':
+                sinks.append(ConsoleSink())
+            elif sink_type == 'jsonl':
+                sinks.append(JsonLinesSink(config['path']))
+            elif sink_type == 'binary':
+                sinks.append(BinarySink(config.get('path'), config.get('socket')))
+            else:
+                raise ValueError(f'지원하지 않는 출력 종류입니다: {sink_type} (지원: console, jsonl, binary)')
+    except Exception:
+        for sink in sinks:
+            try:
+                sink.close()
+            except Exception:
+                pass  # 원래 예외를 그대로 올리는 것이 우선
+        raise
+    return sinks
@@ -0,0 +1,62 @@
+import json
+
+from alert_rules import DEFAULT_RULES, AlertEngine, load_alert_config
+
+CHANNELS = ['temperature']
+
+
+def make_engine(rules, **defaults):
+    return AlertEngine({'defaults': defaults, 'rules': rules}, CHANNELS)
+
+
+def threshold_rule(name, value, **extra):
+    return dict({'name': name, 'channel': 'temperature', 'type': 'threshold', 'op': '>', 'value': value}, **extra)
+
+
+def test_cooldown_suppressed_firing_is_sent_later():
+    engine = make_engine([threshold_rule('hot', 30, cooldown=10)])
+
+    assert [a['state'] for a in engine.process(0, [35])] == ['firing']
+    assert [a['state'] for a in engine.process(1, [20])] == ['resolved']
+    # cooldown 중 다시 발생 - 바로 알리지 않지만 조건이 계속되면 cooldown이 끝난 뒤 알림
+    assert engine.process(2, [35]) == []
+    assert engine.process(5, [36]) == []
+    alerts = engine.process(10, [37])
+    assert [(a['state'], a['value']) for a in alerts] == [('firing', 35)]
+    assert engine.stats()['suppressed'] == 1
+    assert engine.stats()['pending'] == 0
+    assert engine.process(11, [36]) == []  # 같은 발생을 두 번 알리지 않음
+
+
+def test_rate_limited_firing_is_sent_when_limit_frees():
+    engine = make_engine([threshold_rule('warm', 30), threshold_rule('hot', 40)], max_alerts_per_minute=1)
+
+    alerts = engine.process(0, [45])
+    assert [a['rule'] for a in alerts] == ['warm']
+    assert engine.process(30, [45]) == []
+    assert [a['rule'] for a in engine.process(60, [45])] == ['hot']
+
+
+def test_pending_firing_dropped_when_resolved_first():
+    engine = make_engine([threshold_rule('hot', 30, cooldown=10)])
+
+    engine.process(0, [35])
+    engine.process(1, [20])
+    engine.process(2, [35])
+    # 알리기 전에 해제 - 발생도 해제도 알리지 않음
+    assert engine.process(3, [20]) == []
+    assert engine.process(20, [20]) == []
+    assert engine.stats()['pending'] == 0
+
+
+def test_load_alert_config_falls_back_on_malformed_file(tmp_path, capsys):
+    broken = tmp_path / 'rules.json'
+    broken.write_text('{"rules": [', encoding='utf-8')
+    assert load_alert_config(str(broken)) is DEFAULT_RULES
+    assert '알림 규칙 파일 읽기 오류' in capsys.readouterr().out
+
+    not_object = tmp_path / 'list.json'
+    not_object.write_text(json.dumps([1, 2]), encoding='utf-8')
+    assert load_alert_config(str(not_object)) is DEFAULT_RULES
+
+    assert load_alert_config(str(tmp_path / 'missing.json')) is DEFAULT_RULES
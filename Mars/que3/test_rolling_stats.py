@@ -0,0 +1,77 @@
+import numpy as np
+import pytest
+
+import rolling_stats
+from rolling_stats import RollingWindowStats
+
+CHANNELS = ['temperature', 'pressure']
+WINDOWS = {'short': 10, 'long': 50}
+
+
+def brute_force(times, values, seconds, capacity):
+    """최근 capacity개 샘플 중 마지막 시각 - seconds 이후의 샘플로 직접 계산"""
+    times = np.asarray(times[-capacity:])
+    values = np.asarray(values[-capacity:])
+    window = values[times >= times[-1] - seconds]
+    return len(window), window.mean(axis=0), window.min(axis=0), window.max(axis=0), window.std(axis=0)
+
+
+def assert_matches(stats, times, values, capacity, std_rel=1e-9, std_abs=0.0):
+    for name, seconds in WINDOWS.items():
+        count, mean, minimum, maximum, std = brute_force(times, values, seconds, capacity)
+        result = stats.window_stats(name)
+        for index, channel in enumerate(CHANNELS):
+            item = result[channel]
+            assert item['count'] == count
+            assert (item['min'], item['max']) == (minimum[index], maximum[index])
+            assert item['mean'] == pytest.approx(mean[index], rel=1e-12)
+            assert item['std'] == pytest.approx(std[index], rel=std_rel, abs=std_abs)
+
+
+def test_windows_match_brute_force():
+    rng = np.random.default_rng(3)
+    capacity = 32
+    stats = RollingWindowStats(CHANNELS, WINDOWS, capacity)
+    assert stats.window_stats('short') is None
+
+    times, values = [], []
+    timestamp = 0.0
+    for _ in range(400):
+        # 간격이 들쭉날쭉하고 가끔 긴 공백이 있어서 구간이 비었다가 다시 채워짐
+        timestamp += rng.choice([0.5, 1.0, 3.0, 30.0], p=[0.4, 0.4, 0.15, 0.05])
+        sample = rng.normal([20.0, 1000.0], [5.0, 50.0])
+        stats.add(timestamp, dict(zip(CHANNELS, sample)))
+        times.append(timestamp)
+        values.append(sample)
+        # 구간에 샘플이 1~2개만 남으면 참값이 0에 가까워 상대 오차 대신 값 크기 × sqrt(eps) 정도를 허용
+        assert_matches(stats, times, values, capacity, std_abs=1e-5)
+
+
+def test_large_offset_keeps_precision(monkeypatch):
+    # 다시 계산하는 주기를 줄여서 기준값 이동도 함께 확인
+    monkeypatch.setattr(rolling_stats, 'RESYNC_INTERVAL', 64)
+    rng = np.random.default_rng(4)
+    capacity = 256
+    stats = RollingWindowStats(CHANNELS, WINDOWS, capacity)
+    times = np.arange(1000) * 0.1
+    values = 1e9 + rng.normal(0, 1e-3, size=(1000, len(CHANNELS)))
+    for index, (timestamp, sample) in enumerate(zip(times, values)):
+        stats.add(timestamp, sample)
+        if index % 97 == 0:
+            assert_matches(stats, times[:index + 1], values[:index + 1], capacity, std_rel=1e-4)
+    assert_matches(stats, times, values, capacity, std_rel=1e-4)
+
+
+def test_resized_keeps_recent_samples():
+    stats = RollingWindowStats(CHANNELS, WINDOWS, capacity=16)
+    times = np.arange(40, dtype=np.float64)
+    values = np.column_stack([times, -times])
+    for timestamp, sample in zip(times, values):
+        stats.add(timestamp, sample)
+
+    rebuilt = stats.resized({'short': 10, 'long': 50}, capacity=8)
+    assert (rebuilt.count, rebuilt.capacity) == (8, 8)
+    assert_matches(rebuilt, times[-8:], values[-8:], 8)
+
+    with pytest.raises(ValueError):
+        RollingWindowStats(CHANNELS, WINDOWS, capacity=0)
@@ -0,0 +1,85 @@
+import threading
+
+import pytest
+
+from scheduler import CollectorScheduler
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def make_scheduler():
+    clock = FakeClock()
+    return CollectorScheduler(clock=clock), clock
+
+
+def test_fixed_rate_does_not_drift_with_work_time():
+    scheduler, clock = make_scheduler()
+    run_times = []
+
+    def collect():
+        run_times.append(clock.now)
+        clock.now += 0.3  # 작업 시간
+
+    scheduler.add('sensor', collect, 1.0)
+    for now in (0.0, 1.0, 2.0, 3.0):
+        clock.now = now
+        assert scheduler.run_pending() == pytest.approx(0.7)
+    assert run_times == [0.0, 1.0, 2.0, 3.0]
+    stats = scheduler.stats()['sensor']
+    assert (stats['runs'], stats['missed'], stats['max_lag_ms']) == (4, 0, 0.0)
+    assert stats['avg_duration_ms'] == pytest.approx(300.0)
+
+
+def test_late_run_skips_missed_periods():
+    scheduler, clock = make_scheduler()
+    runs = []
+    scheduler.add('load', lambda: runs.append(clock.now), 1.0)
+    scheduler.run_pending()
+
+    # 2.5주기 늦음 - 밀린 실행을 몰아서 하지 않고 한 번만 실행한 뒤 다음 예정 시각으로
+    clock.now = 3.5
+    assert scheduler.run_pending() == pytest.approx(0.5)
+    assert runs == [0.0, 3.5]
+    stats = scheduler.stats()['load']
+    assert (stats['runs'], stats['missed'], stats['max_lag_ms']) == (2, 2, 2500.0)
+
+
+def test_interval_change_remove_and_errors():
+    scheduler, clock = make_scheduler()
+    runs = []
+    scheduler.add('fast', lambda: runs.append(('fast', clock.now)), 5.0)
+    scheduler.add('broken', lambda: 1 / 0, 2.0, start_delay=1.0)
+    scheduler.run_pending()
+
+    # 주기를 줄이면 다음 예정 시각이 바로 앞당겨짐 (0 + 1)
+    scheduler.set_interval('fast', 1.0)
+    clock.now = 1.0
+    scheduler.run_pending()
+    assert runs == [('fast', 0.0), ('fast', 1.0)]
+    assert scheduler.stats()['broken']['errors'] == 1
+
+    scheduler.remove('fast')
+    clock.now = 10.0
+    scheduler.run_pending()
+    assert runs == [('fast', 0.0), ('fast', 1.0)]
+    assert list(scheduler.stats()) == ['broken']
+    with pytest.raises(ValueError):
+        scheduler.add('bad', lambda: None, 0)
+
+
+def test_run_stops_from_another_thread():
+    scheduler = CollectorScheduler()
+    ran = threading.Event()
+    scheduler.add('sensor', ran.set, 0.01)
+    thread = threading.Thread(target=scheduler.run)
+    thread.start()
+    assert ran.wait(2.0)
+    scheduler.stop()
+    thread.join(2.0)
+    assert not thread.is_alive() and not scheduler.running
@@ -0,0 +1,96 @@
+import threading
+import time
+
+import pytest
+
+from sensor_registry import SensorRegistry
+
+
+@pytest.fixture
+def registry():
+    registry = SensorRegistry(max_workers=1, timeout=0.3)
+    yield registry
+    registry.shutdown()
+
+
+class CountingSensor:
+    def __init__(self, value, gate=None):
+        self.value = value
+        self.gate = gate  # 설정하면 이벤트가 열릴 때까지 읽기가 멈춤
+        self.reads = 0
+
+    def __call__(self):
+        self.reads += 1
+        if self.gate is not None:
+            self.gate.wait(5.0)
+        return {'value': self.value}
+
+
+def wait_until(condition, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline
+        time.sleep(0.01)
+
+
+def test_poll_all_returns_tagged_records(registry):
+    for source_id in ('a', 'b', 'c'):
+        registry.register(source_id, CountingSensor(source_id))
+    records = registry.poll_all()
+    assert sorted(source_id for source_id, _, _ in records) == ['a', 'b', 'c']
+    assert [timestamp for _, timestamp, _ in records] == sorted(timestamp for _, timestamp, _ in records)
+    assert all(values == {'value': source_id} for source_id, _, values in records)
+    assert registry.health()['summary'] == {'ok': 3, 'degraded': 0, 'down': 0}
+    with pytest.raises(ValueError):
+        registry.register('a', CountingSensor('again'))
+
+
+def test_deadline_includes_queue_wait(registry):
+    # 작업자 1개 - 느린 소스가 작업자를 잡고 있는 동안 나머지는 풀에서 기다리다 마감을 넘김
+    gate = threading.Event()
+    slow = CountingSensor('slow', gate)
+    fast = [CountingSensor('a'), CountingSensor('b')]
+    registry.register('slow', slow)
+    registry.register('a', fast[0])
+    registry.register('b', fast[1])
+
+    started = time.perf_counter()
+    assert registry.poll_all() == []
+    assert time.perf_counter() - started < 1.0
+    health = registry.health()['sources']
+    assert [health[source_id]['timeouts'] for source_id in ('slow', 'a', 'b')] == [1, 1, 1]
+
+    # 이전 읽기가 끝나지 않은(풀에서 기다리는 것 포함) 소스는 다시 넣지 않음
+    registry.poll_all()
+    health = registry.health()['sources']
+    assert [health[source_id]['skipped'] for source_id in ('slow', 'a', 'b')] == [1, 1, 1]
+
+    gate.set()
+    wait_until(lambda: not any(source.in_flight for source in registry.sources.values()))
+    # 마감이 지난 뒤 차례가 온 소스는 읽지도 않음
+    assert [sensor.reads for sensor in fast] == [0, 0]
+
+    records = registry.poll_all()
+    assert sorted(source_id for source_id, _, _ in records) == ['a', 'b', 'slow']
+    health = registry.health()
+    assert health['summary']['ok'] == 3
+    assert health['sources']['slow']['last_error'] == 'timeout (0.3초)'
+    assert [health['sources'][source_id]['polls'] for source_id in ('slow', 'a', 'b')] == [2, 1, 1]
+
+
+def test_consecutive_errors_mark_source_down(registry):
+    failures = iter([True, True, True, False])
+
+    def flaky():
+        if next(failures):
+            raise OSError('bus error')
+        return {'value': 1}
+
+    registry.register('flaky', flaky)
+    statuses = []
+    for _ in range(4):
+        registry.poll_all()
+        statuses.append(registry.health()['sources']['flaky']['status'])
+    assert statuses == ['degraded', 'degraded', 'down', 'ok']
+    health = registry.health()['sources']['flaky']
+    assert (health['errors'], health['last_error']) == (3, 'OSError: bus error')
@@ -0,0 +1,88 @@
+import pytest
+
+from telemetry_bus import KIND_LOAD, KIND_SENSOR, TelemetryBus
+
+
+@pytest.fixture
+def bus():
+    bus = TelemetryBus(producers=2, capacity=8)
+    yield bus
+    bus.close()
+    bus.unlink()
+
+
+def write_many(writer, first, count):
+    for number in range(first, first + count):
+        writer.write(KIND_SENSOR, [number, -number], timestamp=float(number))
+
+
+class WrapDuringCopy:
+    """쓰기 카운터를 감싸서 소비자가 복사 후 카운터를 다시 읽는 순간 생산자가 extra개를 더 쓰게 함"""
+
+    def __init__(self, write_seqs, writer, extra):
+        self.write_seqs = write_seqs
+        self.writer = writer
+        self.extra = extra
+        self.reads = 0
+
+    def __getitem__(self, producer):
+        self.reads += 1
+        if self.reads == 2:
+            write_many(self.writer, 100, self.extra)
+        return self.write_seqs[producer]
+
+    def __setitem__(self, producer, value):
+        self.write_seqs[producer] = value
+
+
+def test_poll_returns_records_in_order(bus):
+    reader = bus.reader()
+    write_many(bus.writer(0), 0, 5)
+    bus.writer(1).write(KIND_LOAD, [12.5, 40.0, 3.2], timestamp=1.0)
+
+    batches = reader.poll()
+    assert [batch['time'].tolist() for batch in batches] == [[0.0, 1.0, 2.0, 3.0, 4.0], [1.0]]
+    assert batches[0]['values'][:, :2].tolist()[4] == [4.0, -4.0]
+    assert batches[1]['kind'].tolist() == [KIND_LOAD]
+    assert reader.poll() == []
+    assert reader.stats() == {'received': 6, 'dropped': 0, 'pending': 0}
+
+
+def test_held_batch_survives_wrap(bus):
+    reader = bus.reader()
+    writer = bus.writer(0)
+    write_many(writer, 0, 6)
+    held = reader.poll()[0]
+
+    # 소비자가 배열을 들고 있는 동안 생산자가 링을 한 바퀴 넘게 돎
+    write_many(writer, 6, 20)
+    assert held['time'].tolist() == [0.0, 1.0, 2.0, 3.0, 4.0, 5.0]
+
+    batch = reader.poll()[0]
+    assert batch['seq'].tolist() == list(range(18, 26))
+    assert reader.stats()['dropped'] == 12
+
+
+def test_records_overwritten_during_copy_are_dropped(bus):
+    reader = bus.reader()
+    writer = bus.writer(0)
+    write_many(writer, 0, 8)
+    bus.write_seqs = WrapDuringCopy(bus.write_seqs, writer, extra=3)
+
+    # 복사한 뒤 3개가 더 쓰임 - 복사본의 0~2번은 이미 덮어써졌으므로 버림
+    batch = reader.poll()[0]
+    assert batch['seq'].tolist() == [3, 4, 5, 6, 7]
+    assert batch['time'].tolist() == [3.0, 4.0, 5.0, 6.0, 7.0]
+    stats = reader.stats()
+    assert (stats['received'], stats['dropped']) == (5, 3)
+    assert reader.poll()[0]['seq'].tolist() == [8, 9, 10]
+
+
+def test_record_being_written_is_dropped(bus):
+    reader = bus.reader()
+    write_many(bus.writer(0), 0, 4)
+    # 생산자가 다음 바퀴의 레코드를 쓰기 시작해서 seq만 바뀌고 카운터는 아직 그대로인 상태
+    bus.rings[0][1]['seq'] = 9
+
+    assert reader.poll()[0]['seq'].tolist() == [0, 2, 3]
+    assert reader.stats()['dropped'] == 1
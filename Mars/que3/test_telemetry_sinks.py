@@ -0,0 +1,86 @@
+import io
+import json
+import socket
+import threading
+
+import pytest
+
+from telemetry_sinks import (RECORD_HEADER, BinarySink, JsonLinesSink, build_sinks, encode_record,
+                             iter_binary_records)
+from timeseries_store import DEFAULT_CHANNELS
+
+SENSOR = dict(zip(DEFAULT_CHANNELS, [21.5, 48.0, 910.25, 433.0, 0.0412, 5.5]))
+RECORDS = [
+    ('sensor', 1700000000.25, SENSOR),
+    ('load', 1700000001.0, {'cpu_percent': 12.5, 'memory_percent': 40.0}),
+    ('alert', 1700000002.0, {'rule': '고온', 'state': 'firing', 'severity': 'warning', 'message': '온도 초과'}),
+    ('custom', 1700000003.0, [1, 'two', None]),  # 모르는 종류는 종류 이름과 함께 JSON으로
+    ('sensor', 1700000004.0, {'temperature': 1.0}),  # 채널이 모자란 센서 데이터도 JSON으로
+]
+
+
+def test_encode_round_trip():
+    stream = io.BytesIO(b''.join(encode_record(*record) for record in RECORDS))
+    assert list(iter_binary_records(stream)) == RECORDS
+    # 완전한 센서 샘플은 고정 크기 float64 레코드
+    assert len(encode_record(*RECORDS[0])) == RECORD_HEADER.size + 8 * len(DEFAULT_CHANNELS)
+
+
+def test_truncated_last_record_is_ignored():
+    data = b''.join(encode_record(*record) for record in RECORDS[:2])
+    assert list(iter_binary_records(io.BytesIO(data[:-3]))) == RECORDS[:1]
+
+
+def test_file_sinks_round_trip(tmp_path):
+    binary_path = tmp_path / 'telemetry.bin'
+    jsonl_path = tmp_path / 'telemetry.jsonl'
+    sinks = build_sinks([{'type': 'binary', 'path': str(binary_path)}, {'type': 'jsonl', 'path': str(jsonl_path)}])
+    for record in RECORDS:
+        for sink in sinks:
+            sink.emit(*record)
+    for sink in sinks:
+        sink.close()
+
+    with open(binary_path, 'rb') as file:
+        assert list(iter_binary_records(file)) == RECORDS
+    lines = [json.loads(line) for line in jsonl_path.read_text(encoding='utf-8').splitlines()]
+    assert [(line['kind'], line['time'], line['data']) for line in lines] == RECORDS
+
+
+def test_socket_sink_round_trip(tmp_path):
+    socket_path = str(tmp_path / 'telemetry.sock')
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    server.bind(socket_path)
+    server.listen(1)
+    received = []
+
+    def accept():
+        connection, _ = server.accept()
+        with connection, connection.makefile('rb') as stream:
+            received.extend(iter_binary_records(stream))
+
+    thread = threading.Thread(target=accept)
+    thread.start()
+    sink = BinarySink(socket_path=socket_path, buffer_bytes=64)  # 작은 버퍼 - 여러 번 나눠 보냄
+    for record in RECORDS:
+        sink.emit(*record)
+    sink.close()
+    thread.join(2.0)
+    server.close()
+    assert received == RECORDS
+
+
+def test_build_sinks_closes_opened_sinks_on_error(tmp_path, monkeypatch):
+    opened = []
+    original_init = JsonLinesSink.__init__
+
+    def tracking_init(self, path, *args, **kwargs):
+        original_init(self, path, *args, **kwargs)
+        opened.append(self)
+
+    monkeypatch.setattr(JsonLinesSink, '__init__', tracking_init)
+    with pytest.raises(ValueError):
+        build_sinks([{'type': 'jsonl', 'path': str(tmp_path / 'a.jsonl')}, {'type': 'carrier-pigeon'}])
+    assert len(opened) == 1 and opened[0].file.closed
+    with pytest.raises(ValueError):
+        BinarySink()
@@ -0,0 +1,97 @@
+import numpy as np
+import pytest
+
+from timeseries_store import DEFAULT_CHANNELS, TimeSeriesStore, import_sensor_log
+
+START = 1_700_000_000.0
+
+
+def sample_data(count, seed=5):
+    rng = np.random.default_rng(seed)
+    times = START + np.cumsum(rng.integers(1, 2000, size=count)) / 1000.0
+    values = rng.normal([20, 50, 900, 400, 0.04, 5], [5, 10, 30, 50, 0.01, 2], size=(count, 6))
+    return times, values
+
+
+def test_round_trip_and_reopen(tmp_path):
+    directory = str(tmp_path / 'store')
+    times, values = sample_data(1000)
+    store = TimeSeriesStore(directory, block_samples=128, block_seconds=600)
+    store.append_many(times[:700], values[:700])
+    for timestamp, sample in zip(times[700:], values[700:]):
+        store.append(timestamp, sample)
+    store.close()
+
+    reopened = TimeSeriesStore(directory)
+    info = reopened.info()
+    assert info['samples'] == 1000 and info['blocks'] >= 8
+    assert (info['first'], info['last']) == (times[0], times[-1])
+
+    result_times, columns = reopened.query()
+    assert result_times.tolist() == (np.round(times * 1000) / 1000).tolist()
+    # 채널별 자릿수로 양자화되어 저장됨
+    for column, (channel, digits) in enumerate(zip(DEFAULT_CHANNELS, [2, 2, 2, 2, 4, 2])):
+        assert np.allclose(columns[channel], values[:, column], rtol=1e-6, atol=0.5 * 10 ** -digits)
+
+
+def test_query_range_and_downsample(tmp_path):
+    store = TimeSeriesStore(str(tmp_path / 'store'), channels=['value'], block_samples=50, block_seconds=60)
+    times = START + np.arange(600) * 0.5
+    values = np.arange(600, dtype=np.float32).reshape(-1, 1)
+    store.append_many(times[:550], values[:550])
+    store.flush()
+    store.append_many(times[550:], values[550:])  # 일부는 아직 블록으로 쓰지 않은 상태로 조회
+
+    result_times, columns = store.query(START + 10, START + 290.5)
+    assert result_times[[0, -1]].tolist() == [START + 10, START + 290.5]
+    assert columns['value'].tolist() == list(range(20, 582))
+
+    buckets = store.downsample(START, START + 299.5, 30)
+    assert buckets['count'].tolist() == [60] * 10
+    assert buckets['time'].tolist() == [START + 30 * i for i in range(10)]
+    assert buckets['value']['mean'].tolist() == [60 * i + 29.5 for i in range(10)]
+    assert (buckets['value']['min'][3], buckets['value']['max'][3]) == (180, 239)
+
+    empty_times, empty = store.query(START - 100, START - 50)
+    assert len(empty_times) == 0 and len(empty['value']) == 0
+    with pytest.raises(ValueError):
+        store.downsample(None, None, 0)
+
+
+def test_clock_step_back_is_clamped(tmp_path):
+    store = TimeSeriesStore(str(tmp_path / 'store'), channels=['value'])
+    store.append(START + 10, [1])
+    store.append(START + 5, [2])  # NTP 보정으로 시계가 뒤로 감
+    store.append_many([START + 11, START + 9, START + 12], [[3], [4], [5]])
+    store.close()
+
+    result_times, columns = store.query()
+    assert result_times.tolist() == [START + 10, START + 10, START + 11, START + 11, START + 12]
+    assert columns['value'].tolist() == [1, 2, 3, 4, 5]
+    assert store.info()['clamped'] == 2
+
+
+def test_truncated_files_are_repaired_on_open(tmp_path):
+    directory = tmp_path / 'store'
+    store = TimeSeriesStore(str(directory), channels=['value'], block_samples=10)
+    store.append_many(START + np.arange(30), np.arange(30).reshape(-1, 1))
+    store.close()
+
+    # 마지막 블록을 쓰다가 끊긴 상태 - 색인에 있는 블록의 데이터 일부가 없음
+    data_file = directory / 'blocks.dat'
+    data_file.write_bytes(data_file.read_bytes()[:-5])
+    reopened = TimeSeriesStore(str(directory))
+    assert reopened.info()['samples'] == 20
+    assert reopened.query()[1]['value'].tolist() == list(range(20))
+
+
+def test_import_sensor_log_skips_old_and_invalid_lines(tmp_path):
+    log = tmp_path / 'sensor_log.txt'
+    log.write_text('2024-01-01 00:00:02,1,2,3,4,0.05,6\n'
+                   '2024-01-01 00:00:01,1,2,3,4,0.05,5\n'
+                   'broken line\n'
+                   '2024-01-01 00:00:03,1,2,3,x,0.05,6\n', encoding='utf-8')
+    store = TimeSeriesStore(str(tmp_path / 'store'))
+    assert import_sensor_log(str(log), store) == {'imported': 2, 'skipped': 0, 'invalid': 2}
+    # 다시 가져오면 마지막 샘플 이전 줄은 건너뜀 (같은 시각은 다시 들어감)
+    assert import_sensor_log(str(log), store)['skipped'] == 1
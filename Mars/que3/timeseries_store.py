@@ -0,0 +1,411 @@
+import datetime
+import json
+import os
+import sys
+import zlib
+
+import numpy as np
+
+# 기본 저장 채널 (DummySensor.env_values 순서)
+DEFAULT_CHANNELS = [
+    'mars_base_internal_temperature',
+    'mars_base_external_temperature',
+    'mars_base_internal_humidity',
+    'mars_base_external_illuminance',
+    'mars_base_internal_co2',
+    'mars_base_internal_oxygen'
+]
+
+# 채널별 저장 소수 자릿수 (DummySensor의 반올림 자릿수) - None이면 float32 그대로 저장
+DEFAULT_DECIMALS = [2, 2, 2, 2, 4, 2]
+
+STORE_VERSION = 1
+META_FILE = 'meta.json'
+DATA_FILE = 'blocks.dat'
+INDEX_FILE = 'index.dat'
+
+# 블록 하나의 최대 샘플 수와 시간 구간(초) - 블록은 구간 경계(정시 등)를 넘지 않음
+BLOCK_SAMPLES = 4096
+BLOCK_SECONDS = 3600
+
+# 블록 색인 레코드: 시작/끝 시각(ms), 샘플 수, 데이터 파일 내 위치와 길이
+INDEX_DTYPE = np.dtype([
+    ('start', '<i8'),
+    ('end', '<i8'),
+    ('count', '<u4'),
+    ('offset', '<u8'),
+    ('length', '<u4')
+])
+
+# 센서 로그 한 줄: "YYYY-MM-DD HH:MM:SS, 값1, ..., 값6"
+LOG_TIME_FORMAT = '%Y-%m-%d %H:%M:%S'
+IMPORT_CHUNK_LINES = 100000
+
+
+class TimeSeriesStore:
+    """센서 채널용 추가 전용(append-only) 시계열 저장소
+
+    샘플은 시간 구간별 블록으로 묶어 저장한다. 블록 안의 시각은 직전 샘플과의 차이(ms, uint32)로,
+    값은 채널별 4바이트 컬럼(decimals 자릿수로 양자화한 int32, 자릿수가 없으면 float32)으로 저장하고
+    zlib으로 압축한다. 블록마다 시작/끝 시각을 색인 파일에
+    기록하므로 범위 조회와 다운샘플링은 겹치는 블록만 읽는다.
+    시계가 뒤로 돌아가서(NTP 보정 등) 마지막 샘플보다 이른 시각이 들어오면 예외 대신 마지막 시각으로
+    맞춰 저장하고 clamped로 센다 (수집 중에 저장이 멈추지 않도록).
+    """
+
+    def __init__(self, directory, channels=None, decimals=None, block_samples=BLOCK_SAMPLES,
+                 block_seconds=BLOCK_SECONDS, compress_level=6):
+        self.directory = directory
+        self.block_samples = block_samples
+        self.block_seconds = block_seconds
+        self.compress_level = compress_level
+        os.makedirs(directory, exist_ok=True)
+
+        meta_filename = os.path.join(directory, META_FILE)
+        if os.path.exists(meta_filename):
+            with open(meta_filename, 'r', encoding='utf-8') as f:
+                meta = json.load(f)
+            if meta.get('version') != STORE_VERSION:
+                raise ValueError(f'지원하지 않는 저장소 버전입니다: {meta.get("version")}')
+            if channels is not None and list(channels) != meta['channels']:
+                raise ValueError(f'저장소 채널이 다릅니다: {meta["channels"]}')
+            self.channels = meta['channels']
+            self.decimals = meta['decimals']
+        else:
+            self.channels = list(DEFAULT_CHANNELS if channels is None else channels)
+            if decimals is None:
+                decimals = DEFAULT_DECIMALS if channels is None else [None] * len(self.channels)
+            if len(decimals) != len(self.channels):
+                raise ValueError(f'자릿수 개수가 채널 수와 다릅니다: {len(decimals)} (필요: {len(self.channels)})')
+            self.decimals = list(decimals)
+            with open(meta_filename, 'w', encoding='utf-8') as f:
+                json.dump({'version': STORE_VERSION, 'channels': self.channels, 'decimals': self.decimals},
+                          f, indent=2, ensure_ascii=False)
+        # 양자화 배율 (자릿수가 없는 채널은 0)
+        self.scales = np.array([0.0 if digits is None else 10.0 ** digits for digits in self.decimals])
+
+        self.data_filename = os.path.join(directory, DATA_FILE)
+        self.index_filename = os.path.join(directory, INDEX_FILE)
+        self.index = self._load_index()
+
+        # 아직 블록으로 쓰지 않은 샘플 (시각 ms, 값 목록)
+        self.pending_times = []
+        self.pending_values = []
+        self.clamped = 0  # 마지막 샘플보다 이른 시각이라 마지막 시각으로 맞춘 샘플 수
+
+    def _load_index(self):
+        """색인 읽기 - 중간에 끊긴 마지막 레코드나 데이터가 없는 블록, 색인에 없는 꼬리 데이터는 버림"""
+        index = np.zeros(0, dtype=INDEX_DTYPE)
+        if os.path.exists(self.index_filename):
+            size = os.path.getsize(self.index_filename)
+            index = np.fromfile(self.index_filename, dtype=INDEX_DTYPE, count=size // INDEX_DTYPE.itemsize)
+
+        data_size = os.path.getsize(self.data_filename) if os.path.exists(self.data_filename) else 0
+        complete = (index['offset'] + index['length']) <= data_size
+        if not complete.all():
+            index = index[:np.argmin(complete)]
+        data_end = int(index['offset'][-1] + index['length'][-1]) if len(index) else 0
+
+        # 색인과 데이터 파일을 완성된 블록 기준으로 맞춤
+        if len(index) * INDEX_DTYPE.itemsize != (os.path.getsize(self.index_filename)
+                                                 if os.path.exists(self.index_filename) else 0):
+            index.tofile(self.index_filename)
+        if data_size != data_end:
+            with open(self.data_filename, 'ab') as f:
+                f.truncate(data_end)
+        return index
+
+    @property
+    def last_time(self):
+        """마지막 샘플 시각(ms) - 샘플이 없으면 None"""
+        if self.pending_times:
+            return self.pending_times[-1]
+        if len(self.index):
+            return int(self.index['end'][-1])
+        return None
+
+    def append(self, timestamp, values):
+        """샘플 하나 추가 - timestamp는 epoch 초, values는 채널 순서의 시퀀스 또는 채널 이름 딕셔너리"""
+        if isinstance(values, dict):
+            values = [values[channel] for channel in self.channels]
+        elif len(values) != len(self.channels):
+            raise ValueError(f'채널 수가 다릅니다: {len(values)} (필요: {len(self.channels)})')
+
+        time_ms = int(round(timestamp * 1000))
+        last_time = self.last_time
+        if last_time is not None and time_ms < last_time:
+            time_ms = last_time  # 시계가 뒤로 감 - 순서를 지키도록 마지막 시각으로 맞춤
+            self.clamped += 1
+
+        # 새 샘플이 다른 시간 구간이면 지금까지 모은 블록을 먼저 씀
+        if self.pending_times and self._partition(time_ms) != self._partition(self.pending_times[0]):
+            self.flush()
+
+        self.pending_times.append(time_ms)
+        self.pending_values.append(values)
+        if len(self.pending_times) >= self.block_samples:
+            self.flush()
+
+    def append_many(self, timestamps, values):
+        """여러 샘플 한 번에 추가 - timestamps는 (n,) epoch 초, values는 (n, 채널 수) 배열"""
+        times_ms = np.round(np.asarray(timestamps, dtype=np.float64) * 1000).astype(np.int64)
+        values = np.asarray(values, dtype=np.float32).reshape(len(times_ms), len(self.channels))
+        if len(times_ms) == 0:
+            return
+        # 앞 샘플(또는 저장된 마지막 샘플)보다 이른 시각은 그 시각으로 맞춤 - append와 같은 규칙
+        last_time = self.last_time
+        ordered = np.maximum.accumulate(times_ms)
+        if last_time is not None:
+            ordered = np.maximum(ordered, last_time)
+        clamped = int(np.count_nonzero(ordered != times_ms))
+        if clamped:
+            self.clamped += clamped
+            times_ms = ordered
+
+        # 대기 중인 샘플과 이어지는 첫 구간은 대기 목록으로, 나머지는 구간/크기별 블록으로 바로 씀
+        partitions = times_ms // (self.block_seconds * 1000)
+        boundaries = np.flatnonzero(np.diff(partitions)) + 1
+        for part_times, part_values in zip(np.split(times_ms, boundaries), np.split(values, boundaries)):
+            if self.pending_times and self._partition(self.pending_times[0]) != self._partition(part_times[0]):
+                self.flush()
+            position = 0
+            while position < len(part_times):
+                room = self.block_samples - len(self.pending_times)
+                self.pending_times.extend(part_times[position:position + room].tolist())
+                self.pending_values.extend(part_values[position:position + room])
+                position += room
+                if len(self.pending_times) >= self.block_samples:
+                    self.flush()
+
+    def _partition(self, time_ms):
+        return time_ms // (self.block_seconds * 1000)
+
+    def flush(self):
+        """대기 중인 샘플을 블록 하나로 저장 (데이터 먼저, 색인은 나중에 써서 끊겨도 일관성 유지)"""
+        if not self.pending_times:
+            return
+        times = np.asarray(self.pending_times, dtype=np.int64)
+        values = np.asarray(self.pending_values, dtype=np.float32).reshape(len(times), len(self.channels))
+
+        # 블록 내용: 직전 샘플과의 시각 차이(uint32 ms) + 채널별 4바이트 컬럼
+        deltas = np.diff(times, prepend=times[0]).astype('<u4')
+        payload = [deltas.tobytes()]
+        for column, scale in enumerate(self.scales.tolist()):
+            if scale:
+                payload.append(np.round(values[:, column].astype(np.float64) * scale).astype('<i4').tobytes())
+            else:
+                payload.append(values[:, column].astype('<f4').tobytes())
+        payload = b''.join(payload)
+        block = zlib.compress(payload, self.compress_level)
+
+        offset = int(self.index['offset'][-1] + self.index['length'][-1]) if len(self.index) else 0
+        with open(self.data_filename, 'ab') as f:
+            f.write(block)
+        record = np.array([(times[0], times[-1], len(times), offset, len(block))], dtype=INDEX_DTYPE)
+        with open(self.index_filename, 'ab') as f:
+            f.write(record.tobytes())
+        self.index = np.concatenate([self.index, record])
+
+        self.pending_times = []
+        self.pending_values = []
+
+    def _read_block(self, file, record):
+        """블록 하나를 (시각 ms 배열, (샘플 수, 채널 수) float32 배열)로 복원"""
+        file.seek(int(record['offset']))
+        payload = zlib.decompress(file.read(int(record['length'])))
+        count = int(record['count'])
+        deltas = np.frombuffer(payload, dtype='<u4', count=count)
+        times = int(record['start']) + np.cumsum(deltas, dtype=np.int64)
+        values = np.empty((count, len(self.channels)), dtype=np.float32)
+        for column, scale in enumerate(self.scales.tolist()):
+            offset = (column + 1) * count * 4
+            if scale:
+                values[:, column] = np.frombuffer(payload, dtype='<i4', count=count, offset=offset) / scale
+            else:
+                values[:, column] = np.frombuffer(payload, dtype='<f4', count=count, offset=offset)
+        return times, values
+
+    def query(self, start=None, end=None, channels=None):
+        """[start, end] 구간(epoch 초) 샘플 조회 - (시각 초 배열, {채널: float32 배열}) 반환
+
+        색인을 이진 탐색해서 구간과 겹치는 블록만 읽는다.
+        """
+        start_ms = -2 ** 62 if start is None else int(round(start * 1000))
+        end_ms = 2 ** 62 if end is None else int(round(end * 1000))
+        columns = [self.channels.index(channel) for channel in (channels or self.channels)]
+
+        # 블록 끝 시각과 시작 시각 모두 증가하므로 겹치는 블록은 연속 구간
+        first = int(np.searchsorted(self.index['end'], start_ms, side='left'))
+        last = int(np.searchsorted(self.index['start'], end_ms, side='right'))
+
+        time_parts = []
+        value_parts = []
+        if first < last:
+            with open(self.data_filename, 'rb') as f:
+                for record in self.index[first:last]:
+                    times, values = self._read_block(f, record)
+                    time_parts.append(times)
+                    value_parts.append(values[:, columns])
+        if self.pending_times:
+            time_parts.append(np.asarray(self.pending_times, dtype=np.int64))
+            value_parts.append(np.asarray(self.pending_values, dtype=np.float32)[:, columns])
+
+        if not time_parts:
+            return np.zeros(0), {self.channels[column]: np.zeros(0, dtype=np.float32) for column in columns}
+
+        times = np.concatenate(time_parts)
+        values = np.concatenate(value_parts)
+        lower = np.searchsorted(times, start_ms, side='left')
+        upper = np.searchsorted(times, end_ms, side='right')
+        times = times[lower:upper]
+        values = values[lower:upper]
+        return times / 1000.0, {self.channels[column]: values[:, i] for i, column in enumerate(columns)}
+
+    def downsample(self, start, end, bucket_seconds, channels=None):
+        """[start, end] 구간을 bucket_seconds 단위로 묶어 구간별 평균/최소/최대 계산
+
+        반환: {'time': 구간 시작 시각(초) 배열, 'count': 샘플 수, 채널: {'mean', 'min', 'max'}}
+        샘플이 없는 구간은 결과에서 빠진다.
+        """
+        if bucket_seconds <= 0:
+            raise ValueError(f'다운샘플 구간은 0보다 커야 합니다: {bucket_seconds}')
+        times, columns = self.query(start, end, channels)
+        if start is not None:
+            origin = start
+        else:
+            origin = times[0] if len(times) else 0.0
+        buckets = ((times - origin) // bucket_seconds).astype(np.int64)
+        unique_buckets, inverse, counts = np.unique(buckets, return_inverse=True, return_counts=True)
+
+        result = {'time': origin + unique_buckets * bucket_seconds, 'count': counts}
+        for channel, values in columns.items():
+            values = values.astype(np.float64)
+            sums = np.bincount(inverse, weights=values, minlength=len(unique_buckets))
+            minimums = np.full(len(unique_buckets), np.inf)
+            maximums = np.full(len(unique_buckets), -np.inf)
+            np.minimum.at(minimums, inverse, values)
+            np.maximum.at(maximums, inverse, values)
+            result[channel] = {'mean': sums / np.maximum(counts, 1), 'min': minimums, 'max': maximums}
+        return result
+
+    def info(self):
+        """저장소 요약 (블록 수, 샘플 수, 디스크 크기, 시각 범위)"""
+        samples = int(self.index['count'].sum()) + len(self.pending_times)
+        data_size = int(self.index['offset'][-1] + self.index['length'][-1]) if len(self.index) else 0
+        first = int(self.index['start'][0]) if len(self.index) else (self.pending_times[0] if self.pending_times else None)
+        return {
+            'blocks': len(self.index),
+            'samples': samples,
+            'bytes': data_size + len(self.index) * INDEX_DTYPE.itemsize,
+            'bytes_per_sample': round(data_size / samples, 2) if samples else 0.0,
+            'first': None if first is None else first / 1000.0,
+            'last': None if self.last_time is None else self.last_time / 1000.0,
+            'clamped': self.clamped
+        }
+
+    def close(self):
+        self.flush()
+
+
+def parse_log_lines(lines, channel_count=len(DEFAULT_CHANNELS)):
+    """센서 로그 줄 목록을 (epoch 초 배열, (n, 채널 수) 배열, 잘못된 줄 수)로 변환"""
+    timestamps = []
+    rows = []
+    invalid = 0
+    # 같은 초에 찍힌 줄이 많으므로 시각 문자열 변환 결과를 재사용
+    time_cache = {}
+    for line in lines:
+        fields = line.split(',')
+        if len(fields) != channel_count + 1:
+            if line.strip():
+                invalid += 1
+            continue
+        try:
+            time_text = fields[0].strip()
+            timestamp = time_cache.get(time_text)
+            if timestamp is None:
+                timestamp = datetime.datetime.strptime(time_text, LOG_TIME_FORMAT).timestamp()
+                time_cache[time_text] = timestamp
+            rows.append([float(value) for value in fields[1:]])
+        except ValueError:
+            invalid += 1
+            continue
+        timestamps.append(timestamp)
+    return np.asarray(timestamps, dtype=np.float64), np.asarray(rows, dtype=np.float32), invalid
+
+
+def import_sensor_log(log_filename, store, chunk_lines=IMPORT_CHUNK_LINES):
+    """sensor_log.txt 형식 파일을 저장소로 가져오기 - 저장소의 마지막 샘플 이전 줄은 건너뜀"""
+    imported = 0
+    skipped = 0
+    invalid = 0
+    with open(log_filename, 'r', encoding='utf-8') as f:
+        while True:
+            lines = f.readlines(chunk_lines * 64)
+            if not lines:
+                break
+            timestamps, values, bad = parse_log_lines(lines, len(store.channels))
+            invalid += bad
+
+            # 로그는 보통 시간순이지만, 여러 번 실행하며 섞인 경우를 위해 청크 안에서 정렬
+            order = np.argsort(timestamps, kind='stable')
+            timestamps = timestamps[order]
+            values = values[order] if len(values) else values.reshape(0, len(store.channels))
+
+            last_time = store.last_time
+            if last_time is not None:
+                keep = np.round(timestamps * 1000) >= last_time
+                skipped += int(len(keep) - keep.sum())
+                timestamps = timestamps[keep]
+                values = values[keep]
+            store.append_many(timestamps, values)
+            imported += len(timestamps)
+    store.flush()
+    return {'imported': imported, 'skipped': skipped, 'invalid': invalid}
+
+
+def main():
+    if len(sys.argv) < 3 or sys.argv[1] not in ('import', 'query', 'info'):
+        print('사용법: python timeseries_store.py import <sensor_log.txt> [저장소 폴더]')
+        print('        python timeseries_store.py query <저장소 폴더> <채널> [최근 시간(시간)] [묶음 초]')
+        print('        python timeseries_store.py info <저장소 폴더>')
+        return
+
+    command = sys.argv[1]
+    if command == 'import':
+        log_filename = sys.argv[2]
+        directory = sys.argv[3] if len(sys.argv) > 3 else 'sensor_history'
+        if not os.path.exists(log_filename):
+            print(f'파일 {log_filename}을 찾을 수 없습니다.')
+            return
+        store = TimeSeriesStore(directory)
+        result = import_sensor_log(log_filename, store)
+        print(f'가져오기 완료: {result["imported"]}줄, 건너뜀 {result["skipped"]}줄, 잘못된 줄 {result["invalid"]}줄')
+        print(json.dumps(store.info(), indent=2, ensure_ascii=False))
+        return
+
+    store = TimeSeriesStore(sys.argv[2])
+    if command == 'info':
+        print(json.dumps(store.info(), indent=2, ensure_ascii=False))
+        return
+
+    if len(sys.argv) < 4 or sys.argv[3] not in store.channels:
+        print(f'채널을 지정하세요: {", ".join(store.channels)}')
+        return
+    channel = sys.argv[3]
+    hours = float(sys.argv[4]) if len(sys.argv) > 4 else 6.0
+    bucket_seconds = float(sys.argv[5]) if len(sys.argv) > 5 else 300.0
+    last_time = store.last_time
+    if last_time is None:
+        print('저장된 샘플이 없습니다.')
+        return
+    end = last_time / 1000.0
+    result = store.downsample(end - hours * 3600, end, bucket_seconds, [channel])
+    for bucket_time, count, mean, minimum, maximum in zip(result['time'], result['count'], result[channel]['mean'],
+                                                          result[channel]['min'], result[channel]['max']):
+        label = datetime.datetime.fromtimestamp(bucket_time).strftime(LOG_TIME_FORMAT)
+        print(f'{label}  n={count:<5} 평균 {mean:10.4f}  최소 {minimum:10.4f}  최대 {maximum:10.4f}')
+
+
+if __name__ == '__main__':
+    main()